@@ -0,0 +1,70 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:38
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeEvent",
+            fields=[
+                (
+                    "seq",
+                    models.BigAutoField(
+                        help_text="Position of the change in the feed.",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("minute", "Minute"),
+                            ("approval", "Approval"),
+                            ("notification", "Notification"),
+                        ],
+                        help_text="Kind of the changed object.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.BigIntegerField(help_text="Id of the changed object."),
+                ),
+                (
+                    "minute_id",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="The minute the changed object belongs to; visible to its creator and participants.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "user_id",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="A user the change is visible to in any case: the recipient of a notification, the creator or a participant of a deleted minute.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Timestamp of the change.",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Change Event",
+                "verbose_name_plural": "Change Events",
+            },
+        ),
+    ]
@@ -1,3 +1,108 @@
-from django.db import models
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-# Create your models here.
+from django.db import models, transaction
+from django.utils.timezone import now
+
+# Key of the PostgreSQL advisory lock serializing change feed writers (see ChangeEvent.record)
+CHANGE_FEED_LOCK = 0x63686733
+
+# The entries collected by the innermost ChangeEvent.batched() block, if any
+_batch = ContextVar('change_feed_batch', default=None)
+
+
+class ChangeEvent(models.Model):
+    """
+    One entry of the change feed sync clients follow (see utils.change_feed): the kind and id
+    of a minute, approval record or notification that changed, in a monotonically increasing
+    sequence. Entries carry no state; the feed reads the current state of the objects, and
+    are written in the transaction of the change they record.
+    The minute and the user are kept as plain ids to decide who may see an entry, and
+    outlive the objects themselves.
+    """
+    KIND_CHOICES = [
+        ('minute', 'Minute'),
+        ('approval', 'Approval'),
+        ('notification', 'Notification'),
+    ]
+
+    seq = models.BigAutoField(primary_key=True, help_text="Position of the change in the feed.")
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, help_text="Kind of the changed object.")
+    object_id = models.BigIntegerField(help_text="Id of the changed object.")
+    minute_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="The minute the changed object belongs to; visible to its creator and participants."
+    )
+    user_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="A user the change is visible to in any case: the recipient of a notification, "
+                  "the creator or a participant of a deleted minute."
+    )
+    created_at = models.DateTimeField(default=now, help_text="Timestamp of the change.")
+
+    class Meta:
+        verbose_name = "Change Event"
+        verbose_name_plural = "Change Events"
+
+    def __str__(self):
+        return f"#{self.seq} {self.kind} {self.object_id}"
+
+    @classmethod
+    def record(cls, kind, object_ids, minute_id=None, user_id=None):
+        """
+        Write one entry per object id in the current transaction, so the entries commit or roll
+        back with the change itself. Inside a batched() block they are written at its end instead.
+        """
+        cls.record_pairs(kind, [(object_id, minute_id) for object_id in object_ids], user_id=user_id)
+
+    @classmethod
+    def record_pairs(cls, kind, pairs, user_id=None):
+        """
+        record() for (object id, minute id) pairs, for objects of different minutes.
+        """
+        entries = dict.fromkeys((kind, object_id, minute_id, user_id) for object_id, minute_id in pairs if object_id)
+        batch = _batch.get()
+        if batch is not None:
+            batch.update(entries)
+        elif entries:
+            cls._write(entries)
+
+    @classmethod
+    @contextmanager
+    def batched(cls):
+        """
+        Collect the entries recorded in the block and write them in one insert when it ends,
+        a single entry per object. For transitions touching the same objects many times: the
+        block must run inside the transition's transaction, and is dropped when it raises.
+        """
+        if _batch.get() is not None:
+            yield
+            return
+        entries = {}
+        token = _batch.set(entries)
+        try:
+            yield
+        finally:
+            _batch.reset(token)
+        if entries:
+            cls._write(entries)
+
+    @classmethod
+    def _write(cls, entries):
+        """
+        Clients resume after the last sequence number they saw, so numbers must become visible
+        in order: on PostgreSQL writers take an advisory lock, held until the transaction ends,
+        before drawing them; SQLite serializes writers on its own.
+        """
+        connection = transaction.get_connection()
+        with transaction.atomic(using=connection.alias, savepoint=False):
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_xact_lock(%s)", [CHANGE_FEED_LOCK])
+            timestamp = now()
+            cls.objects.using(connection.alias).bulk_create([
+                cls(kind=kind, object_id=object_id, minute_id=minute_id, user_id=user_id, created_at=timestamp)
+                for kind, object_id, minute_id, user_id in entries
+            ])
@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from utils.audit_export import exportable_departments
+
 class IsAuthenticated(BasePermission):
     """
     Permission to check if the user is authenticated.
@@ -17,3 +19,11 @@ class IsOwnerOrReadOnly(BasePermission):
             return True
         # Write permissions are only allowed to the owner of the object
         return obj.created_by == request.user
+
+class CanExportAuditLog(BasePermission):
+    """
+    Permission for the audit log export: heads of department, deans, auditors and superusers.
+    """
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and exportable_departments(user).exists())
@@ -52,6 +52,28 @@ class MinuteSerializer(serializers.ModelSerializer):
         return data
 
 
+class MinuteListSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for lists of minutes: display columns and the excerpt,
+    matching Minute.for_list(). The full description comes from the detail endpoint.
+    """
+    created_by = serializers.StringRelatedField(read_only=True)
+
+    class Meta:
+        model = Minute
+        fields = [
+            'id',
+            'title',
+            'unique_id',
+            'status',
+            'excerpt',
+            'created_by',
+            'created_at',
+            'archived',
+        ]
+        read_only_fields = fields
+
+
 class MinuteApprovalSerializer(serializers.ModelSerializer):
     """
     Serializer for the MinuteApproval model.
@@ -119,7 +141,7 @@ class ApprovalChainSerializer(serializers.ModelSerializer):
     Serializer for the ApprovalChain model.
     Includes nested approvers for detailed views.
     """
-    approvers = ApproverSerializer(source='approvers', many=True, read_only=True)
+    approvers = ApproverSerializer(many=True, read_only=True)
     created_by = serializers.StringRelatedField()
 
     class Meta:
@@ -9,6 +9,9 @@ from .views import (
     ApprovalChainAPIView,
     UpdateMinuteStatusAPIView,
     SubmitMinuteAPIView,
+    AuditLogExportAPIView,
+    ChangeFeedAPIView,
+    BulkApprovalAPIView,
 )
 
 urlpatterns = [
@@ -18,7 +21,7 @@ urlpatterns = [
     path('auth/verify/', TokenVerifyView.as_view(), name='token_verify'),
 
     # Minute APIs
-    path('minute/', MinuteAPIView.as_view(), name='minute-api-create'),  # Create a new minute
+    path('minute/', MinuteAPIView.as_view(), name='minute-api-create'),  # Create a new minute, or list your own (GET)
     path('minute/<int:minute_id>/', MinuteAPIView.as_view(), name='minute-api-detail'),  # Retrieve a specific minute
 
     # Approval Chain APIs
@@ -30,6 +33,13 @@ urlpatterns = [
 
     # Update Status API
     path('minute/status/update/<int:minute_id>/', UpdateMinuteStatusAPIView.as_view(), name='minute-status-update'),  # Update minute status
+    path('minute/approvals/bulk/', BulkApprovalAPIView.as_view(), name='minute-approvals-bulk'),  # Approve or reject many at once
+
+    # Audit Export API
+    path('audit-log/', AuditLogExportAPIView.as_view(), name='audit-log-export'),  # Stream the action history (CSV/NDJSON)
+
+    # Change Feed API
+    path('changes/', ChangeFeedAPIView.as_view(), name='change-feed'),  # Changes since a cursor, for sync clients
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
 ]
@@ -8,16 +8,27 @@ from django.db.models import Max
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import CreateAPIView, RetrieveAPIView
 from django.shortcuts import get_object_or_404
+from django.http import StreamingHttpResponse
+from django.db import router
 from django.contrib.auth import get_user_model
-from django.db.models import Max
-from apps.minute.models import Minute, MinuteApproval
+from apps.minute.models import ColdMinute, Minute, MinuteActionLog, MinuteApproval
 from apps.approval_chain.models import ApprovalChain, Approver
+from .models import ChangeEvent
+from .permissions import CanExportAuditLog
+from utils.pagination import decode_cursor, keyset_paginate_merged
+from utils.tiering import minute_or_404
+from utils.audit_export import FORMATS, audit_rows, exportable_departments, export_lines, parse_time_bound
+from utils.change_feed import parse_since, read_changes
 from .serializers import (
     MinuteSerializer,
+    MinuteListSerializer,
     ApprovalChainSerializer,
     UserSerializer,
     ApproverSerializer,
 )
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -29,6 +40,7 @@ class MinuteAPIView(APIView):
     API for managing Minute creation, draft, and submission.
     """
     permission_classes = [IsAuthenticated]
+    LIST_PAGE_SIZE = 25
 
     def post(self, request, *args, **kwargs):
 
@@ -96,16 +108,33 @@ class MinuteAPIView(APIView):
 
     def get(self, request, *args, **kwargs):
         """
-        Retrieves minute details by ID.
+        Retrieves minute details by ID, or lists the user's own minutes (newest first,
+        keyset-paginated with ?cursor=) when no ID is given. Both include minutes moved to the cold tier.
         """
         minute_id = kwargs.get("minute_id")
         if not minute_id:
-            return Response({"error": "minute_id is required."}, status=status.HTTP_400_BAD_REQUEST)
+            return self._list(request)
 
-        minute = get_object_or_404(Minute, pk=minute_id)
+        minute = minute_or_404(minute_id)
         serializer = MinuteSerializer(minute)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    def _list(self, request):
+        tiers = [
+            model.for_list(model.objects.filter(created_by=request.user)).select_related("created_by")
+            for model in (Minute, ColdMinute)
+        ]
+        page = keyset_paginate_merged(
+            tiers,
+            ordering=("-created_at", "-id"),
+            cursor=request.query_params.get("cursor"),
+            per_page=self.LIST_PAGE_SIZE,
+        )
+        return Response(
+            {"results": MinuteListSerializer(page, many=True).data, "next_cursor": page.next_cursor},
+            status=status.HTTP_200_OK,
+        )
+
 
 class ApprovalChainAPIView(APIView):
     """
@@ -327,4 +356,109 @@ class UpdateMinuteStatusAPIView(APIView):
         approval.status = 'Returned'
         approval.action = 'return-to'
         approval.action_time = now()
-        approval.current_approver = False
\ No newline at end of file
+        approval.current_approver = False
+
+
+class AuditLogExportAPIView(APIView):
+    """
+    Streams the action history as CSV or NDJSON (?output=, ndjson by default; DRF keeps ?format=),
+    oldest first, for one department (?department=) or, for superusers, all of them,
+    optionally within [?since=, ?until=). Every row ends with a cursor; pass the last one
+    received as ?cursor= to resume an interrupted export. Open to heads of department and
+    deans for their departments, and to auditors and superusers for any.
+    """
+    permission_classes = [CanExportAuditLog]
+    CONTENT_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        output = params.get("output", "ndjson")
+        if output not in FORMATS:
+            return Response(
+                {"error": f"output must be one of {', '.join(FORMATS)}."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        department_id = params.get("department")
+        if department_id is not None:
+            if not department_id.isdigit():
+                return Response({"error": "department must be an id."}, status=status.HTTP_400_BAD_REQUEST)
+            department_id = int(department_id)
+            if not exportable_departments(request.user).filter(pk=department_id).exists():
+                return Response(
+                    {"error": "You cannot export this department's history."}, status=status.HTTP_403_FORBIDDEN
+                )
+        elif not request.user.is_superuser:
+            return Response({"error": "department is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            since, until = (parse_time_bound(params[name]) if params.get(name) else None for name in ("since", "until"))
+        except ValueError as error:
+            return Response({"error": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+        cursor = params.get("cursor")
+        if cursor and decode_cursor(cursor) is None:
+            return Response({"error": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # The rows are read while the response streams, after the request's database routing has
+        # been reset, so the database is chosen now
+        rows = audit_rows(
+            department_id=department_id, since=since, until=until, cursor=cursor,
+            using=router.db_for_read(MinuteActionLog),
+        )
+        response = StreamingHttpResponse(export_lines(rows, output), content_type=self.CONTENT_TYPES[output])
+        response["Content-Disposition"] = f'attachment; filename="audit_log.{output}"'
+        return response
+
+
+class ChangeFeedAPIView(APIView):
+    """
+    Incremental sync: the minutes, approval records and notifications visible to the user
+    that changed after ?since= (a cursor from a previous response; the whole feed without one),
+    oldest first, at most ?limit= per response. Each change carries the object's current fields
+    or `deleted`. Pass `next` back as ?since= until `has_more` is false.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        since = parse_since(request.query_params.get("since"))
+        if since is None:
+            return Response({"error": "Invalid cursor."}, status=status.HTTP_400_BAD_REQUEST)
+        limit = request.query_params.get("limit")
+        if limit is not None and (not limit.isdigit() or int(limit) == 0):
+            return Response({"error": "limit must be a positive number."}, status=status.HTTP_400_BAD_REQUEST)
+
+        changes, next_cursor, has_more = read_changes(
+            request.user, since, int(limit) if limit else None, using=router.db_for_read(ChangeEvent)
+        )
+        return Response({"changes": changes, "next": next_cursor, "has_more": has_more})
+
+
+class BulkApprovalAPIView(APIView):
+    """
+    Approve or reject many approval records at once. Body: {"approval_ids": [...], "action":
+    "approve" | "reject", "remarks": "..."}. Every record is decided or reported on its own:
+    the response holds one result per id, and records that cannot be decided do not stop the others.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        approval_ids = request.data.get("approval_ids")
+        action = request.data.get("action")
+        remarks = request.data.get("remarks")
+
+        if action not in MinuteApproval.BULK_ACTIONS:
+            return Response({"error": "action must be 'approve' or 'reject'."}, status=status.HTTP_400_BAD_REQUEST)
+        if (
+            not isinstance(approval_ids, list) or not approval_ids
+            or not all(isinstance(value, int) and not isinstance(value, bool) for value in approval_ids)
+        ):
+            return Response({"error": "approval_ids must be a non-empty list of ids."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(approval_ids) > MinuteApproval.BULK_MAX_ITEMS:
+            return Response(
+                {"error": f"At most {MinuteApproval.BULK_MAX_ITEMS} approvals per request."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if remarks is not None and not isinstance(remarks, str):
+            return Response({"error": "remarks must be a string."}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = MinuteApproval.bulk_decide(request.user, approval_ids, action, remarks)
+        return Response({"results": results, "decided": sum(result["ok"] for result in results)})
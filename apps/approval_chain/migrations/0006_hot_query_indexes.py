@@ -0,0 +1,22 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0005_alter_approvalchain_minute"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="approver",
+            index=models.Index(
+                fields=["approval_chain", "status", "order"],
+                name="approver_chain_status_idx",
+            ),
+        ),
+    ]
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from django.apps import apps
 from django.db import models
 from django.conf import settings
@@ -168,12 +170,30 @@ class Approver(models.Model):
     class Meta:
         unique_together = ('approval_chain', 'order')  # Ensure no duplicate orders in a chain
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['approval_chain', 'status', 'order'], name='approver_chain_status_idx'),
+        ]
         verbose_name = "Approver"
         verbose_name_plural = "Approvers"
 
     def __str__(self):
         return f"{self.user.username} - {self.approval_chain.name} (Order: {self.order})"
 
+    def save(self, *args, **kwargs):
+        """
+        Invalidate the cached fragments of the chain's minute and register a newly
+        added approver as a participant of it, if linked.
+        """
+        is_new = self.pk is None
+        super().save(*args, **kwargs)
+        Minute = apps.get_model('minute', 'Minute')
+        Minute.bump_version(approval_chain_id=self.approval_chain_id)
+        if is_new:
+            minute_id = Minute.objects.filter(approval_chain_id=self.approval_chain_id).values_list('pk', flat=True).first()
+            if minute_id:
+                MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+                MinuteParticipation.record([self.user_id], minute_id, 'approver')
+
     # Transactional Actions
     @transaction.atomic
     def approve(self):
@@ -200,12 +220,21 @@ class Approver(models.Model):
         subsequent_approvers = self.approval_chain.approvers.filter(order__gt=self.order, status='Pending')
         subsequent_approvers.update(status='Rejected', is_current=False)
 
-        # Dynamically fetch the MinuteApproval model and update their records
+        # Dynamically fetch the MinuteApproval model and update their records,
+        # moving them to the approvers' rejected counters
         MinuteApproval = apps.get_model('minute', 'MinuteApproval')
-        MinuteApproval.objects.filter(
+        ApproverCounter = apps.get_model('approver', 'ApproverCounter')
+        approvals = MinuteApproval.objects.filter(
             minute=self.approval_chain.minute,
             approver__in=subsequent_approvers.values_list('user', flat=True)
-        ).update(status='Rejected', current_approver=False)
+        )
+        shifts = Counter(
+            (approver_id, ApproverCounter.bucket_for(status, current))
+            for approver_id, status, current in approvals.values_list('approver_id', 'status', 'current_approver')
+        )
+        approvals.update(status='Rejected', current_approver=False)
+        for (approver_id, old_bucket), count in shifts.items():
+            ApproverCounter.shift(approver_id, old_bucket, 'rejected', count=count)
 
         # Mark the entire minute as rejected
         self.approval_chain.complete_chain(approved=False)
@@ -291,11 +320,16 @@ class Approver(models.Model):
         self.is_current = False
         self.save()
 
-        # Update MinuteApproval record
+        # Update MinuteApproval record through save(), which keeps the dashboard counters in step
         MinuteApproval = apps.get_model('minute', 'MinuteApproval')
-        MinuteApproval.objects.filter(minute=self.approval_chain.minute, approver=self.user).update(
-            status=status, current_approver=False, action_time=self.action_time
-        )
+        for approval in MinuteApproval.objects.filter(minute=self.approval_chain.minute, approver=self.user):
+            approval.status = status
+            approval.current_approver = False
+            approval.action_time = self.action_time
+            approval.save(update_fields=['status', 'current_approver', 'action_time', 'updated_at'])
+        if self.approval_chain.minute_id:
+            Minute = apps.get_model('minute', 'Minute')
+            Minute.clear_current_approver(self.approval_chain.minute_id, self.user_id)
 
     def _progress_to_next_approver(self):
         """
@@ -315,11 +349,14 @@ class Approver(models.Model):
         self.status = 'Pending'
         self.save()
 
-        # Update MinuteApproval record
+        # Update MinuteApproval record through save(), which keeps the dashboard counters in step
         MinuteApproval = apps.get_model('minute', 'MinuteApproval')
-        MinuteApproval.objects.filter(minute=self.approval_chain.minute, approver=self.user).update(
-            current_approver=True
-        )
+        for approval in MinuteApproval.objects.filter(minute=self.approval_chain.minute, approver=self.user):
+            approval.current_approver = True
+            approval.save(update_fields=['current_approver', 'updated_at'])
+        if self.approval_chain.minute_id:
+            Minute = apps.get_model('minute', 'Minute')
+            Minute.set_current_approver(self.approval_chain.minute_id, self.user_id)
 
     # Debugging Utility
     @classmethod
@@ -9,6 +9,9 @@ from django.views.decorators.http import require_POST
 import requests
 from .models import ApprovalChain, Approver
 from apps.minute.models import Minute
+import logging
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()  # Dynamically fetch the custom user model to support AUTH_USER_MODEL
 
@@ -94,7 +97,7 @@ def update_session_state(chain_id):
             cookies=request.COOKIES
         )
     except requests.RequestException as api_error:
-        print(f"API update failed: {api_error}")
+        logger.warning("Setting the active chain %s through the API failed: %s", chain_id, api_error)
 
 
 def build_redirect_url(chain_id, minute_id=None):
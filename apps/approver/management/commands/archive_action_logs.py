@@ -0,0 +1,44 @@
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.action_log_archive import (
+    action_log_archive_settings, add_months, ensure_partitions, export_month, export_path, exportable_months,
+    month_logs, month_start,
+)
+
+
+class Command(BaseCommand):
+    """
+    Keep the action log small: export the months older than ACTION_LOG_ARCHIVE['KEEP_MONTHS']
+    to compressed NDJSON files (read back through utils.action_log_archive.ActionLogArchive)
+    and, on PostgreSQL, create the monthly partitions of the coming months.
+    """
+    help = "Export old action log months to compressed NDJSON files and create upcoming partitions."
+
+    def add_arguments(self, parser):
+        options = action_log_archive_settings()
+        parser.add_argument(
+            '--keep-months', type=int, default=options['KEEP_MONTHS'],
+            help="Months kept in the database, the current one included."
+        )
+        parser.add_argument('--dry-run', action='store_true', help="Only list the months that would be exported.")
+
+    def handle(self, *args, **options):
+        if options['keep_months'] < 1:
+            raise CommandError("--keep-months must be at least 1.")
+
+        months = exportable_months(options['keep_months'])
+        if options['dry_run']:
+            for month in months:
+                self.stdout.write(f"{month:%Y-%m}: {month_logs(month).count()} entries would be exported.")
+            return
+
+        current = month_start(datetime.now(timezone.utc))
+        for name in ensure_partitions(current, add_months(current, action_log_archive_settings()['PRECREATE_MONTHS'])):
+            self.stdout.write(f"Created partition {name}.")
+
+        for month in months:
+            entries = export_month(month)
+            self.stdout.write(f"{month:%Y-%m}: {entries} entries in {export_path(month)}.")
+        self.stdout.write(self.style.SUCCESS(f"Exported {len(months)} months of action logs."))
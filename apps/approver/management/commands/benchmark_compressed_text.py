@@ -0,0 +1,27 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.benchmarks import compressed_text_footprint
+from utils.compressed_fields import compressed_fields
+
+
+class Command(BaseCommand):
+    """
+    Report the storage saved by the compressed text columns and what reading them costs.
+    Run `compress_text_fields` first so existing rows are compressed.
+    """
+    help = "Measure storage savings and read latency of every CompressedTextField."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help="Rows sampled per field.")
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1:
+            raise CommandError("--rows must be positive.")
+
+        results = {
+            f"{model._meta.label}.{field.name}": compressed_text_footprint(model, field, options['rows'])
+            for model, field in compressed_fields()
+        }
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,32 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.minute.models import Minute
+from utils.benchmarks import list_projection_footprint
+
+
+class Command(BaseCommand):
+    """
+    Compare the transfer and memory cost of whole minute rows and of the list projection.
+    Run against a generated archive, e.g. `generate_synthetic_data --minutes 12000`.
+    """
+    help = "Measure bytes transferred and peak memory of loading the archive with and without the list projection."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help="Archived minutes to load.")
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1:
+            raise CommandError("--rows must be positive.")
+        archived = Minute.objects.filter(archived=True).count()
+        if archived < options['rows']:
+            self.stderr.write(f"Only {archived} archived minutes present; generate more for a {options['rows']}-row run.")
+
+        results = list_projection_footprint(options['rows'])
+        full, projected = results['full'], results['list']
+        results['saved'] = {
+            'transfer': f"{1 - projected['transfer_bytes'] / max(full['transfer_bytes'], 1):.0%}",
+            'peak_memory': f"{1 - projected['peak_memory_bytes'] / max(full['peak_memory_bytes'], 1):.0%}",
+        }
+        self.stdout.write(json.dumps(results, indent=2))
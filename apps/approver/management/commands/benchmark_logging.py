@@ -0,0 +1,39 @@
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.benchmarks import logging_overhead
+from utils.structured_logging import JsonFormatter, NonBlockingQueueHandler, QueuedRotatingFileHandler
+
+
+class Command(BaseCommand):
+    """
+    Compare the request-thread cost of logging through a plain file handler and
+    through the queued handler used in LOGGING.
+    """
+    help = "Measure per-record and per-request logging overhead of the synchronous and queued handlers."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--records', type=int, default=20000)
+        parser.add_argument('--records-per-request', type=int, default=5, help="Log calls of a typical request.")
+
+    def handle(self, *args, **options):
+        if options['records'] < 1:
+            raise CommandError("--records must be positive.")
+
+        with tempfile.TemporaryDirectory() as directory:
+            synchronous = logging.FileHandler(Path(directory) / 'sync.log')
+            synchronous.setFormatter(JsonFormatter())
+            handlers = {
+                'file': synchronous,
+                'queued': QueuedRotatingFileHandler(Path(directory) / 'queued.log'),
+            }
+            results = {
+                name: logging_overhead(handler, options['records'], options['records_per_request'])
+                for name, handler in handlers.items()
+            }
+            results['queued']['dropped'] = NonBlockingQueueHandler.dropped
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from utils.benchmarks import (
+    compare_to_baseline, default_benchmark_user, load_baseline, outlier_report, run_benchmarks, save_baseline,
+)
+from utils.synthetic_data import DatasetScale, generate_dataset
+
+User = get_user_model()
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'views_baseline.json'
+
+
+class Command(BaseCommand):
+    """
+    Benchmark the main views end to end and compare them against a stored baseline.
+    """
+    help = "Measure latency percentiles, query counts, DB time and response size of the main views and API."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help="Username to benchmark as (default: the approver with the largest inbox).")
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+        parser.add_argument('--update-baseline', action='store_true', help="Store this run as the new baseline.")
+        parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed growth of timings and sizes.")
+        parser.add_argument(
+            '--seed-minutes', type=int, default=0,
+            help="Benchmark a throwaway database seeded with this many synthetic minutes instead of the current one.",
+        )
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError("--iterations must be positive.")
+
+        if not options['seed_minutes']:
+            return self.benchmark(options)
+
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            generate_dataset(
+                DatasetScale(minutes=options['seed_minutes']), seed=options['seed'], log=self.stdout.write
+            )
+            return self.benchmark(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def benchmark(self, options):
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if not user:
+                raise CommandError(f"User {options['user']} does not exist.")
+        else:
+            user = default_benchmark_user()
+            if not user:
+                raise CommandError("No approver found; pass --user or --seed-minutes.")
+
+        results = run_benchmarks(user, iterations=options['iterations'], warmup=options['warmup'])
+
+        self.stdout.write(f"Benchmarked as {user.username}, {options['iterations']} requests per view:")
+        self.stdout.write(
+            f"{'view':32} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'db ms':>8} {'queries':>8} {'bytes':>9}"
+        )
+        for name, row in results.items():
+            self.stdout.write(
+                f"{name:32} {row['status']:>6} {row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9} "
+                f"{row['db_ms']:>8} {row['queries']:>8} {row['bytes']:>9}"
+            )
+
+        outliers = outlier_report(results)
+        if outliers:
+            self.stdout.write(self.style.WARNING("Known outliers, held to their own budget:"))
+            for line in outliers:
+                self.stdout.write(f"  {line}")
+
+        if options['update_baseline']:
+            save_baseline(options['baseline'], results)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {options['baseline']}."))
+            return
+
+        baseline = load_baseline(options['baseline'])
+        if not baseline:
+            self.stdout.write(self.style.WARNING(f"No baseline at {options['baseline']}; nothing to compare."))
+            return
+
+        regressions = compare_to_baseline(results, baseline, options['tolerance'])
+        if regressions:
+            raise CommandError("Regressions against baseline:\n" + "\n".join(regressions))
+        self.stdout.write(self.style.SUCCESS("No regressions against baseline."))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.compressed_fields import compress_existing, compressed_fields
+
+
+class Command(BaseCommand):
+    """
+    Backfill compression of the CompressedTextField columns of existing rows.
+    New and changed values are compressed on save; rows written before the field
+    type changed stay plain text until this command rewrites them.
+    """
+    help = "Compress existing description and remarks text in batches; safe to interrupt and run again."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Rows rewritten per transaction.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        for model, field in compressed_fields():
+            scanned = compressed = 0
+            for batch_scanned, batch_compressed in compress_existing(model, field, options['batch_size']):
+                scanned += batch_scanned
+                compressed += batch_compressed
+            self.stdout.write(f"{model._meta.label}.{field.name}: compressed {compressed} of {scanned} rows.")
+        self.stdout.write(self.style.SUCCESS("Compression backfill finished."))
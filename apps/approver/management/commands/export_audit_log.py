@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.audit_export import FORMATS, audit_rows, export_lines, parse_time_bound
+from utils.pagination import decode_cursor
+
+
+class Command(BaseCommand):
+    """
+    Stream the action history, live, cold and exported, as CSV or NDJSON, oldest first.
+    Every row ends with a cursor; pass the last one written as --cursor to resume.
+    """
+    help = "Export the action history of a department or date range as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=FORMATS, default='ndjson', help="Output format.")
+        parser.add_argument('--department', type=int, help="Only this department's minutes.")
+        parser.add_argument('--since', help="ISO date or datetime, included.")
+        parser.add_argument('--until', help="ISO date or datetime, excluded.")
+        parser.add_argument('--cursor', help="Resume after the row carrying this cursor.")
+        parser.add_argument('--output', help="File to write; standard output by default.")
+        parser.add_argument('--chunk-size', type=int, help="Rows fetched per database round trip.")
+
+    def handle(self, *args, **options):
+        try:
+            since, until = (
+                parse_time_bound(options[name]) if options[name] else None for name in ('since', 'until')
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        if options['cursor'] and decode_cursor(options['cursor']) is None:
+            raise CommandError("Invalid --cursor.")
+        if options['chunk_size'] is not None and options['chunk_size'] < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        rows = audit_rows(
+            department_id=options['department'], since=since, until=until,
+            cursor=options['cursor'], chunk_size=options['chunk_size'],
+        )
+        lines = export_lines(rows, options['format'])
+        if options['output']:
+            with open(options['output'], 'w', newline='', encoding='utf-8') as file:
+                file.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
@@ -0,0 +1,53 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.synthetic_data import DatasetScale, generate_dataset, synthetic_data_present
+
+
+class Command(BaseCommand):
+    """
+    Bulk-generate a production-scale synthetic dataset for local benchmarking.
+    """
+    help = "Generate departments, users, approval chains, minutes, approvals, action logs and notifications."
+
+    def add_arguments(self, parser):
+        defaults = DatasetScale()
+        parser.add_argument('--minutes', type=int, default=defaults.minutes, help="Number of minutes to create.")
+        parser.add_argument('--departments', type=int, default=defaults.departments)
+        parser.add_argument('--users-per-department', type=int, default=defaults.users_per_department)
+        parser.add_argument('--max-chain-length', type=int, default=defaults.max_chain_length)
+        parser.add_argument('--attachment-ratio', type=float, default=defaults.attachment_ratio)
+        parser.add_argument('--notifications-per-minute', type=int, default=defaults.notifications_per_minute)
+        parser.add_argument('--days', type=int, default=defaults.days, help="Length of the simulated history.")
+        parser.add_argument('--seed', type=int, default=42, help="Random seed; the same seed yields the same data.")
+        parser.add_argument('--batch-size', type=int, default=2000, help="Minutes written per transaction.")
+        parser.add_argument('--password', default='password', help="Password shared by every generated user.")
+
+    def handle(self, *args, **options):
+        scale = DatasetScale(
+            minutes=options['minutes'],
+            departments=options['departments'],
+            users_per_department=options['users_per_department'],
+            max_chain_length=options['max_chain_length'],
+            attachment_ratio=options['attachment_ratio'],
+            notifications_per_minute=options['notifications_per_minute'],
+            days=options['days'],
+        )
+        if scale.departments < 1 or scale.users_per_department < 2 or scale.max_chain_length < 1:
+            raise CommandError("Need at least one department, two users per department and chains of length one.")
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be positive.")
+        if synthetic_data_present():
+            raise CommandError("Synthetic data is already present in this database; generate into an empty one.")
+
+        started = perf_counter()
+        counts = generate_dataset(
+            scale,
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            password=options['password'],
+            log=self.stdout.write,
+        )
+        summary = ", ".join(f"{value} {name.replace('_', ' ')}" for name, value in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Generated {summary} in {perf_counter() - started:.1f}s."))
@@ -0,0 +1,84 @@
+import json
+import os
+import random
+import tempfile
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from utils.load_harness import ApprovalLoad, LockWaitMonitor, plan_round, summarize, workflow_invariant_violations
+from utils.synthetic_data import DatasetScale, generate_dataset
+
+
+class Command(BaseCommand):
+    """
+    Hammer the approval endpoints from many simulated approvers at once and check the
+    workflow invariants afterwards.
+    """
+    help = "Concurrent approve/reject/mark-to/return-to load against process_action and the status update API."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help="Concurrent threads.")
+        parser.add_argument('--rounds', type=int, default=3, help="Each round acts on the minutes waiting at that moment.")
+        parser.add_argument('--minutes-per-round', type=int, default=50)
+        parser.add_argument('--duplicates', type=int, default=2, help="Concurrent copies of every request.")
+        parser.add_argument('--endpoint', choices=['view', 'api', 'both'], default='both')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument(
+            '--seed-minutes', type=int, default=0,
+            help="Run against a throwaway database seeded with this many synthetic minutes instead of the current one.",
+        )
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1 or options['duplicates'] < 1 or options['rounds'] < 1:
+            raise CommandError("--workers, --duplicates and --rounds must be positive.")
+
+        if not options['seed_minutes']:
+            return self.load(options)
+
+        # Worker threads open their own connections, so SQLite needs a file rather than a memory database
+        test_settings = connection.settings_dict.setdefault('TEST', {})
+        if connection.vendor == 'sqlite' and not test_settings.get('NAME'):
+            handle, test_settings['NAME'] = tempfile.mkstemp(suffix='.sqlite3')
+            os.close(handle)
+
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            generate_dataset(DatasetScale(minutes=options['seed_minutes']), seed=options['seed'], log=self.stdout.write)
+            return self.load(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def load(self, options):
+        rng = random.Random(options['seed'])
+        endpoints = ('view', 'api') if options['endpoint'] == 'both' else (options['endpoint'],)
+        load = ApprovalLoad(endpoints)
+
+        monitor = LockWaitMonitor() if connection.vendor == 'postgresql' else None
+        if monitor:
+            monitor.start()
+
+        outcomes = []
+        elapsed = 0.0
+        try:
+            for round_number in range(1, options['rounds'] + 1):
+                tasks = plan_round(rng, options['minutes_per_round'])
+                if not tasks:
+                    self.stdout.write("No minutes are waiting on an approver; stopping.")
+                    break
+                started = perf_counter()
+                outcomes += load.run(tasks, workers=options['workers'], duplicates=options['duplicates'])
+                elapsed += perf_counter() - started
+                self.stdout.write(f"Round {round_number}: {len(tasks)} minutes, {len(tasks) * options['duplicates']} requests.")
+        finally:
+            if monitor:
+                monitor.stop()
+
+        summary = summarize(outcomes, elapsed, monitor.samples if monitor else None)
+        self.stdout.write(json.dumps(summary, indent=2))
+
+        violations = workflow_invariant_violations()
+        if violations:
+            raise CommandError("Workflow invariants violated:\n" + json.dumps(violations, indent=2))
+        self.stdout.write(self.style.SUCCESS("All workflow invariants hold."))
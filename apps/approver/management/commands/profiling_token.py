@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from utils.profiling import issue_token, profiling_settings
+
+
+class Command(BaseCommand):
+    """
+    Issue a signed token that makes the profiling middleware profile one live request.
+    """
+    help = "Print a short-lived, single-use token for the profiling request header."
+
+    def handle(self, *args, **options):
+        config = profiling_settings()
+        if not config['DIR']:
+            self.stderr.write("PROFILING['DIR'] is not set; requests will not be profiled.")
+        self.stdout.write(f"{config['HEADER']}: {issue_token()}")
+        self.stdout.write(f"Valid for one request within {config['TOKEN_MAX_AGE']} seconds; results are written to {config['DIR']}.")
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.approver.models import ApproverCounter
+
+
+class Command(BaseCommand):
+    """
+    Rebuild, or verify, the materialized approver dashboard counters.
+    """
+    help = "Rebuild the approver dashboard counters from MinuteApproval, or check them with --check."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Only compare stored counters with the live aggregate; exit with an error on mismatch.",
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            mismatches = ApproverCounter.mismatches()
+            for user_id, (stored, live) in sorted(mismatches.items()):
+                self.stdout.write(f"User {user_id}: stored={stored} live={live}")
+            if mismatches:
+                raise CommandError(f"{len(mismatches)} approver counter(s) out of sync.")
+            self.stdout.write(self.style.SUCCESS("Approver counters are consistent."))
+            return
+
+        ApproverCounter.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt approver counters for {ApproverCounter.objects.count()} users."
+        ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.approver.models import ArchiveFacetRollup, ArchiveApproverRollup
+
+
+class Command(BaseCommand):
+    """
+    Recompute the department archive facet rollups from the archived minutes.
+    """
+    help = "Rebuild the archive facet rollup tables used by the department archive."
+
+    def handle(self, *args, **options):
+        ArchiveFacetRollup.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt archive rollups: {ArchiveFacetRollup.objects.count()} facet buckets, "
+            f"{ArchiveApproverRollup.objects.count()} approver buckets."
+        ))
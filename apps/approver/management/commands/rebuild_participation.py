@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.approver.models import MinuteParticipation
+
+
+class Command(BaseCommand):
+    """
+    Recompute the per-user participation index used by the approval tracker.
+    """
+    help = "Rebuild the minute participation table from approval chains, approvals and action logs."
+
+    def handle(self, *args, **options):
+        MinuteParticipation.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt participation index: {MinuteParticipation.objects.count()} rows."
+        ))
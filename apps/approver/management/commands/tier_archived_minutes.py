@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+
+from apps.minute.models import Minute
+from utils.tiering import archive_tiering_settings, move_archived_minutes
+
+
+class Command(BaseCommand):
+    """
+    Move long-archived minutes, with their approval records and action logs, to the cold tables.
+    The live tables then only hold in-flight work and recent archives.
+    """
+    help = "Move minutes archived more than ARCHIVE_TIERING['AFTER_DAYS'] ago to the cold tier; safe to interrupt and run again."
+
+    def add_arguments(self, parser):
+        options = archive_tiering_settings()
+        parser.add_argument(
+            '--older-than-days', type=int, default=options['AFTER_DAYS'],
+            help="Move minutes archived more than this many days ago."
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=options['BATCH_SIZE'], help="Minutes moved per transaction."
+        )
+        parser.add_argument('--dry-run', action='store_true', help="Only count the minutes that would move.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be positive.")
+        if options['older_than_days'] < 0:
+            raise CommandError("--older-than-days must not be negative.")
+
+        if options['dry_run']:
+            archived_before = now() - timedelta(days=options['older_than_days'])
+            count = Minute.objects.filter(archived=True, archived_at__lt=archived_before).count()
+            self.stdout.write(f"{count} archived minutes would move to the cold tier.")
+            return
+
+        moved = 0
+        for batch in move_archived_minutes(options['older_than_days'], options['batch_size']):
+            moved += batch
+            self.stdout.write(f"Moved {moved} minutes.")
+        self.stdout.write(self.style.SUCCESS(f"Moved {moved} archived minutes to the cold tier."))
@@ -0,0 +1,195 @@
+# Generated by Django 5.1.4 on 2026-10-19 11:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+
+
+def _as_date(value):
+    return value.date() if hasattr(value, "date") else value
+
+
+def backfill_rollups(apps, schema_editor):
+    """
+    Count the minutes archived before the rollups existed.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    MinuteApproval = apps.get_model("minute", "MinuteApproval")
+    ArchiveFacetRollup = apps.get_model("approver", "ArchiveFacetRollup")
+    ArchiveApproverRollup = apps.get_model("approver", "ArchiveApproverRollup")
+
+    facets = (
+        Minute.objects.filter(archived=True, archived_at__isnull=False)
+        .annotate(month=TruncMonth("archived_at"))
+        .values_list("department_id", "status", "month", "created_by_id")
+        .annotate(minutes=Count("id"))
+        .order_by()
+    )
+    ArchiveFacetRollup.objects.bulk_create(
+        [
+            ArchiveFacetRollup(
+                department_id=department_id, status=status, month=_as_date(month),
+                created_by_id=created_by_id, minutes=minutes,
+            )
+            for department_id, status, month, created_by_id, minutes in facets.iterator()
+        ],
+        batch_size=1000,
+    )
+
+    approvers = (
+        MinuteApproval.objects.filter(minute__archived=True, minute__archived_at__isnull=False)
+        .annotate(month=TruncMonth("minute__archived_at"))
+        .values_list("minute__department_id", "minute__status", "month", "approver_id")
+        .annotate(minutes=Count("minute_id", distinct=True))
+        .order_by()
+    )
+    ArchiveApproverRollup.objects.bulk_create(
+        [
+            ArchiveApproverRollup(
+                department_id=department_id, status=status, month=_as_date(month),
+                approver_id=approver_id, minutes=minutes,
+            )
+            for department_id, status, month, approver_id, minutes in approvers.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def clear_rollups(apps, schema_editor):
+    apps.get_model("approver", "ArchiveFacetRollup").objects.all().delete()
+    apps.get_model("approver", "ArchiveApproverRollup").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("departments", "0003_department_dean"),
+        ("minute", "0011_minute_archived_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchiveApproverRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        help_text="Final status of the archived minutes (Approved/Rejected).",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="First day of the month the minutes were archived in."
+                    ),
+                ),
+                (
+                    "minutes",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of archived minutes in this bucket.",
+                    ),
+                ),
+                (
+                    "approver",
+                    models.ForeignKey(
+                        help_text="Approver who took part in the archived minutes.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archive_approver_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Department of the archived minutes.",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archive_approver_rollups",
+                        to="departments.department",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archive Approver Rollup",
+                "verbose_name_plural": "Archive Approver Rollups",
+                "unique_together": {("department", "status", "month", "approver")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchiveFacetRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        help_text="Final status of the archived minutes (Approved/Rejected).",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="First day of the month the minutes were archived in."
+                    ),
+                ),
+                (
+                    "minutes",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of archived minutes in this bucket.",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        help_text="Creator of the archived minutes.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archive_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Department of the archived minutes.",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archive_rollups",
+                        to="departments.department",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archive Facet Rollup",
+                "verbose_name_plural": "Archive Facet Rollups",
+                "unique_together": {("department", "status", "month", "created_by")},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, clear_rollups),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:02
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+
+BACKFILL_CHUNK_SIZE = 2000
+
+
+def backfill_participation(apps, schema_editor):
+    """
+    Index the chains, approvals and actions of the existing minutes, a chunk of minutes at a time.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    MinuteApproval = apps.get_model("minute", "MinuteApproval")
+    MinuteActionLog = apps.get_model("minute", "MinuteActionLog")
+    Approver = apps.get_model("approval_chain", "Approver")
+    MinuteParticipation = apps.get_model("approver", "MinuteParticipation")
+
+    last_id = 0
+    while True:
+        minutes = list(
+            Minute.objects.filter(pk__gt=last_id).order_by("pk")
+            .values_list("pk", "approval_chain_id", "created_at")[:BACKFILL_CHUNK_SIZE]
+        )
+        if not minutes:
+            break
+        last_id = minutes[-1][0]
+        first_id = minutes[0][0]
+
+        rows = {}
+        actors = (
+            MinuteActionLog.objects.filter(minute_id__gte=first_id, minute_id__lte=last_id, performed_by__isnull=False)
+            .values_list("performed_by_id", "minute_id").annotate(latest=Max("timestamp")).order_by()
+        )
+        for user_id, minute_id, latest in actors:
+            rows[user_id, minute_id] = ("actor", latest)
+
+        chains = {chain_id: (minute_id, created_at) for minute_id, chain_id, created_at in minutes if chain_id}
+        members = [
+            (user_id, *chains[chain_id])
+            for user_id, chain_id in Approver.objects.filter(approval_chain_id__in=chains)
+            .values_list("user_id", "approval_chain_id")
+        ]
+        members += MinuteApproval.objects.filter(minute_id__gte=first_id, minute_id__lte=last_id).values_list(
+            "approver_id", "minute_id", "created_at"
+        )
+        for user_id, minute_id, created_at in members:
+            existing = rows.get((user_id, minute_id))
+            rows[user_id, minute_id] = ("approver", existing[1] if existing else created_at)
+
+        MinuteParticipation.objects.bulk_create([
+            MinuteParticipation(user_id=user_id, minute_id=minute_id, role=role, last_activity=last_activity)
+            for (user_id, minute_id), (role, last_activity) in rows.items()
+        ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0005_alter_approvalchain_minute"),
+        ("approver", "0001_initial"),
+        ("minute", "0011_minute_archived_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MinuteParticipation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[("approver", "Approver"), ("actor", "Actor")],
+                        help_text="How the user participates: chain approver, or only through actions.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "last_activity",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Timestamp of the user's most recent involvement with the minute.",
+                    ),
+                ),
+                (
+                    "minute",
+                    models.ForeignKey(
+                        help_text="The minute the user participates in.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participations",
+                        to="minute.minute",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The participating user.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="participations",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Minute Participation",
+                "verbose_name_plural": "Minute Participations",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-last_activity", "-id"],
+                        name="participation_user_recent_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "minute"),
+                        name="unique_participation_per_minute",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_participation, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    Start every approver's counters from their existing approval records,
+    as ApproverCounter.live_aggregate() computes them.
+    """
+    MinuteApproval = apps.get_model("minute", "MinuteApproval")
+    ApproverCounter = apps.get_model("approver", "ApproverCounter")
+    rows = MinuteApproval.objects.values("approver_id").annotate(
+        pending=Count("id", filter=Q(status="Pending", current_approver=True)),
+        approved=Count("id", filter=Q(status="Approved")),
+        rejected=Count("id", filter=Q(status="Rejected")),
+        returned=Count("id", filter=Q(status="Returned")),
+        marked=Count("id", filter=Q(status="Marked")),
+    ).order_by()
+    ApproverCounter.objects.bulk_create(
+        [ApproverCounter(user_id=row.pop("approver_id"), **row) for row in rows.iterator()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approver", "0002_minuteparticipation"),
+        ("users", "0004_remove_customuser_departments"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ApproverCounter",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        help_text="The approver these counters belong to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="approver_counter",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "pending",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Approvals waiting on this user as current approver.",
+                    ),
+                ),
+                (
+                    "approved",
+                    models.IntegerField(
+                        default=0, help_text="Approvals this user approved."
+                    ),
+                ),
+                (
+                    "rejected",
+                    models.IntegerField(
+                        default=0, help_text="Approvals this user rejected."
+                    ),
+                ),
+                (
+                    "returned",
+                    models.IntegerField(
+                        default=0, help_text="Approvals this user returned."
+                    ),
+                ),
+                (
+                    "marked",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Approvals this user marked to someone else.",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Timestamp of the last counter change."
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Approver Counter",
+                "verbose_name_plural": "Approver Counters",
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approver", "0003_approvercounter"),
+        ("minute", "0019_cold_tier"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minuteparticipation",
+            name="cold_minute",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The minute the user participated in, once it moved to the cold tier.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="participations",
+                to="minute.coldminute",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="minuteparticipation",
+            name="minute",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The minute the user participates in.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="participations",
+                to="minute.minute",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="minuteparticipation",
+            constraint=models.UniqueConstraint(
+                fields=("user", "cold_minute"),
+                name="unique_participation_per_cold_minute",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="minuteparticipation",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(("cold_minute__isnull", True), ("minute__isnull", False)),
+                    models.Q(("cold_minute__isnull", False), ("minute__isnull", True)),
+                    _connector="OR",
+                ),
+                name="participation_in_one_tier",
+            ),
+        ),
+    ]
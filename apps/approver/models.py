@@ -0,0 +1,548 @@
+from collections import Counter
+from itertools import chain
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Case, Count, F, Max, Sum, Value, When
+from django.db.models.functions import TruncMonth
+from django.conf import settings
+from django.utils.timezone import localtime, now
+
+from apps.minute.models import ColdMinute, ColdMinuteActionLog, ColdMinuteApproval, Minute, MinuteApproval, MinuteActionLog
+
+
+class ArchiveFacetRollup(models.Model):
+    """
+    Pre-aggregated count of archived minutes per (department, status, month, creator).
+    Feeds the facet counts of the department archive without scanning the minutes table.
+    """
+    department = models.ForeignKey(
+        'departments.Department',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='archive_rollups',
+        help_text="Department of the archived minutes."
+    )
+    status = models.CharField(
+        max_length=20,
+        help_text="Final status of the archived minutes (Approved/Rejected)."
+    )
+    month = models.DateField(
+        help_text="First day of the month the minutes were archived in."
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archive_rollups',
+        help_text="Creator of the archived minutes."
+    )
+    minutes = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of archived minutes in this bucket."
+    )
+
+    class Meta:
+        unique_together = ('department', 'status', 'month', 'created_by')
+        verbose_name = "Archive Facet Rollup"
+        verbose_name_plural = "Archive Facet Rollups"
+
+    def __str__(self):
+        return f"{self.department_id}/{self.status}/{self.month:%Y-%m}/{self.created_by_id}: {self.minutes}"
+
+    @classmethod
+    def record(cls, minute):
+        """
+        Count a newly archived minute in the rollups (including one row per approver).
+        """
+        cls.record_many([minute])
+
+    @classmethod
+    @transaction.atomic
+    def record_many(cls, minutes):
+        """
+        Count newly archived minutes in the rollups with a few statements per rollup table,
+        however many minutes and buckets there are.
+        """
+        months = {minute.pk: localtime(minute.archived_at).date().replace(day=1) for minute in minutes}
+        by_id = {minute.pk: minute for minute in minutes}
+        _add_to_buckets(cls, 'created_by_id', Counter(
+            (minute.department_id, minute.status, months[minute.pk], minute.created_by_id) for minute in minutes
+        ))
+        approvers = MinuteApproval.objects.filter(minute_id__in=by_id).values_list('minute_id', 'approver_id').distinct()
+        _add_to_buckets(ArchiveApproverRollup, 'approver_id', Counter(
+            (by_id[minute_id].department_id, by_id[minute_id].status, months[minute_id], approver_id)
+            for minute_id, approver_id in approvers
+        ))
+
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls):
+        """
+        Recompute both rollup tables from the archived minutes of both tiers.
+        """
+        cls.objects.all().delete()
+        ArchiveApproverRollup.objects.all().delete()
+
+        totals = Counter()
+        for model in (Minute, ColdMinute):
+            rows = (
+                model.objects.filter(archived=True, archived_at__isnull=False)
+                .annotate(month=TruncMonth('archived_at'))
+                .values_list('department_id', 'status', 'month', 'created_by_id')
+                .annotate(minutes=Count('id'))
+                .order_by()
+            )
+            for department_id, status, month, created_by_id, minutes in rows:
+                totals[department_id, status, _as_date(month), created_by_id] += minutes
+        cls.objects.bulk_create([
+            cls(department_id=department_id, status=status, month=month, created_by_id=created_by_id, minutes=minutes)
+            for (department_id, status, month, created_by_id), minutes in totals.items()
+        ], batch_size=1000)
+
+        approver_totals = Counter()
+        for model in (MinuteApproval, ColdMinuteApproval):
+            approver_rows = (
+                model.objects.filter(minute__archived=True, minute__archived_at__isnull=False)
+                .annotate(month=TruncMonth('minute__archived_at'))
+                .values_list('minute__department_id', 'minute__status', 'month', 'approver_id')
+                .annotate(minutes=Count('minute_id', distinct=True))
+                .order_by()
+            )
+            for department_id, status, month, approver_id, minutes in approver_rows:
+                approver_totals[department_id, status, _as_date(month), approver_id] += minutes
+        ArchiveApproverRollup.objects.bulk_create([
+            ArchiveApproverRollup(
+                department_id=department_id, status=status, month=month, approver_id=approver_id, minutes=minutes
+            )
+            for (department_id, status, month, approver_id), minutes in approver_totals.items()
+        ], batch_size=1000)
+
+    @classmethod
+    def facet_counts(cls, departments, selected):
+        """
+        Return per-facet value counts for the archive browser.
+
+        Each facet is counted with every *other* selected facet applied, so the
+        numbers show how many results picking that value would give. The approver
+        facet lives in its own rollup and is conditioned on department, status and
+        month only; the approver selection does not narrow the other facets.
+        """
+        scope = cls.objects.filter(department__in=departments)
+        approver_scope = ArchiveApproverRollup.objects.filter(department__in=departments)
+
+        filters = {
+            'department': ('department_id', selected.get('department')),
+            'status': ('status', selected.get('status')),
+            'month': ('month', selected.get('month')),
+            'creator': ('created_by_id', selected.get('creator')),
+        }
+
+        def narrowed(queryset, exclude, allowed):
+            for facet, (column, value) in filters.items():
+                if facet != exclude and facet in allowed and value not in (None, ''):
+                    queryset = queryset.filter(**{column: value})
+            return queryset
+
+        all_facets = ('department', 'status', 'month', 'creator')
+        approver_facets = ('department', 'status', 'month')
+
+        return {
+            'department': list(
+                narrowed(scope, 'department', all_facets)
+                .values('department_id', 'department__name')
+                .annotate(total=Sum('minutes')).order_by('department__name')
+            ),
+            'status': list(
+                narrowed(scope, 'status', all_facets)
+                .values('status').annotate(total=Sum('minutes')).order_by('status')
+            ),
+            'month': list(
+                narrowed(scope, 'month', all_facets)
+                .values('month').annotate(total=Sum('minutes')).order_by('-month')
+            ),
+            'creator': list(
+                narrowed(scope, 'creator', all_facets)
+                .values('created_by_id', 'created_by__username', 'created_by__first_name', 'created_by__last_name')
+                .annotate(total=Sum('minutes')).order_by('created_by__username')
+            ),
+            'approver': list(
+                narrowed(approver_scope, 'approver', approver_facets)
+                .values('approver_id', 'approver__username', 'approver__first_name', 'approver__last_name')
+                .annotate(total=Sum('minutes')).order_by('approver__username')
+            ),
+        }
+
+
+class ArchiveApproverRollup(models.Model):
+    """
+    Pre-aggregated count of archived minutes per (department, status, month, approver).
+    """
+    department = models.ForeignKey(
+        'departments.Department',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='archive_approver_rollups',
+        help_text="Department of the archived minutes."
+    )
+    status = models.CharField(
+        max_length=20,
+        help_text="Final status of the archived minutes (Approved/Rejected)."
+    )
+    month = models.DateField(
+        help_text="First day of the month the minutes were archived in."
+    )
+    approver = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archive_approver_rollups',
+        help_text="Approver who took part in the archived minutes."
+    )
+    minutes = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of archived minutes in this bucket."
+    )
+
+    class Meta:
+        unique_together = ('department', 'status', 'month', 'approver')
+        verbose_name = "Archive Approver Rollup"
+        verbose_name_plural = "Archive Approver Rollups"
+
+    def __str__(self):
+        return f"{self.department_id}/{self.status}/{self.month:%Y-%m}/{self.approver_id}: {self.minutes}"
+
+
+def _add_to_buckets(model, owner_field, counts):
+    """
+    Add counts to rollup buckets keyed by (department_id, status, month, <owner_field>), creating
+    the missing ones. Buckets are read locked, then written back in one bulk update.
+    """
+    if not counts:
+        return
+    fields = ('department_id', 'status', 'month', owner_field)
+
+    def locked():
+        rows = model.objects.select_for_update().filter(**{
+            'status__in': {key[1] for key in counts},
+            'month__in': {key[2] for key in counts},
+            f'{owner_field}__in': {key[3] for key in counts},
+        })
+        return {tuple(getattr(row, field) for field in fields): row for row in rows}
+
+    buckets = locked()
+    missing = [key for key in counts if key not in buckets]
+    if missing:
+        model.objects.bulk_create([model(**dict(zip(fields, key))) for key in missing], ignore_conflicts=True)
+        buckets = locked()
+    for key, count in counts.items():
+        buckets[key].minutes += count
+    model.objects.bulk_update([buckets[key] for key in counts], ['minutes'])
+
+
+def _as_date(value):
+    """
+    TruncMonth returns a datetime for DateTimeFields; rollups store plain dates.
+    """
+    return value.date() if hasattr(value, 'date') else value
+
+
+class MinuteParticipation(models.Model):
+    """
+    One row per (user, minute) the user takes part in, either as a member of the
+    approval chain or as someone who performed an action on it.
+    Maintained on chain creation and on every logged action so the approval tracker
+    is a single range scan on (user, last_activity).
+    Rows of minutes moved to the cold tier point at the cold copy instead.
+    """
+    ROLE_CHOICES = [
+        ('approver', 'Approver'),
+        ('actor', 'Actor'),
+    ]
+    REBUILD_CHUNK_SIZE = 2000  # minutes per step of rebuild()
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='participations',
+        help_text="The participating user."
+    )
+    minute = models.ForeignKey(
+        'minute.Minute',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='participations',
+        help_text="The minute the user participates in."
+    )
+    cold_minute = models.ForeignKey(
+        'minute.ColdMinute',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='participations',
+        help_text="The minute the user participated in, once it moved to the cold tier."
+    )
+    role = models.CharField(
+        max_length=20,
+        choices=ROLE_CHOICES,
+        help_text="How the user participates: chain approver, or only through actions."
+    )
+    last_activity = models.DateTimeField(
+        default=now,
+        help_text="Timestamp of the user's most recent involvement with the minute."
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'minute'], name='unique_participation_per_minute'),
+            models.UniqueConstraint(fields=['user', 'cold_minute'], name='unique_participation_per_cold_minute'),
+            models.CheckConstraint(
+                condition=(
+                    models.Q(minute__isnull=False, cold_minute__isnull=True)
+                    | models.Q(minute__isnull=True, cold_minute__isnull=False)
+                ),
+                name='participation_in_one_tier',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-last_activity', '-id'], name='participation_user_recent_idx'),
+        ]
+        verbose_name = "Minute Participation"
+        verbose_name_plural = "Minute Participations"
+
+    def __str__(self):
+        return f"{self.user_id} {self.role} on {self.minute_id or self.cold_minute_id}"
+
+    @classmethod
+    def record(cls, user_ids, minute_id, role, timestamp=None):
+        """
+        Upsert participation rows for the given users.
+        An 'approver' row is never downgraded to 'actor'; last_activity is refreshed either way.
+        """
+        if minute_id:
+            cls.record_pairs([(user_id, minute_id) for user_id in user_ids], role, timestamp)
+
+    @classmethod
+    def record_pairs(cls, pairs, role, timestamp=None):
+        """
+        Upsert participation rows for (user id, minute id) pairs in one statement, as record() does.
+        """
+        pairs = {(user_id, minute_id) for user_id, minute_id in pairs if user_id and minute_id}
+        if not pairs:
+            return
+
+        timestamp = timestamp or now()
+        cls.objects.bulk_create(
+            [cls(user_id=user_id, minute_id=minute_id, role=role, last_activity=timestamp) for user_id, minute_id in pairs],
+            update_conflicts=True,
+            unique_fields=['user', 'minute'],
+            update_fields=['role', 'last_activity'] if role == 'approver' else ['last_activity'],
+        )
+
+    @classmethod
+    def sync_chain(cls, minute):
+        """
+        Register every approver of the minute's approval chain as a participant.
+        """
+        if not minute.approval_chain_id:
+            return
+        Approver = apps.get_model('approval_chain', 'Approver')
+        cls.record(
+            Approver.objects.filter(approval_chain_id=minute.approval_chain_id).values_list('user_id', flat=True),
+            minute.pk,
+            'approver',
+        )
+
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls, chunk_size=None):
+        """
+        Recompute the participation table from approval chains, approval records and action logs,
+        of both the live and the cold tier. Minutes are taken in pk order, `chunk_size` at a time,
+        so memory stays bounded however many minutes there are.
+        """
+        chunk_size = chunk_size or cls.REBUILD_CHUNK_SIZE
+        cls.objects.all().delete()
+        tiers = (
+            (Minute, MinuteApproval, MinuteActionLog, 'minute_id'),
+            (ColdMinute, ColdMinuteApproval, ColdMinuteActionLog, 'cold_minute_id'),
+        )
+        for minute_model, approval_model, log_model, column in tiers:
+            last_id = 0
+            while True:
+                minutes = list(
+                    minute_model.objects.filter(pk__gt=last_id).order_by('pk')
+                    .values_list('pk', 'approval_chain_id', 'created_at')[:chunk_size]
+                )
+                if not minutes:
+                    break
+                last_id = minutes[-1][0]
+                rows = cls._chunk_rows(minutes, approval_model, log_model)
+                cls.objects.bulk_create([
+                    cls(user_id=user_id, role=role, last_activity=last_activity, **{column: minute_id})
+                    for (user_id, minute_id), (role, last_activity) in rows.items()
+                ], batch_size=1000)
+
+    @staticmethod
+    def _chunk_rows(minutes, approval_model, log_model):
+        """
+        The participations in a pk-ordered chunk of minutes of one tier, as
+        {(user id, minute id): (role, last activity)}.
+        """
+        Approver = apps.get_model('approval_chain', 'Approver')
+        first_id, last_id = minutes[0][0], minutes[-1][0]
+        rows = {}
+        for user_id, minute_id, latest in (
+            log_model.objects.filter(minute_id__gte=first_id, minute_id__lte=last_id, performed_by__isnull=False)
+            .values_list('performed_by_id', 'minute_id').annotate(latest=Max('timestamp')).order_by()
+        ):
+            rows[user_id, minute_id] = ('actor', latest)
+
+        chains = {chain_id: (minute_id, created_at) for minute_id, chain_id, created_at in minutes if chain_id}
+        chain_members = (
+            (user_id, *chains[chain_id])
+            for user_id, chain_id in Approver.objects.filter(approval_chain_id__in=chains)
+            .values_list('user_id', 'approval_chain_id')
+        )
+        approval_members = approval_model.objects.filter(minute_id__gte=first_id, minute_id__lte=last_id).values_list(
+            'approver_id', 'minute_id', 'created_at'
+        )
+        for user_id, minute_id, created_at in chain(chain_members, approval_members):
+            existing = rows.get((user_id, minute_id))
+            rows[user_id, minute_id] = ('approver', existing[1] if existing else created_at)
+        return rows
+
+
+class ApproverCounter(models.Model):
+    """
+    Materialized per-user dashboard counters, kept in step with MinuteApproval
+    status transitions so the approver dashboard never aggregates history.
+    """
+    BUCKETS = ('pending', 'approved', 'rejected', 'returned', 'marked')
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='approver_counter',
+        help_text="The approver these counters belong to."
+    )
+    pending = models.IntegerField(default=0, help_text="Approvals waiting on this user as current approver.")
+    approved = models.IntegerField(default=0, help_text="Approvals this user approved.")
+    rejected = models.IntegerField(default=0, help_text="Approvals this user rejected.")
+    returned = models.IntegerField(default=0, help_text="Approvals this user returned.")
+    marked = models.IntegerField(default=0, help_text="Approvals this user marked to someone else.")
+    updated_at = models.DateTimeField(auto_now=True, help_text="Timestamp of the last counter change.")
+
+    class Meta:
+        verbose_name = "Approver Counter"
+        verbose_name_plural = "Approver Counters"
+
+    def __str__(self):
+        return f"Counters for {self.user_id}"
+
+    @staticmethod
+    def bucket_for(status, current_approver):
+        """
+        Map a MinuteApproval state to the counter it contributes to (or None).
+        """
+        if status == 'Pending':
+            return 'pending' if current_approver else None
+        bucket = (status or '').lower()
+        return bucket if bucket in ApproverCounter.BUCKETS else None
+
+    @classmethod
+    def shift(cls, user_id, old_bucket, new_bucket, count=1):
+        """
+        Move `count` approvals from `old_bucket` to `new_bucket` for the given user.
+        """
+        cls.shift_many({(user_id, old_bucket, new_bucket): count})
+
+    @classmethod
+    def shift_many(cls, shifts):
+        """
+        Apply {(user id, old bucket, new bucket): count} moves in two statements whatever the
+        number of users: one insert creating the missing counters, one update adding each
+        user's net change to every bucket.
+        """
+        deltas = {}
+        for (user_id, old_bucket, new_bucket), count in shifts.items():
+            if old_bucket == new_bucket or not user_id or not count:
+                continue
+            changes = deltas.setdefault(user_id, Counter())
+            if old_bucket:
+                changes[old_bucket] -= count
+            if new_bucket:
+                changes[new_bucket] += count
+        if not deltas:
+            return
+        cls.objects.bulk_create([cls(user_id=user_id) for user_id in deltas], ignore_conflicts=True)
+        buckets = {bucket for changes in deltas.values() for bucket, count in changes.items() if count}
+        cls.objects.filter(user_id__in=deltas).update(
+            **{
+                bucket: F(bucket) + Case(
+                    *[When(user_id=user_id, then=Value(changes[bucket])) for user_id, changes in deltas.items()
+                      if changes[bucket]],
+                    default=Value(0),
+                )
+                for bucket in buckets
+            },
+            updated_at=now(),
+        )
+
+    @classmethod
+    def live_aggregate(cls, user_ids=None):
+        """
+        Compute the counters from the approval records of both tiers, keyed by user id.
+        """
+        counters = {}
+        for model in (MinuteApproval, ColdMinuteApproval):
+            approvals = model.objects.all()
+            if user_ids is not None:
+                approvals = approvals.filter(approver_id__in=user_ids)
+            rows = approvals.values('approver_id').annotate(
+                pending=Count('id', filter=models.Q(status='Pending', current_approver=True)),
+                approved=Count('id', filter=models.Q(status='Approved')),
+                rejected=Count('id', filter=models.Q(status='Rejected')),
+                returned=Count('id', filter=models.Q(status='Returned')),
+                marked=Count('id', filter=models.Q(status='Marked')),
+            ).order_by()
+            for row in rows:
+                totals = counters.setdefault(row.pop('approver_id'), dict.fromkeys(cls.BUCKETS, 0))
+                for bucket, count in row.items():
+                    totals[bucket] += count
+        return counters
+
+    @classmethod
+    def mismatches(cls):
+        """
+        Compare stored counters with the live aggregate.
+        Returns {user_id: (stored, live)} for every user whose counters disagree.
+        """
+        live = cls.live_aggregate()
+        stored = {
+            row.pop('user_id'): row
+            for row in cls.objects.values('user_id', *cls.BUCKETS)
+        }
+        empty = dict.fromkeys(cls.BUCKETS, 0)
+        return {
+            user_id: (stored.get(user_id, empty), live.get(user_id, empty))
+            for user_id in set(live) | set(stored)
+            if stored.get(user_id, empty) != live.get(user_id, empty)
+        }
+
+    @classmethod
+    @transaction.atomic
+    def rebuild(cls, user_ids=None):
+        """
+        Replace the stored counters of the given users, or of everyone, with the live aggregate.
+        """
+        counters = cls.objects.all()
+        if user_ids is not None:
+            counters = counters.filter(user_id__in=user_ids)
+        counters.delete()
+        cls.objects.bulk_create(
+            [cls(user_id=user_id, **counts) for user_id, counts in cls.live_aggregate(user_ids).items()],
+            batch_size=1000,
+        )
@@ -1,3 +1,880 @@
-from django.test import TestCase
+from datetime import timedelta
+import csv
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.utils.timezone import now
+from apps.api.models import ChangeEvent
+from apps.minute.models import ColdMinute, Minute, MinuteApproval, MinuteActionLog
+from apps.minute.views import ArchiveView
+from apps.approval_chain.models import ApprovalChain, Approver
+from apps.departments.models import Department
+from apps.notifications.models import Notification
+from apps.approver.models import ArchiveFacetRollup, ArchiveApproverRollup, MinuteParticipation, ApproverCounter
+from utils.synthetic_data import DatasetScale, generate_dataset
+from utils.benchmarks import benchmark_cases, compare_to_baseline, outlier_report, run_benchmarks
+from utils.load_harness import ApprovalLoad, ApprovalTask, workflow_invariant_violations
+from utils.performance import registry
+from utils.structured_logging import bound_log_context
+from utils.tracing import continued_trace, with_trace
+from utils.action_log_archive import (
+    ActionLogArchive, add_months, default_partition_name, ensure_partitions, export_path, minute_history, month_start,
+    partition_name,
+)
+from utils.audit_export import COLUMNS
+from rest_framework_simplejwt.tokens import RefreshToken
+
+User = get_user_model()
+
+
+def create_minute_with_approvers(title, created_by, department, approvers):
+    """
+    Create a submitted minute with one pending MinuteApproval per approver.
+    """
+    chain = ApprovalChain.objects.create(name=f"Chain for {title}", created_by=created_by)
+    minute = Minute.objects.create(
+        title=title,
+        description="Description",
+        created_by=created_by,
+        department=department,
+        approval_chain=chain,
+        status='Submitted',
+    )
+    for order, approver in enumerate(approvers, start=1):
+        MinuteApproval.objects.create(
+            minute=minute,
+            approval_chain=chain,
+            approver=approver,
+            order=order,
+            status='Pending',
+            current_approver=(order == 1),
+        )
+    return minute
+
+
+class DepartmentArchiveTest(TestCase):
+    """
+    Test the faceted, keyset-paginated department archive and its rollups.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(
+            username='faculty', password='password', role='Faculty', department=self.department
+        )
+        self.hod = User.objects.create_user(
+            username='hod', password='password', role='Admin', department=self.department
+        )
+        self.client.login(username='faculty', password='password')
+
+    def test_archive_records_rollups_once(self):
+        minute = create_minute_with_approvers("Budget", self.faculty, self.department, [self.hod])
+        minute.archive('Approved')
+        minute.archive('Approved')  # the workflow archives twice for some actions
+
+        bucket = ArchiveFacetRollup.objects.get()
+        self.assertEqual(bucket.minutes, 1)
+        self.assertEqual(bucket.status, 'Approved')
+        self.assertEqual(ArchiveApproverRollup.objects.get(approver=self.hod).minutes, 1)
+
+    def test_rebuild_matches_incremental_rollups(self):
+        for index in range(3):
+            create_minute_with_approvers(f"Minute {index}", self.faculty, self.department, [self.hod]).archive(
+                'Approved' if index else 'Rejected'
+            )
+        incremental = sorted(ArchiveFacetRollup.objects.values_list('status', 'minutes'))
+
+        ArchiveFacetRollup.rebuild()
+
+        self.assertEqual(sorted(ArchiveFacetRollup.objects.values_list('status', 'minutes')), incremental)
+        self.assertEqual(
+            sum(ArchiveApproverRollup.objects.filter(approver=self.hod).values_list('minutes', flat=True)), 3
+        )
+
+    def test_keyset_pagination_and_facets(self):
+        for index in range(30):
+            create_minute_with_approvers(f"Minute {index}", self.faculty, self.department, [self.hod]).archive(
+                'Rejected' if index % 3 == 0 else 'Approved'
+            )
+
+        url = reverse('approver:department_archive')
+        first = self.client.get(url)
+        self.assertEqual(len(first.context['archived_minutes']), 25)
+        self.assertTrue(first.context['page'].has_next)
+
+        status_counts = {row['status']: row['total'] for row in first.context['facets']['status']}
+        self.assertEqual(status_counts, {'Approved': 20, 'Rejected': 10})
+
+        second = self.client.get(url, {'cursor': first.context['page'].next_cursor})
+        self.assertEqual(len(second.context['archived_minutes']), 5)
+        self.assertFalse(second.context['page'].has_next)
+
+        first_ids = {entry['minute'].pk for entry in first.context['archived_minutes']}
+        second_ids = {entry['minute'].pk for entry in second.context['archived_minutes']}
+        self.assertFalse(first_ids & second_ids)
+
+        rejected = self.client.get(url, {'status': 'Rejected'})
+        self.assertEqual(len(rejected.context['archived_minutes']), 10)
+
+
+class ApprovalTrackerTest(TestCase):
+    """
+    Test the participation index behind the approval tracker.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(username='faculty', password='password', role='Faculty')
+        self.hod = User.objects.create_user(username='hod', password='password', role='Admin')
+        self.outsider = User.objects.create_user(username='outsider', password='password', role='Admin')
+
+    def test_participation_written_on_chain_and_actions(self):
+        minute = create_minute_with_approvers("Budget", self.faculty, self.department, [self.hod])
+        self.assertEqual(MinuteParticipation.objects.get(user=self.hod, minute=minute).role, 'approver')
+
+        MinuteActionLog.objects.create(minute=minute, action='approve', performed_by=self.outsider)
+        self.assertEqual(MinuteParticipation.objects.get(user=self.outsider, minute=minute).role, 'actor')
+
+        MinuteActionLog.objects.create(minute=minute, action='approve', performed_by=self.hod)
+        self.assertEqual(MinuteParticipation.objects.get(user=self.hod, minute=minute).role, 'approver')
+
+    def test_linking_chain_registers_chain_approvers(self):
+        chain = ApprovalChain.objects.create(name="Standalone Chain", created_by=self.faculty)
+        Approver.objects.create(approval_chain=chain, user=self.hod, order=1)
+        minute = Minute.objects.create(
+            title="Draft", description="Description", created_by=self.faculty, department=self.department
+        )
+        self.assertFalse(MinuteParticipation.objects.filter(user=self.hod).exists())
+
+        minute.approval_chain = chain
+        minute.save()
+        self.assertTrue(MinuteParticipation.objects.filter(user=self.hod, minute=minute).exists())
+
+    def test_tracker_lists_participations_and_rebuild_is_consistent(self):
+        for index in range(3):
+            create_minute_with_approvers(f"Minute {index}", self.faculty, self.department, [self.hod])
+        expected = set(MinuteParticipation.objects.values_list('user_id', 'minute_id', 'role'))
+
+        MinuteParticipation.rebuild(chunk_size=2)
+        self.assertEqual(set(MinuteParticipation.objects.values_list('user_id', 'minute_id', 'role')), expected)
+
+        self.client.login(username='hod', password='password')
+        response = self.client.get(reverse('approver:approval_tracker'))
+        self.assertEqual(len(response.context['related_minutes']), 3)
+        self.assertFalse(response.context['page'].has_next)
+
+
+class ApproverCounterTest(TestCase):
+    """
+    Test the materialized approver dashboard counters.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(username='faculty', password='password', role='Faculty')
+        self.hod = User.objects.create_user(username='hod', password='password', role='Admin')
+        self.dean = User.objects.create_user(username='dean', password='password', role='Admin')
+
+    def create_chain_minute(self, title):
+        minute = create_minute_with_approvers(title, self.faculty, self.department, [self.hod, self.dean])
+        for order, user in enumerate([self.hod, self.dean], start=1):
+            Approver.objects.create(approval_chain=minute.approval_chain, user=user, order=order, is_current=(order == 1))
+        return minute
+
+    def test_counters_follow_workflow_transitions(self):
+        first = self.create_chain_minute("First")
+        second = self.create_chain_minute("Second")
+        self.assertEqual(ApproverCounter.objects.get(user=self.hod).pending, 2)
+        self.assertEqual(ApproverCounter.objects.filter(user=self.dean, pending__gt=0).count(), 0)
+
+        MinuteApproval.objects.get(minute=first, approver=self.hod).approve(remarks="Fine")
+        MinuteApproval.objects.get(minute=second, approver=self.hod).reject(remarks="No")
+
+        hod = ApproverCounter.objects.get(user=self.hod)
+        self.assertEqual((hod.pending, hod.approved, hod.rejected), (0, 1, 1))
+        self.assertEqual(ApproverCounter.objects.get(user=self.dean).pending, 1)
+        self.assertEqual(ApproverCounter.mismatches(), {})
+
+    def test_chain_approver_actions_keep_counters_in_step(self):
+        minute = self.create_chain_minute("Chain actions")
+        chain = minute.approval_chain
+        chain.minute = minute
+        chain.save()
+
+        chain.approvers.get(user=self.hod).approve()
+        self.assertEqual(ApproverCounter.objects.get(user=self.dean).pending, 1)
+        self.assertEqual(ApproverCounter.mismatches(), {})
+
+        chain.approvers.get(user=self.dean).return_to(chain.approvers.get(user=self.hod))
+        self.assertEqual(ApproverCounter.mismatches(), {})
+
+    def test_dashboard_reads_counters_and_rebuild_repairs_drift(self):
+        self.create_chain_minute("First")
+        ApproverCounter.objects.filter(user=self.hod).update(pending=42)
+        self.assertIn(self.hod.pk, ApproverCounter.mismatches())
+
+        ApproverCounter.rebuild()
+        self.assertEqual(ApproverCounter.mismatches(), {})
+
+        self.client.login(username='hod', password='password')
+        response = self.client.get(reverse('approver:dashboard'))
+        self.assertEqual(response.context['total_pending'], 1)
+
+
+class SyntheticDataTest(TestCase):
+    """
+    Test the synthetic dataset generator used by the benchmarks.
+    """
+    SCALE = DatasetScale(minutes=300, departments=3, users_per_department=8)
+
+    def generate(self, seed):
+        with transaction.atomic():
+            counts = generate_dataset(self.SCALE, seed=seed, batch_size=120)
+            snapshot = list(Minute.objects.order_by('created_at').values_list('status', 'created_by__username'))
+            transaction.set_rollback(True)
+        return counts, snapshot
+
+    def test_same_seed_same_dataset(self):
+        counts, snapshot = self.generate(seed=7)
+        self.assertEqual(counts['minutes'], 300)
+        self.assertEqual(self.generate(seed=7), (counts, snapshot))
+        self.assertNotEqual(self.generate(seed=8)[1], snapshot)
+
+    def test_generated_workflow_state_is_consistent(self):
+        generate_dataset(self.SCALE, seed=7, batch_size=120)
+
+        statuses = set(Minute.objects.values_list('status', flat=True))
+        self.assertEqual(statuses, {choice for choice, _ in Minute.STATUS_CHOICES})
+        self.assertFalse(Minute.objects.filter(archived=True).exclude(status__in=['Approved', 'Rejected']).exists())
+
+        in_flight = Minute.objects.filter(archived=False).exclude(status='Draft')
+        self.assertFalse(in_flight.filter(current_approver__isnull=True).exists())
+        current_counts = set(
+            MinuteApproval.objects.filter(current_approver=True, minute__in=in_flight)
+            .values('minute').annotate(total=Count('id')).values_list('total', flat=True)
+        )
+        self.assertEqual(current_counts, {1})
+        self.assertEqual(ApproverCounter.mismatches(), {})
+        self.assertTrue(self.client.login(username='syn000_user0002', password='password'))
+
+    def test_ids_continue_after_the_cold_tier(self):
+        faculty = User.objects.create_user(username='faculty', password='password', role='Faculty')
+        ColdMinute.objects.create(
+            id=5000, unique_id="DHA/DSU/GEN/01-2024/5000", title="Cold", description="Description",
+            created_by=faculty, status='Approved', archived=True, created_at=now(), updated_at=now(),
+        )
+        generate_dataset(DatasetScale(minutes=20, departments=1, users_per_department=4), seed=7)
+        self.assertEqual(Minute.objects.order_by('pk').values_list('pk', flat=True).first(), 5001)
+
+
+class ViewBenchmarkTest(TestCase):
+    """
+    Test the view benchmark runner and its baseline comparison.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(username='faculty', password='password', role='Faculty')
+        self.hod = User.objects.create_user(
+            username='hod', password='password', role='Admin', department=self.department
+        )
+        create_minute_with_approvers("Budget", self.faculty, self.department, [self.hod])
+
+    def test_benchmark_reports_every_case(self):
+        cases = [case for case in benchmark_cases(self.hod) if not case.name.startswith('minute:track')]
+        results = run_benchmarks(self.hod, cases=cases, iterations=2, warmup=0)
+
+        self.assertEqual(set(results), {case.name for case in cases})
+        dashboard = results['approver:dashboard']
+        self.assertEqual(dashboard['status'], 200)
+        self.assertGreater(dashboard['queries'], 0)
+        self.assertLessEqual(dashboard['p50_ms'], dashboard['p99_ms'])
+        self.assertEqual(results['api:minute-detail']['status'], 200)
+        self.assertEqual(results['api:approval-chain-detail']['status'], 200)
+
+    def test_compare_flags_query_and_latency_regressions(self):
+        baseline = {'view': {'status': 200, 'p50_ms': 10, 'p95_ms': 20, 'p99_ms': 30, 'db_ms': 1, 'queries': 5, 'bytes': 100}}
+        current = dict(baseline['view'], p95_ms=21, db_ms=2.5)
+        self.assertEqual(compare_to_baseline({'view': current}, baseline), [])
+
+        current.update(queries=6, p99_ms=60)
+        regressions = compare_to_baseline({'view': current}, baseline)
+        self.assertEqual(
+            regressions, ['view: p99_ms 60 exceeds baseline 30', 'view: queries 6 exceeds baseline 5']
+        )
+
+    def test_known_outliers_are_held_to_their_own_budget(self):
+        baseline = {'slow': {'status': 200, 'p50_ms': 10, 'p95_ms': 20, 'p99_ms': 30, 'db_ms': 1, 'queries': 5, 'bytes': 100}}
+        current = dict(baseline['slow'], p50_ms=900, queries=500)
+        outliers = {'slow': {'p50_ms': 1000, 'queries': 400}}
+
+        self.assertEqual(
+            compare_to_baseline({'slow': current}, baseline, outliers=outliers),
+            ['slow: queries 500 exceeds its outlier budget 400'],
+        )
+        self.assertEqual(
+            outlier_report({'slow': current}, outliers), ['slow: p50_ms 900 (budget 1000), queries 500 (budget 400)']
+        )
+
+
+class LoadHarnessTest(TestCase):
+    """
+    Test the workflow invariant checks and the approval load harness.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(username='faculty', password='password', role='Faculty')
+        self.hod = User.objects.create_user(username='hod', password='password', role='Admin')
+        self.dean = User.objects.create_user(username='dean', password='password', role='Admin')
+        self.minute = create_minute_with_approvers("Budget", self.faculty, self.department, [self.hod, self.dean])
+        for order, user in enumerate([self.hod, self.dean], start=1):
+            Approver.objects.create(
+                approval_chain=self.minute.approval_chain, user=user, order=order, is_current=(order == 1)
+            )
+
+    def test_consistent_workflow_has_no_violations(self):
+        self.assertEqual(workflow_invariant_violations(), {})
+
+    def test_order_gap_and_disagreement_are_reported(self):
+        Approver.objects.filter(approval_chain=self.minute.approval_chain, order=2).update(order=5)
+
+        violations = workflow_invariant_violations()
+        self.assertEqual(violations['contiguous_chain_orders'], [self.minute.pk])
+        self.assertEqual(violations['approvers_match_approvals'], [self.minute.pk])
+
+    def test_duplicate_submission_is_refused(self):
+        approval = MinuteApproval.objects.get(minute=self.minute, approver=self.hod)
+        task = ApprovalTask(approval.pk, self.minute.pk, self.hod.pk, 'approve')
+
+        outcomes = ApprovalLoad(endpoints=('view',)).run([task], workers=1, duplicates=2)
+
+        self.assertEqual([outcome.outcome for outcome in outcomes], ['ok', 'refused'])
+        self.assertEqual(MinuteApproval.objects.get(minute=self.minute, approver=self.dean).current_approver, True)
+        self.assertEqual(Approver.objects.filter(approval_chain=self.minute.approval_chain, status='Approved').count(), 1)
+
+
+class TracingTest(TestCase):
+    """
+    Test trace propagation from requests to action logs and across message hops.
+    """
+
+    def setUp(self):
+        registry.reset()
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(username='faculty', password='password', role='Faculty')
+        self.hod = User.objects.create_user(username='hod', password='password', role='Admin')
+        self.minute = create_minute_with_approvers("Budget", self.faculty, self.department, [self.hod])
+        Approver.objects.create(approval_chain=self.minute.approval_chain, user=self.hod, order=1, is_current=True)
+
+    def test_action_log_records_the_request_trace(self):
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        approval = MinuteApproval.objects.get(minute=self.minute, approver=self.hod)
+        self.client.login(username='hod', password='password')
+        self.client.post(
+            reverse('approver:process_action', args=[approval.pk]),
+            {'action': 'approve', 'remarks': "Fine"},
+            HTTP_TRACEPARENT=f"00-{trace_id}-00f067aa0ba902b7-01",
+        )
+
+        logs = MinuteActionLog.objects.filter(minute=self.minute)
+        self.assertTrue(logs.exists())
+        self.assertEqual(set(logs.values_list('trace_id', flat=True)), {trace_id})
+
+    def test_messages_continue_the_trace_and_record_hop_latency(self):
+        with bound_log_context(trace_id="a" * 32):
+            message = with_trace({'type': 'send_notification', 'message': "Approved"})
+
+        with continued_trace(message['trace'], 'channel_layer') as trace_id:
+            self.assertEqual(trace_id, "a" * 32)
+        with continued_trace(None, 'channel_layer') as trace_id:
+            self.assertRegex(trace_id, r"^[0-9a-f]{32}$")
+
+        self.assertIn('trace_hops_total{hop="channel_layer"} 1', registry.render())
+
+
+class ArchiveTieringTest(TestCase):
+    """
+    Test moving long-archived minutes to the cold tier and reading them back.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(
+            username='faculty', password='password', role='Faculty', department=self.department
+        )
+        self.hod = User.objects.create_user(
+            username='hod', password='password', role='Admin', department=self.department
+        )
+        self.old = create_minute_with_approvers("Old", self.faculty, self.department, [self.hod])
+        self.old.description = "The committee approved the budget. " * 40
+        self.old.save()
+        MinuteApproval.objects.filter(minute=self.old).update(status='Approved', current_approver=False)
+        MinuteActionLog.objects.create(minute=self.old, action='approve', performed_by=self.hod, remarks="Fine.")
+        self.old.archive('Approved')
+        Minute.objects.filter(pk=self.old.pk).update(archived_at=now() - timedelta(days=400))
+
+        self.recent = create_minute_with_approvers("Recent", self.faculty, self.department, [self.hod])
+        self.recent.archive('Rejected')
+        self.client.login(username='faculty', password='password')
+
+    def test_move_keeps_rows_and_derived_tables(self):
+        rollups = sorted(ArchiveFacetRollup.objects.values_list('status', 'minutes'))
+        participations = set(MinuteParticipation.objects.values_list('user_id', 'role'))
+        counters = ApproverCounter.live_aggregate()
+
+        output = StringIO()
+        call_command('tier_archived_minutes', stdout=output)
+
+        self.assertIn("Moved 1 archived minutes", output.getvalue())
+        self.assertFalse(Minute.objects.filter(pk=self.old.pk).exists())
+        cold = ColdMinute.objects.get(pk=self.old.pk)
+        self.assertEqual(cold.description, self.old.description)
+        self.assertEqual(cold.approval_chain_id, self.old.approval_chain_id)
+        self.assertEqual(cold.approvals.get().status, 'Approved')
+        self.assertEqual(cold.action_logs.get().remarks, "Fine.")
+        self.assertTrue(Minute.objects.filter(pk=self.recent.pk).exists())
+
+        self.assertTrue(MinuteParticipation.objects.filter(cold_minute=cold, user=self.hod).exists())
+        self.assertEqual(ApproverCounter.live_aggregate(), counters)
+        MinuteParticipation.rebuild()
+        self.assertEqual(set(MinuteParticipation.objects.values_list('user_id', 'role')), participations)
+        self.assertTrue(MinuteParticipation.objects.filter(cold_minute=cold, user=self.hod).exists())
+        ArchiveFacetRollup.rebuild()
+        self.assertEqual(sorted(ArchiveFacetRollup.objects.values_list('status', 'minutes')), rollups)
+
+        new = Minute.objects.create(title="New", created_by=self.faculty)
+        self.assertGreater(new.pk, max(cold.pk, self.recent.pk))
+
+    def test_cold_minutes_are_still_served(self):
+        call_command('tier_archived_minutes', stdout=StringIO())
+
+        response = self.client.get(reverse('minute:track_detail', args=[self.old.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['minute'].__class__, ColdMinute)
+        self.assertEqual(self.client.get(reverse('minute:approval_status', args=[self.old.pk])).status_code, 200)
+        self.assertEqual(self.client.get(reverse('minute:archive')).context['archived_minutes'][-1].pk, self.old.pk)
+        with patch.object(ArchiveView, 'page_size', 1):
+            first = self.client.get(reverse('minute:archive')).context
+            second = self.client.get(reverse('minute:archive'), {'cursor': first['page'].next_cursor}).context
+        self.assertEqual([minute.pk for minute in first['archived_minutes']], [self.recent.pk])
+        self.assertEqual([minute.pk for minute in second['archived_minutes']], [self.old.pk])
+        self.assertFalse(second['page'].has_next)
+
+        response = self.client.get(reverse('approver:department_archive'), {'approver': self.hod.pk})
+        self.assertEqual(
+            [entry['minute'].pk for entry in response.context['archived_minutes']], [self.recent.pk, self.old.pk]
+        )
+        self.assertEqual(response.context['archived_minutes'][1]['approvers_status'][0]['status'], 'Approved')
+
+        self.client.login(username='hod', password='password')
+        response = self.client.get(reverse('approver:approval_tracker'))
+        self.assertIn(self.old.pk, [minute.pk for minute in response.context['related_minutes']])
+
+
+class ActionLogArchiveTest(TestCase):
+    """
+    Test the monthly export of old action logs and reading them back.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        settings_override = override_settings(ACTION_LOG_ARCHIVE={'DIR': self.directory.name})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(
+            username='faculty', password='password', role='Faculty', department=self.department
+        )
+        self.hod = User.objects.create_user(
+            username='hod', password='password', role='Admin', department=self.department
+        )
+        self.minute = create_minute_with_approvers("Budget", self.faculty, self.department, [self.hod])
+        self.old_time = now() - timedelta(days=430)
+        Minute.objects.filter(pk=self.minute.pk).update(created_at=self.old_time - timedelta(days=1))
+        self.minute.refresh_from_db()
+        self.log(action='return-to', target_user=self.faculty, remarks="Add the quotes. " * 30)
+        self.log(action='approve', remarks="Fine.")
+        self.recent = MinuteActionLog.objects.create(minute=self.minute, action='approve', performed_by=self.hod)
+
+    def log(self, **fields):
+        entry = MinuteActionLog.objects.create(minute=self.minute, performed_by=self.hod, **fields)
+        MinuteActionLog.objects.filter(pk=entry.pk).update(timestamp=self.old_time)
+        return entry
+
+    def archive(self):
+        call_command('archive_action_logs', stdout=StringIO())
+
+    def test_old_months_move_to_files(self):
+        self.archive()
+
+        self.assertEqual(list(MinuteActionLog.objects.values_list('pk', flat=True)), [self.recent.pk])
+        self.assertTrue(os.path.exists(export_path(month_start(self.old_time), self.directory.name)))
+
+        entries = ActionLogArchive().entries(minute_id=self.minute.pk)
+        self.assertEqual([entry.action for entry in entries], ['return-to', 'approve'])
+        self.assertEqual(entries[0].remarks, "Add the quotes. " * 30)
+        self.assertEqual(entries[0].target_user, self.faculty)
+        self.assertEqual(entries[0].timestamp, self.old_time)
+        self.assertEqual(len(ActionLogArchive().entries(action='approve', since=self.old_time)), 1)
+        self.assertEqual(ActionLogArchive().entries(minute_id=self.minute.pk + 1), [])
+
+    def test_history_reads_the_archive_only_for_minutes_it_can_hold(self):
+        self.archive()
+        self.assertEqual(len(minute_history(self.minute)), 3)
+
+        new = create_minute_with_approvers("New", self.faculty, self.department, [self.hod])
+        with patch.object(ActionLogArchive, 'entries') as entries:
+            self.assertEqual(minute_history(new), [])
+        entries.assert_not_called()
+
+    def test_month_files_are_in_time_order(self):
+        other = create_minute_with_approvers("Other", self.faculty, self.department, [self.hod])
+        entry = MinuteActionLog.objects.create(minute=other, action='reject', performed_by=self.hod)
+        MinuteActionLog.objects.filter(pk=entry.pk).update(timestamp=month_start(self.old_time))
+        self.archive()
+
+        archive = ActionLogArchive()
+        [(_, path, index)] = archive.files()
+        self.assertEqual(index['sorted_by'], 'timestamp')
+        self.assertEqual([record['action'] for record in archive.read_file(path)], ['reject', 'return-to', 'approve'])
+
+    def test_late_entries_are_merged_into_the_month(self):
+        self.archive()
+        self.log(action='mark-to', target_user=self.faculty)
+        self.archive()
+
+        self.assertEqual(len(ActionLogArchive().entries(minute_id=self.minute.pk)), 3)
+        self.assertEqual(MinuteActionLog.objects.count(), 1)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', "action log partitions are PostgreSQL only")
+    def test_partition_for_a_month_held_by_the_default_partition(self):
+        month = add_months(month_start(now()), 24)
+        late = MinuteActionLog.objects.create(minute=self.minute, action='approve', performed_by=self.hod)
+        MinuteActionLog.objects.filter(pk=late.pk).update(timestamp=month + timedelta(days=2))
+
+        self.assertEqual(ensure_partitions(month, month), [partition_name(month)])
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT "id" FROM "{partition_name(month)}"')
+            self.assertEqual(cursor.fetchall(), [(late.pk,)])
+            cursor.execute(f'SELECT COUNT(*) FROM "{default_partition_name()}" WHERE "id" = %s', [late.pk])
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_history_views_include_exported_entries(self):
+        self.archive()
+        self.client.login(username='faculty', password='password')
+
+        response = self.client.get(reverse('approver:track_admin_minute', args=[self.minute.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [log.action for log in response.context['action_logs']], ['return-to', 'approve', 'approve']
+        )
+        self.assertEqual(len(response.context['return_to_history']), 1)
+
+
+class AuditExportTest(TestCase):
+    """
+    Test the streaming export of the action history across the live, cold and exported logs.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        settings_override = override_settings(ACTION_LOG_ARCHIVE={'DIR': self.directory.name})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        other_department = Department.objects.create(name="Physics", code="PH")
+        self.faculty = User.objects.create_user(
+            username='faculty', password='password', role='Faculty', department=self.department
+        )
+        self.hod = User.objects.create_user(
+            username='hod', password='password', role='Admin', department=self.department
+        )
+        self.department.head_of_department = self.hod
+        self.department.save()
+        exported = create_minute_with_approvers("Exported", self.faculty, self.department, [self.hod])
+        cold = create_minute_with_approvers("Cold", self.faculty, self.department, [self.hod])
+        other = create_minute_with_approvers("Other", self.faculty, other_department, [self.hod])
+
+        self.log(exported, days_ago=430, action='mark-to', target_user=self.faculty, remarks="Over to you.")
+        self.log(cold, days_ago=420, action='approve', remarks="Approved. " * 40)
+        self.log(exported, days_ago=0, action='approve')
+        self.log(other, days_ago=0, action='reject')
+        cold.archive('Approved')
+        Minute.objects.filter(pk=cold.pk).update(archived_at=now() - timedelta(days=400))
+        call_command('tier_archived_minutes', stdout=StringIO())
+        call_command('archive_action_logs', stdout=StringIO())
+        self.minutes = [exported, cold, exported]
+
+    def log(self, minute, days_ago, **fields):
+        entry = MinuteActionLog.objects.create(minute=minute, performed_by=self.hod, **fields)
+        MinuteActionLog.objects.filter(pk=entry.pk).update(timestamp=now() - timedelta(days=days_ago))
+
+    def export(self, user=None, **params):
+        token = RefreshToken.for_user(user or self.hod).access_token
+        response = self.client.get(reverse('audit-log-export'), params, HTTP_AUTHORIZATION=f"Bearer {token}")
+        return response, b"".join(response.streaming_content).decode() if response.streaming else None
+
+    def test_streams_every_tier_in_time_order(self):
+        response, body = self.export(department=self.department.pk)
+
+        self.assertFalse(MinuteActionLog.objects.filter(action='mark-to').exists())  # served from the export file
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['minute_unique_id'] for row in rows], [minute.unique_id for minute in self.minutes])
+        self.assertEqual([row['action'] for row in rows], ['mark-to', 'approve', 'approve'])
+        self.assertEqual((rows[0]['performed_by'], rows[0]['target_user']), ('hod', 'faculty'))
+        self.assertEqual(rows[1]['remarks'], "Approved. " * 40)
+
+        _, resumed = self.export(department=self.department.pk, cursor=rows[0]['cursor'])
+        self.assertEqual([json.loads(line) for line in resumed.splitlines()], rows[1:])
+
+    def test_csv_and_command_match_the_endpoint(self):
+        response, body = self.export(department=self.department.pk, output='csv', since=(now() - timedelta(days=425)).date())
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        header, *rows = list(csv.reader(body.splitlines()))
+        self.assertEqual(tuple(header), COLUMNS)
+        self.assertEqual([row[COLUMNS.index('action')] for row in rows], ['approve', 'approve'])
+
+        path = os.path.join(self.directory.name, 'audit.csv')
+        call_command(
+            'export_audit_log', format='csv', department=self.department.pk, output=path, chunk_size=1,
+            since=str((now() - timedelta(days=425)).date()),
+        )
+        with open(path, newline='') as file:
+            self.assertEqual(file.read(), body)
+
+    def test_department_is_checked(self):
+        self.assertEqual(self.export()[0].status_code, 400)
+        other_department = Department.objects.exclude(pk=self.department.pk).get()
+        self.assertEqual(self.export(department=other_department.pk)[0].status_code, 403)
+        self.assertEqual(self.export(department=self.department.pk, since="yesterday")[0].status_code, 400)
+
+    def test_only_heads_deans_and_auditors_export(self):
+        self.assertEqual(self.export(user=self.faculty, department=self.department.pk)[0].status_code, 403)
+        self.assertEqual(self.export(user=self.faculty)[0].status_code, 403)
+
+        auditor = User.objects.create_user(username='auditor', password='password', role='Admin')
+        auditor.user_permissions.add(Permission.objects.get(codename='export_audit_log'))
+        other_department = Department.objects.exclude(pk=self.department.pk).get()
+        response, body = self.export(user=auditor, department=other_department.pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([json.loads(line)['action'] for line in body.splitlines()], ['reject'])
+
+
+class ChangeFeedTest(TestCase):
+    """
+    Test the incremental change feed sync clients follow.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(
+            username='faculty', password='password', role='Faculty', department=self.department
+        )
+        self.hod = User.objects.create_user(
+            username='hod', password='password', role='Admin', department=self.department
+        )
+        self.outsider = User.objects.create_user(
+            username='outsider', password='password', role='Faculty', department=self.department
+        )
+        self.minute = create_minute_with_approvers("Budget", self.faculty, self.department, [self.hod])
+        self.approval = MinuteApproval.objects.get(minute=self.minute)
+
+    def feed(self, user, **params):
+        token = RefreshToken.for_user(user).access_token
+        response = self.client.get(reverse('change-feed'), params, HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_feed_resumes_after_the_cursor(self):
+        first = self.feed(self.faculty)
+        changes = {(change['type'], change['id']): change for change in first['changes']}
+        self.assertEqual(set(changes), {('minute', self.minute.pk), ('approval', self.approval.pk)})
+        self.assertEqual(changes['minute', self.minute.pk]['data']['current_approver_id'], self.hod.pk)
+        self.assertFalse(first['has_more'])
+        self.assertEqual(self.feed(self.outsider)['changes'], [])
+
+        with transaction.atomic():
+            self.approval.status = 'Rejected'
+            self.approval.current_approver = False
+            self.approval.save()
+            notification = Notification.objects.create(user=self.faculty, title="Rejected", message="Budget was rejected.")
+
+        changes = self.feed(self.faculty, since=first['next'])['changes']
+        changes = {change['type']: change for change in changes}
+        self.assertEqual(len(changes), 3)
+        self.assertEqual(changes['approval']['data']['status'], 'Rejected')
+        self.assertIsNone(changes['minute']['data']['current_approver_id'])
+        self.assertEqual(changes['notification']['id'], notification.pk)
+        self.assertNotIn('notification', [change['type'] for change in self.feed(self.hod, since=first['next'])['changes']])
+
+        page = self.feed(self.faculty, since=first['next'], limit=1)
+        self.assertTrue(page['has_more'])
+        self.assertEqual(len(page['changes']), 1)
+        self.assertEqual(self.feed(self.faculty, since=self.feed(self.faculty)['next'])['changes'], [])
+
+    def test_deletions_reach_creator_and_participants(self):
+        cursor = self.feed(self.hod)['next']
+        minute_id = self.minute.pk
+        self.minute.delete()
+
+        for user in (self.faculty, self.hod):
+            changes = self.feed(user, since=cursor)['changes']
+            self.assertEqual(changes, [{'seq': changes[0]['seq'], 'type': 'minute', 'id': minute_id, 'deleted': True}])
+
+        token = RefreshToken.for_user(self.hod).access_token
+        response = self.client.get(reverse('change-feed'), {'since': 'nope'}, HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(response.status_code, 400)
+
+    def test_rolled_back_writes_emit_no_changes(self):
+        cursor = self.feed(self.faculty)['next']
+        for nested in (False, True):
+            with transaction.atomic():
+                if nested:
+                    notification = Notification.objects.create(
+                        user=self.faculty, title="Kept", message="Written next to a rolled back block."
+                    )
+                try:
+                    with transaction.atomic():
+                        self.approval.status = 'Rejected'
+                        self.approval.save()
+                        raise RuntimeError("abandon the decision")
+                except RuntimeError:
+                    pass
+
+        changes = self.feed(self.faculty, since=cursor)['changes']
+        self.assertEqual([(change['type'], change['id']) for change in changes], [('notification', notification.pk)])
+
+    def test_entries_are_written_with_the_change(self):
+        sequence = ChangeEvent.objects.order_by('seq').last().seq
+        with self.captureOnCommitCallbacks() as callbacks, transaction.atomic():
+            self.approval.status = 'Rejected'
+            self.approval.save()
+            written = ChangeEvent.objects.filter(seq__gt=sequence)
+            self.assertEqual(
+                {(event.kind, event.object_id) for event in written},
+                {('approval', self.approval.pk), ('minute', self.minute.pk)},
+            )
+        self.assertEqual(callbacks, [])
+
+
+
+class BulkDecisionTest(TestCase):
+    """
+    Test bulk approve/reject from the pending minutes page and the API.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.faculty = User.objects.create_user(
+            username='faculty', password='password', role='Faculty', department=self.department
+        )
+        self.hod = User.objects.create_user(username='hod', password='password', role='Admin', department=self.department)
+        self.dean = User.objects.create_user(username='dean', password='password', role='Admin', department=self.department)
+
+    def create_chain_minute(self, title, approvers):
+        minute = create_minute_with_approvers(title, self.faculty, self.department, approvers)
+        for order, user in enumerate(approvers, start=1):
+            Approver.objects.create(approval_chain=minute.approval_chain, user=user, order=order, is_current=(order == 1))
+        return minute
+
+    def current_approval(self, minute):
+        return MinuteApproval.objects.get(minute=minute, current_approver=True)
+
+    def test_page_approves_selected_minutes(self):
+        chained = self.create_chain_minute("Chained", [self.hod, self.dean])
+        single = self.create_chain_minute("Single", [self.hod])
+        self.client.login(username='hod', password='password')
+
+        response = self.client.get(reverse('approver:pending_minutes'))
+        approval_ids = sorted(minute.approval_id for minute in response.context['page_obj'])
+        self.assertEqual(approval_ids, sorted([self.current_approval(chained).pk, self.current_approval(single).pk]))
+
+        response = self.client.post(reverse('approver:bulk_action'), {
+            'action': 'approve', 'remarks': "Fine", 'approval_ids': approval_ids,
+        })
+        self.assertRedirects(response, reverse('approver:pending_minutes'))
+
+        chained.refresh_from_db()
+        single.refresh_from_db()
+        self.assertEqual((chained.status, chained.current_approver_id), ('Submitted', self.dean.pk))
+        self.assertEqual(self.current_approval(chained).approver, self.dean)
+        self.assertEqual((single.status, single.archived), ('Approved', True))
+        self.assertEqual(MinuteActionLog.objects.filter(action='approve', performed_by=self.hod).count(), 2)
+        self.assertEqual(workflow_invariant_violations(), {})
+        self.assertEqual(ApproverCounter.mismatches(), {})
+
+    def test_api_reports_each_item(self):
+        mine = self.create_chain_minute("Mine", [self.hod])
+        theirs = self.create_chain_minute("Theirs", [self.dean])
+        token = RefreshToken.for_user(self.hod).access_token
+        ids = [self.current_approval(mine).pk, self.current_approval(theirs).pk]
+
+        response = self.client.post(
+            reverse('minute-approvals-bulk'), {'approval_ids': ids, 'action': 'reject', 'remarks': "No"},
+            content_type='application/json', HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['decided'], 1)
+        self.assertEqual([result['ok'] for result in body['results']], [True, False])
+        self.assertEqual(body['results'][0]['status'], 'Rejected')
+        self.assertEqual(body['results'][1]['error'], "Approval not found.")
+        mine.refresh_from_db()
+        self.assertEqual((mine.status, mine.archived), ('Rejected', True))
+        self.assertTrue(self.current_approval(theirs).status == 'Pending')
+
+        # Deciding the same record again is reported, not applied twice
+        again = self.client.post(
+            reverse('minute-approvals-bulk'), {'approval_ids': ids[:1], 'action': 'approve'},
+            content_type='application/json', HTTP_AUTHORIZATION=f"Bearer {token}",
+        ).json()
+        self.assertEqual(again['decided'], 0)
+
+        invalid = self.client.post(
+            reverse('minute-approvals-bulk'), {'approval_ids': "1,2", 'action': 'approve'},
+            content_type='application/json', HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+        self.assertEqual(invalid.status_code, 400)
+        self.assertEqual(workflow_invariant_violations(), {})
+        self.assertEqual(ApproverCounter.mismatches(), {})
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        def decide(count, queries):
+            # Every chained minute hands over to an approver of its own
+            minutes = [
+                self.create_chain_minute(f"Minute {title}", [self.hod, User.objects.create_user(
+                    username=f'dean{title}', password='password', role='Admin', department=self.department
+                )])
+                for title in count
+            ]
+            minutes += [self.create_chain_minute(f"Final {title}", [self.hod]) for title in count]
+            ids = [self.current_approval(minute).pk for minute in minutes]
+            with self.assertNumQueries(queries):
+                results = MinuteApproval.bulk_decide(self.hod, ids, 'approve')
+            self.assertTrue(all(result['ok'] for result in results))
+
+        decide(range(1), 35)  # creates the rollup buckets and counters the later batches only update
+        decide(range(1, 3), 31)
+        decide(range(3, 9), 31)
+        self.assertEqual(workflow_invariant_violations(), {})
+        self.assertEqual(ApproverCounter.mismatches(), {})
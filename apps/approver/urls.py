@@ -2,6 +2,7 @@ from django.urls import path
 from .views.dashboard import dashboard
 from .views.minute_details import minute_details
 from .views.pending_minutes import pending_minutes
+from .views.bulk_actions import bulk_action
 from .views.actions import approve_minute, reject_minute, mark_to_minute, return_to_minute, process_action
 from .views.track_admin_minute import track_admin_minute  # Admin's Track Minute
 from .views.approval_tracker import approval_tracker
@@ -18,6 +19,7 @@ urlpatterns = [
 
     # Pending Minutes
     path('pending_minutes/', pending_minutes, name='pending_minutes'),
+    path('pending_minutes/bulk-action/', bulk_action, name='bulk_action'),  # Approve/reject the selected minutes
 
     # Approver Actions
     path('minute/<int:pk>/approve/', approve_minute, name='approve_minute'),
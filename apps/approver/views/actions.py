@@ -10,6 +10,9 @@ from django.utils.timezone import now
 from django.db.models import Max
 from django.db.models import F
 from django.core.exceptions import ValidationError
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 User = get_user_model()
@@ -254,7 +257,7 @@ def validate_return_to_input(approval, target_user):
 
     # Allow return to users who have previously approved the minute but log the action
     if returned_approval.status == 'Approved':
-        print(f"Warning: Returning to '{target_user.username}' who previously approved the minute.")
+        logger.warning("Returning minute %s to '%s', who previously approved it.", approval.minute_id, target_user.username)
 
     # Ensure the target approver is before or at the current approver in the chain
     if returned_approval.order >= approval.order:
@@ -2,28 +2,35 @@
 
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from apps.minute.models import Minute, MinuteActionLog
-from apps.approval_chain.models import Approver
+from apps.approver.models import MinuteParticipation
+from utils.pagination import keyset_paginate
+
+TRACKER_PAGE_SIZE = 25
+
 
 @login_required
 def approval_tracker(request):
     """
     Displays all minutes where the user has participated in the approval process or is in the chain.
+    Reads the per-user participation index, most recent activity first, one keyset page at a time.
+    Participations in minutes moved to the cold tier list the cold copy.
     """
-    user = request.user
-
-    # Fetch all minutes where the user is in the approval chain
-    in_approval_chain = Minute.objects.filter(approval_chain__approvers__user=user).distinct()
-
-    # Fetch all minutes where the user has performed actions
-    action_logs = MinuteActionLog.objects.filter(performed_by=user).values_list('minute', flat=True)
-    with_actions = Minute.objects.filter(pk__in=action_logs).distinct()
+    participations = (
+        MinuteParticipation.objects
+        .filter(user=request.user)
+        .select_related('minute__created_by', 'cold_minute__created_by')
+    )
 
-    # Combine both querysets
-    related_minutes = (in_approval_chain | with_actions).distinct()
+    page = keyset_paginate(
+        participations,
+        ordering=('-last_activity', '-id'),
+        cursor=request.GET.get('cursor'),
+        per_page=TRACKER_PAGE_SIZE,
+    )
 
     context = {
-        'related_minutes': related_minutes,
+        'related_minutes': [participation.minute or participation.cold_minute for participation in page],
+        'page': page,
     }
 
     return render(request, 'approver/approval_tracker.html', context)
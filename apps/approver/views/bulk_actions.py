@@ -0,0 +1,34 @@
+# approver/views/bulk_actions.py
+
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import redirect
+from django.views.decorators.http import require_POST
+from apps.minute.models import MinuteApproval
+
+
+@login_required
+@require_POST
+def bulk_action(request):
+    """
+    Approve or reject the minutes selected on the pending minutes page in one go.
+    Records that cannot be decided (no longer current, not yours) are reported and skipped.
+    """
+    action = request.POST.get('action')
+    remarks = request.POST.get('remarks', '').strip()
+    approval_ids = [int(value) for value in request.POST.getlist('approval_ids') if value.isdigit()]
+
+    if action not in MinuteApproval.BULK_ACTIONS:
+        messages.error(request, "Choose to approve or reject the selected minutes.")
+    elif not approval_ids:
+        messages.error(request, "Select at least one minute.")
+    elif len(approval_ids) > MinuteApproval.BULK_MAX_ITEMS:
+        messages.error(request, f"Select at most {MinuteApproval.BULK_MAX_ITEMS} minutes at a time.")
+    else:
+        results = MinuteApproval.bulk_decide(request.user, approval_ids, action, remarks)
+        decided = sum(result['ok'] for result in results)
+        if decided:
+            messages.success(request, f"{decided} minute(s) {MinuteApproval.BULK_ACTIONS[action].lower()}.")
+        if decided < len(results):
+            messages.warning(request, f"{len(results) - decided} minute(s) skipped: no longer waiting on you.")
+    return redirect('approver:pending_minutes')
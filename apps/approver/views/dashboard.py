@@ -1,7 +1,7 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Q
-from apps.minute.models import MinuteApproval
+from apps.minute.models import Minute
+from apps.approver.models import ApproverCounter
 
 @login_required
 def dashboard(request):
@@ -10,35 +10,24 @@ def dashboard(request):
 
     Displays:
     - List of pending minutes assigned to the logged-in approver.
-    - Summary statistics of approval tasks.
+    - Summary statistics of approval tasks, read from the materialized ApproverCounter row.
     """
     user = request.user
 
-    # Aggregate statistics for dashboard summary
-    stats = MinuteApproval.objects.filter(approver=user).aggregate(
-        total_pending=Count('id', filter=Q(status='Pending', current_approver=True)),
-        total_approved=Count('id', filter=Q(status='Approved')),
-        total_rejected=Count('id', filter=Q(status='Rejected'))
-    )
+    # Summary statistics are maintained by the workflow; one primary-key lookup
+    counters = ApproverCounter.objects.filter(user=user).first() or ApproverCounter(user=user)
 
-    # Retrieve pending approvals efficiently
-    pending_approvals = (
-        MinuteApproval.objects.filter(
-            approver=user,
-            current_approver=True,
-            status='Pending'
-        )
-        .select_related('minute')  # Use select_related only for 'minute' to avoid conflicts
-        .prefetch_related('minute__created_by')  # Prefetch related user data for efficiency
-        .order_by('-minute__created_at')
-    )
+    # Minutes waiting on this user: one range read on the (current_approver, created_at) index
+    pending_minutes = Minute.inbox_for(user).select_related('created_by')
 
     # Context for template
     context = {
-        'pending_approvals': pending_approvals,
-        'total_pending': stats['total_pending'],
-        'total_approved': stats['total_approved'],
-        'total_rejected': stats['total_rejected'],
+        'pending_minutes': pending_minutes,
+        'total_pending': counters.pending,
+        'total_approved': counters.approved,
+        'total_rejected': counters.rejected,
+        'total_returned': counters.returned,
+        'total_marked': counters.marked,
     }
 
     return render(request, 'approver/dashboard.html', context)
@@ -1,51 +1,139 @@
+from datetime import date, datetime
+
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from apps.minute.models import Minute, MinuteApproval
-from apps.approval_chain.models import Approver
+from django.db.models import Exists, OuterRef, Prefetch, Q, prefetch_related_objects
+from django.utils.timezone import make_aware
+from apps.minute.models import ColdMinute, ColdMinuteApproval, Minute, MinuteApproval
+from apps.departments.models import Department
+from apps.approver.models import ArchiveFacetRollup
+from utils.fragment_cache import cached_fragment_ids
+from utils.pagination import keyset_paginate_merged
 
-@login_required
-def department_archive(request):
+ARCHIVE_PAGE_SIZE = 25
+
+# Each tier of archived minutes with the model of its approval records
+ARCHIVE_TIERS = (
+    (Minute, MinuteApproval),
+    (ColdMinute, ColdMinuteApproval),
+)
+
+
+def visible_departments(user):
     """
-    Display all archived minutes where the current user:
-    1️⃣ Was an approver in the chain.
-    2️⃣ Belongs to the department of the minute.
+    Departments whose archive the user may browse:
+    superusers see every department, others see their own plus any they head or are dean of.
     """
+    if user.is_superuser:
+        return Department.objects.all()
 
-    user = request.user
-    user_department = user.department if hasattr(user, 'department') else None
+    condition = Q(head_of_department=user) | Q(dean=user)
+    if getattr(user, 'department_id', None):
+        condition |= Q(pk=user.department_id)
+    return Department.objects.filter(condition)
 
-    # ✅ Fetch archived minutes where the user was an approver
-    approver_minutes = Minute.objects.filter(
-        approval_chain__approvers__user=user,
-        status__in=['Approved', 'Rejected'],
-        archived=True
-    ).distinct()
 
-    # ✅ Fetch archived minutes where the minute belongs to the user's department
-    department_minutes = Minute.objects.filter(
-        department=user_department,
-        status__in=['Approved', 'Rejected'],
-        archived=True
-    ).distinct() if user_department else Minute.objects.none()
+def parse_archive_facets(params):
+    """
+    Read the selected facet values from the query string, ignoring malformed ones.
+    """
+    selected = {}
+    for facet in ('department', 'creator', 'approver'):
+        value = params.get(facet, '').strip()
+        if value.isdigit():
+            selected[facet] = int(value)
 
-    # ✅ Combine results (Avoid duplicates using `distinct()`)
-    archived_minutes = (approver_minutes | department_minutes).distinct()
+    status = params.get('status', '').strip()
+    if status in ('Approved', 'Rejected'):
+        selected['status'] = status
 
-    # ✅ Build context for archived minutes
-    minutes_with_approvers = []
-    for minute in archived_minutes:
-        approvals = MinuteApproval.objects.filter(minute=minute).select_related('approver').order_by('order')
-        approvers_status = []
-        for approver in minute.approval_chain.approvers.order_by('order'):
-            approval_entry = approvals.filter(approver=approver.user).first()
-            approvers_status.append({
-                'user': approver.user,
-                'user_full_name': approver.user.get_full_name() if approver.user else "Unknown User",
-                'status': approval_entry.status if approval_entry else 'Pending',
-                'action_time': approval_entry.action_time.strftime("%d-%b-%Y %H:%M") if approval_entry and approval_entry.action_time else "Pending",
-                'remarks': approval_entry.remarks if approval_entry else "No remarks provided",
-            })
+    month = params.get('month', '').strip()
+    try:
+        year, month_number = month.split('-')
+        selected['month'] = date(int(year), int(month_number), 1)
+    except ValueError:
+        pass
+
+    return selected
 
+
+def archive_queryset(model, approval_model, departments, selected):
+    """
+    The archived minutes of one tier in the given departments, narrowed by the selected facets.
+    """
+    archived_minutes = model.for_list(model.objects.filter(
+        archived=True,
+        archived_at__isnull=False,
+        department__in=departments,
+    )).select_related('created_by')
+
+    if 'department' in selected:
+        archived_minutes = archived_minutes.filter(department_id=selected['department'])
+    if 'status' in selected:
+        archived_minutes = archived_minutes.filter(status=selected['status'])
+    if 'creator' in selected:
+        archived_minutes = archived_minutes.filter(created_by_id=selected['creator'])
+    if 'month' in selected:
+        start = selected['month']
+        archived_minutes = archived_minutes.filter(
+            archived_at__gte=make_aware(datetime(start.year, start.month, 1)),
+            archived_at__lt=make_aware(datetime(start.year + start.month // 12, start.month % 12 + 1, 1)),
+        )
+    if 'approver' in selected:
+        archived_minutes = archived_minutes.filter(Exists(
+            approval_model.objects.filter(minute=OuterRef('pk'), approver_id=selected['approver'])
+        ))
+    return archived_minutes
+
+
+@login_required
+def department_archive(request):
+    """
+    Faceted, keyset-paginated browser over the archived minutes of the departments
+    visible to the current user.
+
+    Facets: status, department, month (archival month), creator and approver.
+    Facet counts come from the archive rollup tables; the rows themselves are one
+    index range read on (department, archived_at, id) per tier, merged, plus one prefetch
+    per tier for the approvers of the rows that are not in the fragment cache.
+    """
+    departments = visible_departments(request.user)
+    selected = parse_archive_facets(request.GET)
+
+    page = keyset_paginate_merged(
+        [archive_queryset(model, approval_model, departments, selected) for model, approval_model in ARCHIVE_TIERS],
+        ordering=('-archived_at', '-id'),
+        cursor=request.GET.get('cursor'),
+        per_page=ARCHIVE_PAGE_SIZE,
+    )
+
+    # Rows rendered from the fragment cache need no approvers; prefetch them for the rest only
+    cached = cached_fragment_ids('archive_row', page)
+    for model, approval_model in ARCHIVE_TIERS:
+        prefetch_related_objects(
+            [minute for minute in page if minute.pk not in cached and isinstance(minute, model)],
+            Prefetch(
+                'approvals',
+                queryset=approval_model.objects.select_related('approver').defer('remarks').order_by('order'),
+                to_attr='ordered_approvals',
+            ),
+        )
+
+    # ✅ Build context for archived minutes (approvers come from the prefetch, no per-row queries)
+    minutes_with_approvers = []
+    for minute in page:
+        if minute.pk in cached:
+            minutes_with_approvers.append({'minute': minute, 'approvers_status': []})
+            continue
+        approvers_status = [
+            {
+                'user': approval.approver,
+                'user_full_name': approval.approver.get_full_name() or approval.approver.username,
+                'status': approval.status,
+                'action_time': approval.action_time.strftime("%d-%b-%Y %H:%M") if approval.action_time else "Pending",
+            }
+            for approval in minute.ordered_approvals
+        ]
         minutes_with_approvers.append({
             'minute': minute,
             'approvers_status': approvers_status,
@@ -53,6 +141,9 @@ def department_archive(request):
 
     context = {
         'archived_minutes': minutes_with_approvers,
+        'page': page,
+        'facets': ArchiveFacetRollup.facet_counts(departments, selected),
+        'selected': selected,
     }
 
     return render(request, 'approver/department_archive.html', context)
@@ -9,6 +9,11 @@ from apps.approval_chain.models import Approver
 from django.contrib.auth import get_user_model
 from django.contrib import messages
 from django.http import JsonResponse
+from utils.performance import increment
+from utils.action_log_archive import minute_history
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 User = get_user_model()
@@ -55,8 +60,8 @@ def minute_details(request, pk):
         for approver in Approver.objects.filter(approval_chain=minute.approval_chain).order_by('order')
     ]
 
-    # Fetch action logs for audit trail
-    action_logs = MinuteActionLog.objects.filter(minute=minute).order_by('timestamp')
+    # Fetch action logs for audit trail, exported entries included
+    action_logs = minute_history(minute)
 
     # Prepare context for the template
     context = {
@@ -80,7 +85,7 @@ def handle_post_request(request, minute, current_approval):
     target_user_id = request.POST.get('target_user')
 
     # Debugging logs
-    logger.debug(f"Received action: {action}, Remarks: {remarks}, Target User ID: {target_user_id}")
+    logger.debug(f"Received action: {action}, Target User ID: {target_user_id}")
 
     try:
         # Validate action and remarks
@@ -108,7 +113,6 @@ def handle_post_request(request, minute, current_approval):
 
         # Log the action
         log_minute_action(minute, action, request.user, target_user, remarks)
-        logger.debug(f"Remarks received in POST request: {remarks}")
 
         # Provide success feedback
         messages.success(request, f"Action '{action.replace('_', ' ').title()}' performed successfully.")
@@ -180,7 +184,6 @@ def log_minute_action(minute, action, performed_by, target_user=None, remarks=""
         remarks=remarks or f"{action.capitalize()} action performed by {performed_by.get_full_name()}",
     )
 
-    # For debugging/logging the creation process
-    print(f"Action Log Created: {log_entry}")
+    increment('minute_actions_logged', action=action)
 
     return log_entry
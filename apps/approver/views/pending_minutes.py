@@ -2,16 +2,16 @@
 
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
+from django.db.models import OuterRef, Q, Subquery
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from apps.minute.models import MinuteApproval
+from apps.minute.models import Minute, MinuteApproval
 from datetime import datetime
 
 @login_required
 def pending_minutes(request):
     """
     View to display all pending minutes for the logged-in approver.
-    Provides search, filter, and pagination functionality.
+    Provides search, filter, and pagination functionality, and multi-select for bulk actions.
     """
     user = request.user
     query = request.GET.get('query', '').strip()  # Search query for minute title
@@ -19,29 +19,30 @@ def pending_minutes(request):
     start_date = request.GET.get('start_date', '').strip()  # Filter by start date
     end_date = request.GET.get('end_date', '').strip()  # Filter by end date
 
-    # Base query: Pending minutes where the user is the current approver
-    approvals = MinuteApproval.objects.filter(
-        approver=user,
-        current_approver=True,
-        status='Pending'
-    ).select_related('minute__created_by').order_by('-minute__created_at')
+    # Base query: Pending minutes where the user is the current approver (inbox index),
+    # with the user's approval record for the bulk actions (unique (minute, approver) index)
+    minutes = Minute.for_list(Minute.inbox_for(user)).select_related('created_by').annotate(
+        approval_id=Subquery(
+            MinuteApproval.objects.filter(minute=OuterRef('pk'), approver=user, current_approver=True).values('pk')[:1]
+        )
+    )
 
     # Apply search and filters
     if query:
-        approvals = approvals.filter(minute__title__icontains=query)
+        minutes = minutes.filter(title__icontains=query)
     if submitter:
-        approvals = approvals.filter(minute__created_by__username__icontains=submitter)
+        minutes = minutes.filter(created_by__username__icontains=submitter)
     if start_date and end_date:
         try:
             # Convert string dates to datetime objects
             start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
             end_date_obj = datetime.strptime(end_date, "%Y-%m-%d")
-            approvals = approvals.filter(minute__created_at__date__range=[start_date_obj, end_date_obj])
+            minutes = minutes.filter(created_at__date__range=[start_date_obj, end_date_obj])
         except ValueError:
             pass  # Ignore invalid date formats
 
     # Paginate results (10 per page)
-    paginator = Paginator(approvals, 10)
+    paginator = Paginator(minutes, 10)
     page_number = request.GET.get('page')
     try:
         page_obj = paginator.get_page(page_number)
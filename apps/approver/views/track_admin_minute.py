@@ -1,13 +1,19 @@
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from apps.minute.models import Minute, MinuteActionLog, MinuteApproval
 from apps.approval_chain.models import Approver, ApprovalChain
 from django.http import HttpResponse
 from io import BytesIO
 from django.template.loader import get_template
 from xhtml2pdf import pisa
+from django.utils.functional import SimpleLazyObject
 from django.utils.timezone import now
 from django.http import HttpResponseNotFound
+from utils.performance import increment, timed
+from utils.tiering import minute_or_404
+from utils.action_log_archive import minute_history
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 @login_required
@@ -15,37 +21,40 @@ def track_admin_minute(request, pk):
     """
     View to track the details of a specific minute, including its approval chain,
     comments/remarks, and full action history.
-    Handles both in-progress and archived minutes.
+    Handles both in-progress and archived minutes, including those moved to the cold tier.
     """
     # Fetch the minute and check its status
-    minute = get_object_or_404(Minute, pk=pk)
+    minute = minute_or_404(pk)
 
     approval_chain = minute.approval_chain
     if not approval_chain:
         return HttpResponseNotFound("The approval chain for this minute does not exist.")
 
-    approvals = MinuteApproval.objects.filter(minute=minute).select_related('approver').order_by('order')
+    approvals = minute.approvals.select_related('approver').order_by('order')
     if not approvals.exists():
         logger.warning(f"No MinuteApproval entries found for minute ID {minute.pk}")
 
-    action_logs = MinuteActionLog.objects.filter(minute=minute).order_by('timestamp')
-    return_to_history = action_logs.filter(action='return-to')
+    # Lazy: on a cached fragment hit the logs and approver table are never queried.
+    # The history includes the entries exported from the database by archive_action_logs.
+    action_logs = SimpleLazyObject(lambda: minute_history(minute))
+    return_to_history = SimpleLazyObject(lambda: [log for log in action_logs if log.action == 'return-to'])
+
+    def build_approvers_status():
+        approvals_by_user = {approval.approver_id: approval for approval in approvals}
+        approvers_status = []
+        for approver in approval_chain.approvers.select_related('user').order_by('order'):
+            approval_entry = approvals_by_user.get(approver.user_id)
+            approvers_status.append({
+                'user': approver.user,
+                'status': approval_entry.status if approval_entry else 'Pending',
+                'action_time': approval_entry.action_time if approval_entry else None,
+                'remarks': approval_entry.remarks if approval_entry and approval_entry.remarks else "No remarks provided",
+                'is_current': approval_entry and approval_entry.current_approver,
+            })
+        increment('admin_track_approvers_rendered', len(approvers_status))
+        return approvers_status
 
-    # Build approvers' status context
-    approvers_status = []
-    for approver in approval_chain.approvers.order_by('order'):
-        approval_entry = approvals.filter(approver=approver.user).first()
-        print(f"Processing Approver: {approver.user.username}")  # Debugging log
-        print(f"Approval Entry: {approval_entry}")  # Debugging log
-        if approval_entry:
-            print(f"Remarks for Approver {approver.user.username}: {approval_entry.remarks}")  # Debugging log
-        approvers_status.append({
-            'user': approver.user,
-            'status': approval_entry.status if approval_entry else 'Pending',
-            'action_time': approval_entry.action_time if approval_entry else None,
-            'remarks': approval_entry.remarks if approval_entry and approval_entry.remarks else "No remarks provided",
-            'is_current': approval_entry and approval_entry.current_approver,
-        })
+    approvers_status = SimpleLazyObject(build_approvers_status)
 
     # Determine if the minute is archived
     is_archived = minute.status in ['Approved', 'Rejected']
@@ -74,7 +83,8 @@ def generate_pdf(template_path, context):
     template = get_template(template_path)
     html = template.render(context)
     response = BytesIO()
-    pdf = pisa.pisaDocument(BytesIO(html.encode('UTF-8')), response)
+    with timed('pdf'):
+        pdf = pisa.pisaDocument(BytesIO(html.encode('UTF-8')), response)
 
     if not pdf.err:
         response = HttpResponse(response.getvalue(), content_type='application/pdf')
@@ -1,10 +1,18 @@
 from django.contrib import admin
-from .models import Minute, MinuteApproval
+from .models import ColdMinute, Minute, MinuteApproval
 from .forms import MinuteForm, MinuteApprovalForm
 from django.urls import reverse
 from django.utils.html import format_html
 
 
+def is_changelist(request, model):
+    """
+    Whether the request is for the admin changelist of the model.
+    """
+    match = request.resolver_match
+    return match is not None and match.url_name == f"{model._meta.app_label}_{model._meta.model_name}_changelist"
+
+
 @admin.register(Minute)
 class MinuteAdmin(admin.ModelAdmin):
     """
@@ -12,7 +20,8 @@ class MinuteAdmin(admin.ModelAdmin):
     """
     list_display = ("title", "created_by", "status", "created_at", "unique_id", "approval_chain_link")
     list_filter = ("status", "created_at", "created_by", "approval_chain")
-    search_fields = ("title", "subject", "description", "unique_id", "created_by__username", "approval_chain__name")
+    # The description is stored compressed and cannot be searched in the database
+    search_fields = ("title", "subject", "unique_id", "created_by__username", "approval_chain__name")
     ordering = ("-created_at",)
     readonly_fields = ("unique_id", "created_at", "status", "approval_chain")
     form = MinuteForm
@@ -29,8 +38,12 @@ class MinuteAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """
         Optimize queryset to prevent multiple queries when fetching related fields.
+        The changelist only loads the columns it displays.
         """
-        return super().get_queryset(request).select_related("created_by", "approval_chain")
+        queryset = super().get_queryset(request).select_related("created_by", "approval_chain")
+        if is_changelist(request, self.model):
+            queryset = Minute.for_list(queryset)
+        return queryset
 
     def approval_chain_link(self, obj):
         """
@@ -72,7 +85,7 @@ class MinuteApprovalAdmin(admin.ModelAdmin):
     """
     list_display = ("minute", "approval_chain", "approver", "status", "action", "action_time", "updated_at")
     list_filter = ("status", "action", "approval_chain", "action_time", "updated_at")
-    search_fields = ("minute__title", "approval_chain__name", "approver__username", "remarks")
+    search_fields = ("minute__title", "approval_chain__name", "approver__username")
     ordering = ("-updated_at",)
     readonly_fields = ("minute", "approval_chain", "approver", "action_time", "updated_at")
     form = MinuteApprovalForm
@@ -89,8 +102,14 @@ class MinuteApprovalAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """
         Optimize queryset to avoid unnecessary queries.
+        The changelist skips the remarks and the long text fields of the minutes.
         """
-        return super().get_queryset(request).select_related("minute", "approval_chain", "approver")
+        queryset = super().get_queryset(request).select_related("minute", "approval_chain", "approver")
+        if is_changelist(request, self.model):
+            queryset = queryset.defer(
+                "remarks", "minute__subject", "minute__description", "minute__description_page_offsets"
+            )
+        return queryset
 
     def has_add_permission(self, request):
         """
@@ -113,3 +132,32 @@ class MinuteApprovalAdmin(admin.ModelAdmin):
         if obj and obj.status in ['Approved', 'Rejected']:
             readonly += ['remarks', 'action']
         return readonly
+
+
+@admin.register(ColdMinute)
+class ColdMinuteAdmin(admin.ModelAdmin):
+    """
+    Read-only admin for minutes moved to the cold tier by archive tiering.
+    """
+    list_display = ("title", "created_by", "status", "archived_at", "moved_at", "unique_id")
+    list_filter = ("status", "archived_at", "moved_at")
+    search_fields = ("title", "subject", "unique_id", "created_by__username")
+    ordering = ("-archived_at",)
+
+    def get_queryset(self, request):
+        """
+        The changelist only loads the columns it displays.
+        """
+        queryset = super().get_queryset(request).select_related("created_by")
+        if is_changelist(request, self.model):
+            queryset = ColdMinute.for_list(queryset).only(*ColdMinute.LIST_FIELDS, "moved_at")
+        return queryset
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.4 on 2026-10-19 11:59
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_archived_at(apps, schema_editor):
+    """
+    Existing archived minutes were last touched when they were archived.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    Minute.objects.filter(archived=True, archived_at__isnull=True).update(
+        archived_at=F("updated_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0005_alter_approvalchain_minute"),
+        ("departments", "0003_department_dean"),
+        ("minute", "0010_minute_archived_minute_department_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minute",
+            name="archived_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Timestamp of when the minute was archived.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_archived_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="minute",
+            index=models.Index(
+                condition=models.Q(("archived", True)),
+                fields=["department", "-archived_at", "-id"],
+                name="minute_archive_dept_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_current_approver(apps, schema_editor):
+    """
+    Point every in-flight minute at its pending current approver.
+    """
+    Minute = apps.get_model("minute", "Minute")
+    MinuteApproval = apps.get_model("minute", "MinuteApproval")
+    current = MinuteApproval.objects.filter(
+        current_approver=True, status="Pending"
+    ).values_list("minute_id", "approver_id", "updated_at")
+    for minute_id, approver_id, since in current.iterator():
+        Minute.objects.filter(pk=minute_id).update(
+            current_approver_id=approver_id, current_since=since
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0005_alter_approvalchain_minute"),
+        ("departments", "0003_department_dean"),
+        ("minute", "0011_minute_archived_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minute",
+            name="current_approver",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="Denormalized pointer to the approver the minute is currently waiting on.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="inbox_minutes",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="minute",
+            name="current_since",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="Timestamp of when the current approver was assigned.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_current_approver, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="minute",
+            index=models.Index(
+                fields=["current_approver", "created_at"], name="minute_inbox_idx"
+            ),
+        ),
+    ]
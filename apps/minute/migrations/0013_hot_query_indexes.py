@@ -0,0 +1,44 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0006_hot_query_indexes"),
+        ("departments", "0003_department_dean"),
+        ("minute", "0012_minute_current_approver_minute_current_since_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="minute",
+            index=models.Index(
+                fields=["status", "archived", "updated_at"], name="minute_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="minute",
+            index=models.Index(
+                fields=["created_by", "archived"], name="minute_creator_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="minute",
+            index=models.Index(
+                condition=models.Q(("archived", False)),
+                fields=["-created_at"],
+                name="minute_inflight_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="minuteapproval",
+            index=models.Index(
+                fields=["approver", "current_approver", "status"],
+                name="approval_approver_state_idx",
+            ),
+        ),
+    ]
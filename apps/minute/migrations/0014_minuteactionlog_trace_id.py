@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0013_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minuteactionlog",
+            name="trace_id",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="Trace of the request or job that performed the action, to follow it through the logs.",
+                max_length=32,
+            ),
+        ),
+    ]
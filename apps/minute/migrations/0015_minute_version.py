@@ -0,0 +1,22 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0014_minuteactionlog_trace_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minute",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1,
+                editable=False,
+                help_text="Incremented on every change to the minute or its workflow; keys cached fragments.",
+            ),
+        ),
+    ]
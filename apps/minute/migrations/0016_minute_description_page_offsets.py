@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:05
+
+from django.db import migrations, models
+
+from utils.pagination import text_page_offsets
+
+WORDS_PER_PAGE = 200
+BATCH_SIZE = 500
+
+
+def compute_page_offsets(apps, schema_editor):
+    Minute = apps.get_model("minute", "Minute")
+    batch = []
+    for minute in Minute.objects.only("id", "description").iterator(chunk_size=BATCH_SIZE):
+        minute.description_page_offsets = text_page_offsets(minute.description, WORDS_PER_PAGE)
+        batch.append(minute)
+        if len(batch) == BATCH_SIZE:
+            Minute.objects.bulk_update(batch, ["description_page_offsets"])
+            batch = []
+    Minute.objects.bulk_update(batch, ["description_page_offsets"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0015_minute_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minute",
+            name="description_page_offsets",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                editable=False,
+                help_text="Character offsets at which the pages of the description start; computed on save.",
+            ),
+        ),
+        migrations.RunPython(compute_page_offsets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:40
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 200
+BATCH_SIZE = 500
+
+
+def compute_excerpts(apps, schema_editor):
+    Minute = apps.get_model("minute", "Minute")
+    batch = []
+    for minute in Minute.objects.only("id", "description").iterator(chunk_size=BATCH_SIZE):
+        minute.excerpt = Truncator(" ".join(minute.description.split())).chars(EXCERPT_LENGTH)
+        batch.append(minute)
+        if len(batch) == BATCH_SIZE:
+            Minute.objects.bulk_update(batch, ["excerpt"])
+            batch = []
+    Minute.objects.bulk_update(batch, ["excerpt"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0016_minute_description_page_offsets"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="minute",
+            name="excerpt",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Start of the description shown by list pages; computed on save.",
+                max_length=200,
+            ),
+        ),
+        migrations.RunPython(compute_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,152 @@
+# Generated by Django 5.1.4 on 2026-10-19 15:10
+# Existing rows stay readable as they are; `manage.py compress_text_fields` compresses them in chunks.
+
+import utils.compressed_fields
+from django.db import migrations, transaction
+
+# Rows copied per transaction into the new bytea columns on PostgreSQL
+BATCH_SIZE = 5000
+
+
+def description_field():
+    return utils.compressed_fields.CompressedTextField(
+        help_text="Detailed description of the minute."
+    )
+
+
+def action_log_remarks_field():
+    return utils.compressed_fields.CompressedTextField(
+        blank=True,
+        help_text="Optional remarks or comments associated with the action.",
+        null=True,
+    )
+
+
+def approval_remarks_field():
+    return utils.compressed_fields.CompressedTextField(
+        blank=True,
+        help_text="Optional remarks provided by the approver.",
+        null=True,
+    )
+
+
+FIELDS = [
+    ("minute", "description", description_field),
+    ("minuteactionlog", "remarks", action_log_remarks_field),
+    ("minuteapproval", "remarks", approval_remarks_field),
+]
+
+
+def copy_to_bytea(schema_editor, table, column):
+    """
+    Move a PostgreSQL text column to bytea without rewriting the table under an
+    ACCESS EXCLUSIVE lock: add a bytea column, keep it in step with a trigger while
+    the existing rows are copied with convert_to() in id-ordered batches, then swap
+    the two columns in one short transaction. A plain `USING column::bytea` cast
+    would also read backslashes in the text as escapes.
+    """
+    execute = schema_editor.execute
+    staging = f"{column}_bytes"
+    function = f"{table}_{column}_to_bytes"
+
+    execute(f'ALTER TABLE "{table}" ADD COLUMN "{staging}" bytea NULL')
+    execute(
+        f"CREATE FUNCTION \"{function}\"() RETURNS trigger LANGUAGE plpgsql AS $$ "
+        f"BEGIN NEW.\"{staging}\" := convert_to(NEW.\"{column}\", 'UTF8'); RETURN NEW; END $$"
+    )
+    execute(
+        f'CREATE TRIGGER "{function}" BEFORE INSERT OR UPDATE OF "{column}" ON "{table}" '
+        f'FOR EACH ROW EXECUTE FUNCTION "{function}"()'
+    )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN("id"), MAX("id") FROM "{table}"')
+        lowest, highest = cursor.fetchone()
+        start = lowest or 0
+        while highest is not None and start <= highest:
+            with transaction.atomic(using=schema_editor.connection.alias):
+                cursor.execute(
+                    f'UPDATE "{table}" SET "{staging}" = convert_to("{column}", \'UTF8\') '
+                    f'WHERE "id" >= %s AND "id" < %s',
+                    [start, start + BATCH_SIZE],
+                )
+            start += BATCH_SIZE
+
+    with transaction.atomic(using=schema_editor.connection.alias):
+        execute(f'DROP TRIGGER "{function}" ON "{table}"')
+        execute(f'DROP FUNCTION "{function}"()')
+        execute(f'ALTER TABLE "{table}" DROP COLUMN "{column}"')
+        execute(f'ALTER TABLE "{table}" RENAME COLUMN "{staging}" TO "{column}"')
+
+
+def set_not_null(schema_editor, table, column):
+    """
+    SET NOT NULL without holding the exclusive lock for a full scan: a validated
+    CHECK constraint lets PostgreSQL skip it.
+    """
+    execute = schema_editor.execute
+    constraint = f"{table}_{column}_not_null"
+    execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{constraint}" CHECK ("{column}" IS NOT NULL) NOT VALID')
+    execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{constraint}"')
+    execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET NOT NULL')
+    execute(f'ALTER TABLE "{table}" DROP CONSTRAINT "{constraint}"')
+
+
+def compressed_field(model, name, factory):
+    field = factory()
+    field.set_attributes_from_name(name)
+    field.model = model
+    return field
+
+
+def to_binary_columns(apps, schema_editor):
+    for model_name, name, factory in FIELDS:
+        model = apps.get_model("minute", model_name)
+        old_field = model._meta.get_field(name)
+        new_field = compressed_field(model, name, factory)
+        if schema_editor.connection.vendor != "postgresql":
+            schema_editor.alter_field(model, old_field, new_field)
+            continue
+        copy_to_bytea(schema_editor, model._meta.db_table, old_field.column)
+        if not new_field.null:
+            set_not_null(schema_editor, model._meta.db_table, old_field.column)
+
+
+def to_text_columns(apps, schema_editor):
+    """
+    Back to text columns. Values compressed since the forward migration are not
+    valid UTF-8 and make PostgreSQL refuse the conversion.
+    """
+    for model_name, name, factory in FIELDS:
+        model = apps.get_model("minute", model_name)
+        old_field = model._meta.get_field(name)
+        new_field = compressed_field(model, name, factory)
+        if schema_editor.connection.vendor != "postgresql":
+            schema_editor.alter_field(model, new_field, old_field)
+            continue
+        schema_editor.execute(
+            f'ALTER TABLE "{model._meta.db_table}" ALTER COLUMN "{old_field.column}" '
+            f'TYPE text USING convert_from("{old_field.column}", \'UTF8\')'
+        )
+
+
+class Migration(migrations.Migration):
+
+    # The PostgreSQL copy commits batch by batch
+    atomic = False
+
+    dependencies = [
+        ("minute", "0017_minute_excerpt"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(to_binary_columns, to_text_columns, elidable=False),
+            ],
+            state_operations=[
+                migrations.AlterField(model_name=model_name, name=name, field=factory())
+                for model_name, name, factory in FIELDS
+            ],
+        ),
+    ]
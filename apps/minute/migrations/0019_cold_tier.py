@@ -0,0 +1,423 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:22
+
+import apps.minute.models
+import django.db.models.deletion
+import django.utils.timezone
+import utils.compressed_fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("approval_chain", "0006_hot_query_indexes"),
+        ("departments", "0003_department_dean"),
+        ("minute", "0018_compressed_text_fields"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ColdMinute",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "title",
+                    models.CharField(help_text="Title of the minute.", max_length=255),
+                ),
+                (
+                    "subject",
+                    models.TextField(
+                        blank=True, default="", help_text="Subject of the minute sheet."
+                    ),
+                ),
+                (
+                    "description",
+                    utils.compressed_fields.CompressedTextField(
+                        help_text="Detailed description of the minute."
+                    ),
+                ),
+                (
+                    "excerpt",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        editable=False,
+                        help_text="Start of the description shown by list pages; computed on save.",
+                        max_length=200,
+                    ),
+                ),
+                (
+                    "attachment",
+                    models.FileField(
+                        blank=True,
+                        help_text="Optional file attachment for the minute.",
+                        null=True,
+                        upload_to="minutes/",
+                        validators=[
+                            apps.minute.models.validate_file_extension,
+                            apps.minute.models.validate_file_size,
+                        ],
+                    ),
+                ),
+                (
+                    "sheet_number",
+                    models.PositiveIntegerField(
+                        default=1,
+                        help_text="Sheet number for multi-page minute sheets.",
+                    ),
+                ),
+                (
+                    "description_page_offsets",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        editable=False,
+                        help_text="Character offsets at which the pages of the description start; computed on save.",
+                    ),
+                ),
+                (
+                    "unique_id",
+                    models.CharField(
+                        blank=True,
+                        editable=False,
+                        help_text="Auto-generated unique ID for the minute.",
+                        max_length=50,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("Draft", "Draft"),
+                            ("Submitted", "Submitted"),
+                            ("Pending", "Pending"),
+                            ("Approved", "Approved"),
+                            ("Rejected", "Rejected"),
+                            ("Marked", "Marked"),
+                            ("Returned", "Returned"),
+                        ],
+                        default="Draft",
+                        help_text="Current status of the minute.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "archived",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Marks the minute as archived after final approval.",
+                    ),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Timestamp of when the minute was archived.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveIntegerField(
+                        default=1,
+                        editable=False,
+                        help_text="Incremented on every change to the minute or its workflow; keys cached fragments.",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        help_text="Timestamp of when the minute was created."
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(help_text="Timestamp of the last update."),
+                ),
+                (
+                    "moved_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Timestamp of when the minute moved to the cold tier.",
+                    ),
+                ),
+                (
+                    "approval_chain",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The approval chain the minute went through.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="approval_chain.approvalchain",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        help_text="The user who created this minute.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "department",
+                    models.ForeignKey(
+                        help_text="The department this minute sheet belongs to.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="departments.department",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Cold Minute",
+                "verbose_name_plural": "Cold Minutes",
+            },
+        ),
+        migrations.CreateModel(
+            name="ColdMinuteActionLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("approve", "Approve"),
+                            ("reject", "Reject"),
+                            ("mark-to", "Mark-To"),
+                            ("return-to", "Return-To"),
+                        ],
+                        help_text="The action performed on the minute.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "remarks",
+                    utils.compressed_fields.CompressedTextField(
+                        blank=True,
+                        help_text="Optional remarks or comments associated with the action.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "trace_id",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        default="",
+                        help_text="Trace of the request or job that performed the action, to follow it through the logs.",
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        help_text="The time when the action was performed."
+                    ),
+                ),
+                (
+                    "minute",
+                    models.ForeignKey(
+                        help_text="The cold minute this log entry belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="action_logs",
+                        to="minute.coldminute",
+                    ),
+                ),
+                (
+                    "performed_by",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The user who performed the action.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "target_user",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The target user for the action, if applicable (e.g., Mark-To, Return-To).",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Cold Minute Action Log",
+                "verbose_name_plural": "Cold Minute Action Logs",
+            },
+        ),
+        migrations.CreateModel(
+            name="ColdMinuteApproval",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "current_approver",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Indicates if the user is the current approver in the chain.",
+                    ),
+                ),
+                (
+                    "action",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("approve", "Approve"),
+                            ("reject", "Reject"),
+                            ("mark-to", "Mark-To"),
+                            ("return-to", "Return-To"),
+                        ],
+                        help_text="Action performed by the approver.",
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                (
+                    "remarks",
+                    utils.compressed_fields.CompressedTextField(
+                        blank=True,
+                        help_text="Optional remarks provided by the approver.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "action_time",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Timestamp of when the approver performed the action.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("Pending", "Pending"),
+                            ("Approved", "Approved"),
+                            ("Rejected", "Rejected"),
+                            ("Marked", "Marked"),
+                            ("Returned", "Returned"),
+                        ],
+                        default="Pending",
+                        help_text="Tracks the current status of the approval process.",
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "order",
+                    models.PositiveIntegerField(
+                        help_text="Sequence/order of this approver in the approval chain."
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        help_text="Timestamp when the approval record was created."
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        help_text="Timestamp when the approval record was last updated."
+                    ),
+                ),
+                (
+                    "approval_chain",
+                    models.ForeignKey(
+                        help_text="The approval chain linked to this minute.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="approval_chain.approvalchain",
+                    ),
+                ),
+                (
+                    "approver",
+                    models.ForeignKey(
+                        help_text="The user responsible for reviewing the minute.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "minute",
+                    models.ForeignKey(
+                        help_text="The cold minute this approval record belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="approvals",
+                        to="minute.coldminute",
+                    ),
+                ),
+                (
+                    "target_user",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The user to whom this minute was marked (for mark-to action).",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Cold Minute Approval",
+                "verbose_name_plural": "Cold Minute Approvals",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="coldminute",
+            index=models.Index(
+                fields=["department", "-archived_at", "-id"],
+                name="cold_minute_archive_dept_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="coldminute",
+            index=models.Index(
+                fields=["created_by", "-created_at", "-id"],
+                name="cold_minute_creator_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="coldminuteactionlog",
+            index=models.Index(fields=["timestamp"], name="cold_log_timestamp_idx"),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1.4 on 2026-10-19 16:05
+
+from datetime import datetime, timezone
+
+from django.db import migrations
+
+# Monthly partitions created ahead of the current month; `manage.py archive_action_logs` keeps them coming
+PRECREATE_MONTHS = 3
+
+
+def month_start(value):
+    value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_action_log(apps, schema_editor):
+    """
+    On PostgreSQL, turn the action log into a table partitioned by month of timestamp,
+    with one partition per month that has entries, the next PRECREATE_MONTHS and a default one.
+    The primary key has to include the partition key, so it becomes (id, timestamp); ids stay
+    unique through the identity column. Other backends keep the plain table.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    MinuteActionLog = apps.get_model("minute", "MinuteActionLog")
+    table = MinuteActionLog._meta.db_table
+    old_table = f"{table}_unpartitioned"
+    execute = schema_editor.execute
+
+    execute(f'ALTER TABLE "{table}" RENAME TO "{old_table}"')
+    execute(
+        f'CREATE TABLE "{table}" (LIKE "{old_table}" INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING STORAGE) '
+        f'PARTITION BY RANGE ("timestamp")'
+    )
+    execute(f'ALTER TABLE "{table}" ADD PRIMARY KEY ("id", "timestamp")')
+    execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN("timestamp") FROM "{old_table}"')
+        oldest = cursor.fetchone()[0]
+    current = month_start(datetime.now(timezone.utc))
+    month = month_start(oldest) if oldest else current
+    while month <= add_months(current, PRECREATE_MONTHS):
+        execute(
+            f'CREATE TABLE "{table}_y{month.year:04d}m{month.month:02d}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        )
+        month = add_months(month, 1)
+
+    execute(f'INSERT INTO "{table}" SELECT * FROM "{old_table}"')
+    execute(
+        f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+        f'COALESCE((SELECT MAX("id") FROM "{table}"), 0) + 1, false)'
+    )
+    execute(f'DROP TABLE "{old_table}"')
+
+    # Indexes and foreign keys under their usual names, now free; indexes cascade to the partitions
+    for sql in schema_editor._model_indexes_sql(MinuteActionLog):
+        execute(sql)
+    for field in MinuteActionLog._meta.local_fields:
+        if field.remote_field and field.db_constraint:
+            execute(schema_editor._create_fk_sql(MinuteActionLog, field, "_fk_%(to_table)s_%(to_column)s"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0019_cold_tier"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_action_log, migrations.RunPython.noop, elidable=False),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-19 11:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0020_partition_minuteactionlog"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="minute",
+            name="subject",
+            field=models.TextField(
+                blank=True, default="", help_text="Subject of the minute sheet."
+            ),
+        ),
+    ]
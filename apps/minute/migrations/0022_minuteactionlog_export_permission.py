@@ -0,0 +1,26 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:50
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("minute", "0021_alter_minute_subject"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="minuteactionlog",
+            options={
+                "permissions": [
+                    (
+                        "export_audit_log",
+                        "Can export the action history of any department",
+                    )
+                ],
+                "verbose_name": "Minute Action Log",
+                "verbose_name_plural": "Minute Action Logs",
+            },
+        ),
+    ]
@@ -1,10 +1,17 @@
+from collections import Counter
 from datetime import datetime
+from functools import wraps
 from django.db import models, transaction, connection
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.utils.timezone import now
 from django.apps import apps
-from django.db.models import Max, F
+from django.db.models import Case, F, Max, Q, Value, When
+from django.db.models.functions import Left
+from django.utils.text import Truncator
+from utils.compressed_fields import CompressedTextField, is_compressed
+from utils.pagination import TextPages, text_page_offsets
+from utils.tracing import current_trace_id
 import os
 import logging
 logger = logging.getLogger(__name__)
@@ -33,9 +40,20 @@ def validate_file_size(value):
         raise ValidationError("File size exceeds 10MB limit.")
 
 
-class Minute(models.Model):
+def batched_changes(method):
     """
-    Represents a document that goes through an approval workflow.
+    Write the change feed entries of a transition in one insert at its end (see ChangeEvent.batched).
+    """
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with apps.get_model('api', 'ChangeEvent').batched():
+            return method(*args, **kwargs)
+    return wrapper
+
+
+class AbstractMinute(models.Model):
+    """
+    The columns shared by live minutes and their cold copies (see ColdMinute).
     """
     STATUS_CHOICES = [
         ('Draft', 'Draft'),
@@ -54,7 +72,14 @@ class Minute(models.Model):
         default=""
     )
 
-    description = models.TextField(help_text="Detailed description of the minute.")
+    description = CompressedTextField(help_text="Detailed description of the minute.")
+    excerpt = models.CharField(
+        max_length=200,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Start of the description shown by list pages; computed on save."
+    )
     attachment = models.FileField(
         upload_to='minutes/',
         blank=True,
@@ -66,6 +91,93 @@ class Minute(models.Model):
         help_text="Sheet number for multi-page minute sheets.",
         default=1
     )
+    description_page_offsets = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        help_text="Character offsets at which the pages of the description start; computed on save."
+    )
+    unique_id = models.CharField(
+        max_length=50,
+        unique=True,
+        editable=False,
+        blank=True,
+        help_text="Auto-generated unique ID for the minute."
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='Draft',
+        help_text="Current status of the minute."
+    )
+    archived = models.BooleanField(
+        default=False,
+        help_text="Marks the minute as archived after final approval."
+    )
+    archived_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Timestamp of when the minute was archived."
+    )
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        help_text="Incremented on every change to the minute or its workflow; keys cached fragments."
+    )
+
+    # Words on one page of the minute sheet, the PDF and the description pages API
+    WORDS_PER_PAGE = 200
+
+    # Columns list pages display; description, subject, attachment and page offsets stay deferred
+    LIST_FIELDS = (
+        'title', 'unique_id', 'status', 'excerpt', 'department', 'created_by', 'approval_chain',
+        'created_at', 'updated_at', 'archived', 'archived_at', 'version',
+    )
+    EXCERPT_LENGTH = 200
+    SUBJECT_EXCERPT_LENGTH = 200
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def make_excerpt(cls, description):
+        """
+        The description on one line, cut at EXCERPT_LENGTH characters.
+        """
+        return Truncator(" ".join(description.split())).chars(cls.EXCERPT_LENGTH)
+
+    @classmethod
+    def for_list(cls, queryset=None):
+        """
+        Project minutes onto the columns list pages display. The subject is cut short
+        in the database and exposed as `subject_excerpt`, one character longer than
+        SUBJECT_EXCERPT_LENGTH so templates can tell it was cut (|truncatechars).
+        The description is only loaded by detail pages.
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.only(*cls.LIST_FIELDS).annotate(
+            subject_excerpt=Left('subject', cls.SUBJECT_EXCERPT_LENGTH + 1)
+        )
+
+    @property
+    def description_pages(self):
+        """
+        The pages of the description. Rows written without save() (bulk_create, update)
+        have no stored offsets and are paginated on the fly.
+        """
+        offsets = self.description_page_offsets
+        if not offsets and self.description.strip():
+            offsets = text_page_offsets(self.description, self.WORDS_PER_PAGE)
+        return TextPages(self.description, offsets)
+
+    def __str__(self):
+        return f"{self.title} ({self.unique_id})"
+
+
+class Minute(AbstractMinute):
+    """
+    Represents a document that goes through an approval workflow.
+    """
     department = models.ForeignKey(
         'departments.Department',
         on_delete=models.SET_NULL,
@@ -82,19 +194,6 @@ class Minute(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, help_text="Timestamp of when the minute was created.")
     updated_at = models.DateTimeField(auto_now=True, help_text="Timestamp of the last update.")
-    unique_id = models.CharField(
-        max_length=50,
-        unique=True,
-        editable=False,
-        blank=True,
-        help_text="Auto-generated unique ID for the minute."
-    )
-    status = models.CharField(
-        max_length=20,
-        choices=STATUS_CHOICES,
-        default='Draft',
-        help_text="Current status of the minute."
-    )
     approval_chain = models.OneToOneField(
         'approval_chain.ApprovalChain',
         on_delete=models.CASCADE,
@@ -103,30 +202,133 @@ class Minute(models.Model):
         related_name='linked_minute',
         help_text="Links the minute to its unique approval chain."
     )
-    archived = models.BooleanField(
-        default=False,
-        help_text="Marks the minute as archived after final approval."
+    current_approver = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='inbox_minutes',
+        help_text="Denormalized pointer to the approver the minute is currently waiting on."
     )
+    current_since = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Timestamp of when the current approver was assigned."
+    )
+
+    # Written only by the approval workflow (see MinuteApproval.save), never by a full save
+    WORKFLOW_FIELDS = ('current_approver', 'current_since', 'version')
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['department', '-archived_at', '-id'],
+                condition=models.Q(archived=True),
+                name='minute_archive_dept_idx'
+            ),
+            models.Index(fields=['current_approver', 'created_at'], name='minute_inbox_idx'),
+            models.Index(fields=['status', 'archived', 'updated_at'], name='minute_status_idx'),
+            models.Index(fields=['created_by', 'archived'], name='minute_creator_idx'),
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(archived=False),
+                name='minute_inflight_idx'
+            ),
+        ]
 
+    @transaction.atomic
     def archive(self, status):
         """
         Archive the minute by setting its status to 'Approved' or 'Rejected'.
         Ensures that archived=True is explicitly set.
+        The archive facet rollups are only updated, and webhook events only queued, the first time
+        a minute is archived, since the workflow may call archive() more than once for the same decision.
         """
         if status not in ['Approved', 'Rejected']:
             raise ValueError("Invalid status for archiving. Use 'Approved' or 'Rejected'.")
 
+        timestamp = now()
+        newly_archived = Minute.objects.filter(pk=self.pk, archived=False).update(
+            archived=True, archived_at=timestamp
+        )
+
         self.status = status
         self.archived = True  # ✅ Explicitly mark as archived
-        self.updated_at = now()
+        if newly_archived or not self.archived_at:
+            self.archived_at = timestamp
+        self.updated_at = timestamp
         self.save()
 
+        if newly_archived:
+            ArchiveFacetRollup = apps.get_model('approver', 'ArchiveFacetRollup')
+            ArchiveFacetRollup.record(self)
+            WebhookDelivery = apps.get_model('webhooks', 'WebhookDelivery')
+            WebhookDelivery.enqueue(self, f"minute.{status.lower()}")
+
+    @classmethod
+    @transaction.atomic
+    def archive_many(cls, minutes, status):
+        """
+        Archive several minutes with the same status in a few statements: the batched form of
+        archive(), with the same rollup, webhook and change feed bookkeeping for the minutes
+        archived for the first time. The instances are updated in place.
+        """
+        if status not in ['Approved', 'Rejected']:
+            raise ValueError("Invalid status for archiving. Use 'Approved' or 'Rejected'.")
+
+        timestamp = now()
+        minute_ids = [minute.pk for minute in minutes]
+        newly_archived = set(
+            cls.objects.select_for_update().filter(pk__in=minute_ids, archived=False).values_list('pk', flat=True)
+        )
+        cls.objects.filter(pk__in=minute_ids).update(
+            status=status,
+            archived=True,
+            archived_at=Case(
+                When(Q(pk__in=newly_archived) | Q(archived_at__isnull=True), then=Value(timestamp)),
+                default=F('archived_at'),
+            ),
+            updated_at=timestamp,
+            version=F('version') + 1,
+        )
+        for minute in minutes:
+            if minute.pk in newly_archived or not minute.archived_at:
+                minute.archived_at = timestamp
+            minute.status, minute.archived, minute.updated_at = status, True, timestamp
+        cls.record_changes(minute_ids)
+
+        newly_archived = [minute for minute in minutes if minute.pk in newly_archived]
+        if newly_archived:
+            ArchiveFacetRollup = apps.get_model('approver', 'ArchiveFacetRollup')
+            ArchiveFacetRollup.record_many(newly_archived)
+            WebhookDelivery = apps.get_model('webhooks', 'WebhookDelivery')
+            WebhookDelivery.enqueue_many(newly_archived, f"minute.{status.lower()}")
+
+    @classmethod
+    def in_any_tier(cls, pk, fields=None):
+        """
+        The minute with the given id from the live table or, once archive tiering moved it, the
+        cold one, optionally loading only the given fields. Raises Minute.DoesNotExist when neither has it.
+        """
+        for model in (cls, ColdMinute):
+            minutes = model.objects.all() if fields is None else model.objects.only(*fields)
+            minute = minutes.filter(pk=pk).first()
+            if minute is not None:
+                return minute
+        raise cls.DoesNotExist(f"No minute with id {pk}.")
+
     def _get_next_id(self):
         """
         Safely fetch the next available ID by querying the database.
+        Minutes moved to the cold tier keep their ids, so those are never handed out again.
         """
         with connection.cursor() as cursor:
-            cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM minute_minute;")
+            cursor.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM "
+                "(SELECT MAX(id) AS id FROM minute_minute UNION ALL SELECT MAX(id) FROM minute_coldminute);"
+            )
             next_id = cursor.fetchone()[0]
         return next_id
 
@@ -148,6 +350,8 @@ class Minute(models.Model):
         """
         Override save to ensure unique ID and handle sequence misalignment.
         Auto-create MinuteApproval records when linked to an ApprovalChain.
+        Every save of an existing minute moves its version on, invalidating cached fragments.
+        Every save lands in the change feed.
         """
         is_new = self.pk is None
 
@@ -162,24 +366,121 @@ class Minute(models.Model):
         if self.status == 'Submitted' and not self.approval_chain:
             raise ValidationError("A Minute must be linked to an approval chain before submission.")
 
+        # Page boundaries and the excerpt are computed once here, so pages and lists never read the whole text.
+        # A description still compressed as loaded is unchanged and keeps them.
+        deferred = self.get_deferred_fields()
+        update_fields = kwargs.get('update_fields')
+        description_changed = 'description' not in deferred and not is_compressed(self, 'description')
+        if description_changed and (update_fields is None or 'description' in update_fields):
+            self.description_page_offsets = text_page_offsets(self.description, self.WORDS_PER_PAGE)
+            self.excerpt = self.make_excerpt(self.description)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'description_page_offsets', 'excerpt'}
+
+        # A stale instance must not overwrite the workflow-maintained current approver pointer,
+        # and an instance loaded for a list only writes the columns it loaded
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.WORKFLOW_FIELDS
+                and field.attname not in deferred
+            ]
+
+        # The version moves on in the same UPDATE, and is read back so fragments rendered
+        # from this instance are keyed on the new one
+        updating = not self._state.adding
+        if updating:
+            self.version = F('version') + 1
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'version'}
+
         super().save(*args, **kwargs)
+        if updating:
+            self.refresh_from_db(fields=['version'])
+        Minute.record_changes([self.pk])
+
+        # Register the chain's approvers as participants whenever a chain gets linked
+        if self.approval_chain_id and self.approval_chain_id != getattr(self, '_participation_chain_id', None):
+            MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+            MinuteParticipation.sync_chain(self)
+            self._participation_chain_id = self.approval_chain_id
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the linked chain so save() only re-syncs participants when it changes.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._participation_chain_id = instance.__dict__.get('approval_chain_id')
+        return instance
+
+    @classmethod
+    def set_current_approver(cls, minute_id, approver_id):
+        """
+        Point the minute at the approver it is now waiting on.
+        """
+        cls.objects.filter(pk=minute_id).update(
+            current_approver_id=approver_id, current_since=now(), version=F('version') + 1
+        )
+        cls.record_changes([minute_id])
+
+    @classmethod
+    def clear_current_approver(cls, minute_id, approver_id):
+        """
+        Clear the pointer, but only if it still points at the given approver.
+        """
+        if cls.objects.filter(pk=minute_id, current_approver_id=approver_id).update(
+            current_approver=None, current_since=None, version=F('version') + 1
+        ):
+            cls.record_changes([minute_id])
+
+    @classmethod
+    def bump_version(cls, minute_id=None, approval_chain_id=None):
+        """
+        Invalidate the cached fragments of a minute, given by id or by its approval chain,
+        and tell sync clients it changed.
+        """
+        minutes = cls.objects.filter(pk=minute_id) if minute_id else cls.objects.filter(approval_chain_id=approval_chain_id)
+        minutes.update(version=F('version') + 1)
+        cls.record_changes([minute_id] if minute_id else minutes.values_list('pk', flat=True))
+
+    @classmethod
+    def record_changes(cls, minute_ids):
+        """
+        Append the minutes to the change feed (see apps.api.models.ChangeEvent).
+        """
+        ChangeEvent = apps.get_model('api', 'ChangeEvent')
+        ChangeEvent.record_pairs('minute', [(minute_id, minute_id) for minute_id in minute_ids])
+
+    @classmethod
+    def inbox_for(cls, user):
+        """
+        Minutes currently waiting on the given approver, newest first.
+        Served by the (current_approver, created_at) index.
+        """
+        return cls.objects.filter(current_approver=user).order_by('-created_at')
 
     def delete(self, *args, **kwargs):
         """
         Override delete to explicitly delete related ApprovalChain.
+        The deletion is fed to the creator and the participants by user, since the
+        minute and its participation rows no longer tell who may see it.
         """
+        ChangeEvent = apps.get_model('api', 'ChangeEvent')
+        MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+        minute_id = self.pk
+        viewers = {self.created_by_id, *MinuteParticipation.objects.filter(minute_id=minute_id).values_list('user_id', flat=True)}
         if self.approval_chain:
             self.approval_chain.delete()
         super().delete(*args, **kwargs)
-
-    def __str__(self):
-        return f"{self.title} ({self.unique_id})"
+        with ChangeEvent.batched():
+            for user_id in viewers:
+                ChangeEvent.record('minute', [minute_id], minute_id=minute_id, user_id=user_id)
 
 # Remaining part for `MinuteApproval` remains as previously corrected.
 
-class MinuteApproval(models.Model):
+class AbstractMinuteApproval(models.Model):
     """
-    Tracks the approval process for each approver in the chain.
+    The columns shared by live approval records and their cold copies (see ColdMinuteApproval).
     """
     ACTION_CHOICES = [
         ('approve', 'Approve'),
@@ -188,24 +489,6 @@ class MinuteApproval(models.Model):
         ('return-to', 'Return-To'),
     ]
 
-    minute = models.ForeignKey(
-        'minute.Minute',
-        on_delete=models.CASCADE,
-        related_name="approvals",
-        help_text="The minute document being tracked for approval."
-    )
-    approval_chain = models.ForeignKey(
-        'approval_chain.ApprovalChain',
-        on_delete=models.CASCADE,
-        related_name="minute_approvals",
-        help_text="The approval chain linked to this minute."
-    )
-    approver = models.ForeignKey(
-        User,
-        on_delete=models.CASCADE,
-        related_name="approvals",
-        help_text="The user responsible for reviewing the minute."
-    )
     current_approver = models.BooleanField(
         default=False,
         help_text="Indicates if the user is the current approver in the chain."
@@ -217,19 +500,11 @@ class MinuteApproval(models.Model):
         blank=True,
         help_text="Action performed by the approver."
     )
-    remarks = models.TextField(
+    remarks = CompressedTextField(
         null=True,
         blank=True,
         help_text="Optional remarks provided by the approver."
     )
-    target_user = models.ForeignKey(
-        User,
-        null=True,
-        blank=True,
-        on_delete=models.SET_NULL,
-        related_name='marked_minutes',
-        help_text="The user to whom this minute is marked (for mark-to action)."
-    )
     action_time = models.DateTimeField(
         null=True,
         blank=True,
@@ -247,6 +522,46 @@ class MinuteApproval(models.Model):
         default='Pending',
         help_text="Tracks the current status of the approval process."
     )
+    order = models.PositiveIntegerField(
+        null=False,
+        blank=False,
+        help_text="Sequence/order of this approver in the approval chain."
+    )
+
+    class Meta:
+        abstract = True
+
+
+class MinuteApproval(AbstractMinuteApproval):
+    """
+    Tracks the approval process for each approver in the chain.
+    """
+    minute = models.ForeignKey(
+        'minute.Minute',
+        on_delete=models.CASCADE,
+        related_name="approvals",
+        help_text="The minute document being tracked for approval."
+    )
+    approval_chain = models.ForeignKey(
+        'approval_chain.ApprovalChain',
+        on_delete=models.CASCADE,
+        related_name="minute_approvals",
+        help_text="The approval chain linked to this minute."
+    )
+    approver = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="approvals",
+        help_text="The user responsible for reviewing the minute."
+    )
+    target_user = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='marked_minutes',
+        help_text="The user to whom this minute is marked (for mark-to action)."
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text="Timestamp when the approval record was created."
@@ -256,12 +571,6 @@ class MinuteApproval(models.Model):
         help_text="Timestamp when the approval record was last updated."
     )
 
-    order = models.PositiveIntegerField(
-        null=False,
-        blank=False,
-        help_text="Sequence/order of this approver in the approval chain."
-    )
-
     class Meta:
         unique_together = ('minute', 'approver')
         constraints = [
@@ -271,19 +580,75 @@ class MinuteApproval(models.Model):
                 name='unique_current_approver_per_minute'
             )
         ]
+        indexes = [
+            models.Index(fields=['approver', 'current_approver', 'status'], name='approval_approver_state_idx'),
+        ]
         verbose_name = "Minute Approval"
         verbose_name_plural = "Minute Approvals"
 
     def __str__(self):
         return f"{self.minute.title} - {self.status} by {self.approver.username}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the loaded state so save() can move the approver's dashboard counters.
+        """
+        instance = super().from_db(db, field_names, values)
+        if 'status' in instance.__dict__ and 'current_approver' in instance.__dict__:
+            instance._saved_counter_state = (instance.status, instance.current_approver)
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Register the approver as a participant when the approval record is created,
+        keep the approver's dashboard counters in step with status transitions,
+        invalidate the minute's cached fragments and append the change to the change feed.
+        """
+        ApproverCounter = apps.get_model('approver', 'ApproverCounter')
+        is_new = self.pk is None
+
+        if is_new:
+            previous_state = None
+        elif hasattr(self, '_saved_counter_state'):
+            previous_state = self._saved_counter_state
+        else:
+            previous_state = MinuteApproval.objects.filter(pk=self.pk).values_list(
+                'status', 'current_approver'
+            ).first()
+
+        super().save(*args, **kwargs)
+        Minute.bump_version(self.minute_id)
+        ChangeEvent = apps.get_model('api', 'ChangeEvent')
+        ChangeEvent.record('approval', [self.pk], minute_id=self.minute_id)
+
+        # Keep the minute's current-approver pointer in step with this record
+        was_current = previous_state == ('Pending', True)
+        is_current = self.status == 'Pending' and self.current_approver
+        if is_current and not was_current:
+            Minute.set_current_approver(self.minute_id, self.approver_id)
+        elif was_current and not is_current:
+            Minute.clear_current_approver(self.minute_id, self.approver_id)
+
+        ApproverCounter.shift(
+            self.approver_id,
+            ApproverCounter.bucket_for(*previous_state) if previous_state else None,
+            ApproverCounter.bucket_for(self.status, self.current_approver),
+        )
+        self._saved_counter_state = (self.status, self.current_approver)
+
+        if is_new:
+            MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+            MinuteParticipation.record([self.approver_id], self.minute_id, 'approver')
+
     # Core business logic methods
 
     @transaction.atomic
+    @batched_changes
     def approve(self, remarks=None):
         from apps.approval_chain.models import Approver
 
-        logger.debug(f"Approving with remarks: {remarks}")
+        logger.debug(f"Approving: ID={self.id}")
 
         # Default remarks if none provided
         if not remarks:
@@ -337,6 +702,7 @@ class MinuteApproval(models.Model):
             logger.info(f"Minute archived: ID={self.minute.id}, Status=Approved")
 
     @transaction.atomic
+    @batched_changes
     def reject(self, remarks=None):
         from apps.approval_chain.models import Approver
 
@@ -349,7 +715,7 @@ class MinuteApproval(models.Model):
         self.action_time = now()
         self.current_approver = False
         self.save()
-        logger.info(f"Rejection saved: ID={self.id}, Remarks={self.remarks}")
+        logger.info(f"Rejection saved: ID={self.id}, Status={self.status}")
 
         MinuteActionLog.objects.create(
             minute=self.minute,
@@ -367,7 +733,172 @@ class MinuteApproval(models.Model):
         self.minute.archive('Rejected')
         logger.info(f"Minute archived: ID={self.minute.id}, Status=Rejected")
 
+    # Bulk decisions, for approvers with long queues
+
+    BULK_ACTIONS = {'approve': 'Approved', 'reject': 'Rejected'}
+    BULK_MAX_ITEMS = 200
+
+    @classmethod
+    @transaction.atomic
+    @batched_changes
+    def bulk_decide(cls, approver, approval_ids, action, remarks=None):
+        """
+        Approve or reject many of the approver's approval records at once: the batched form of
+        approve() and reject(), with the same effects. Ownership and current-approver status of
+        all records are checked with one query that locks them until commit, and the transitions
+        are written with a fixed number of statements whatever the number of records and of
+        next approvers.
+        Returns one result per requested id, in request order: {'id', 'ok': True, 'minute_id',
+        'status', 'archived'} for decided records, {'id', 'ok': False, 'error'} for the others.
+        """
+        Approver = apps.get_model('approval_chain', 'Approver')
+        if action not in cls.BULK_ACTIONS:
+            raise ValueError(f"Invalid bulk action {action!r}. Use 'approve' or 'reject'.")
+        status = cls.BULK_ACTIONS[action]
+        remarks = remarks or f"{status} without remarks"
+        approval_ids = list(dict.fromkeys(approval_ids))
+
+        approvals = {
+            approval.pk: approval
+            for approval in cls.objects.select_for_update(of=('self',)).select_related('minute').filter(
+                pk__in=approval_ids, approver=approver
+            )
+        }
+        entries = {
+            entry.approval_chain_id: entry
+            for entry in Approver.objects.filter(
+                approval_chain_id__in={approval.approval_chain_id for approval in approvals.values()}, user=approver
+            )
+        }
+        results, decided = {}, []
+        for approval_id in approval_ids:
+            approval = approvals.get(approval_id)
+            if approval is None:
+                results[approval_id] = {'id': approval_id, 'ok': False, 'error': "Approval not found."}
+            elif approval.status != 'Pending' or not approval.current_approver:
+                results[approval_id] = {
+                    'id': approval_id, 'ok': False, 'error': "You are not the current approver for this minute."
+                }
+            elif approval.approval_chain_id not in entries:
+                results[approval_id] = {'id': approval_id, 'ok': False, 'error': "You are not in this approval chain."}
+            else:
+                decided.append(approval)
+
+        archived = cls._apply_bulk_decision(approver, decided, entries, action, status, remarks) if decided else set()
+        for approval in decided:
+            results[approval.pk] = {
+                'id': approval.pk, 'ok': True, 'minute_id': approval.minute_id,
+                'status': status, 'archived': approval.minute_id in archived,
+            }
+        return [results[approval_id] for approval_id in approval_ids]
+
+    @classmethod
+    def _apply_bulk_decision(cls, approver, decided, entries, action, status, remarks):
+        """
+        Write the transitions of bulk_decide(). Returns the ids of the minutes archived.
+        """
+        Approver = apps.get_model('approval_chain', 'Approver')
+        ApproverCounter = apps.get_model('approver', 'ApproverCounter')
+        MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+        ChangeEvent = apps.get_model('api', 'ChangeEvent')
+
+        timestamp = now()
+        minutes = {approval.minute_id: approval.minute for approval in decided}
+
+        # The decided records, their chain entries and the minutes' current-approver pointers
+        cls.objects.filter(pk__in=[approval.pk for approval in decided]).update(
+            status=status, action=action, remarks=remarks, action_time=timestamp,
+            current_approver=False, updated_at=timestamp,
+        )
+        ApproverCounter.shift(approver.pk, 'pending', status.lower(), count=len(decided))
+        Approver.objects.filter(pk__in=[entries[approval.approval_chain_id].pk for approval in decided]).update(
+            status=status, is_current=False
+        )
+        Minute.objects.filter(pk__in=minutes, current_approver=approver).update(
+            current_approver=None, current_since=None, version=F('version') + 1
+        )
+        trace_id = current_trace_id() or ''
+        MinuteActionLog.objects.bulk_create([
+            MinuteActionLog(minute_id=minute_id, action=action, performed_by=approver, remarks=remarks, trace_id=trace_id)
+            for minute_id in minutes
+        ])
+        MinuteParticipation.record_pairs([(approver.pk, minute_id) for minute_id in minutes], 'actor', timestamp)
+        ChangeEvent.record_pairs('approval', [(approval.pk, approval.minute_id) for approval in decided])
+
+        # Approved records hand over to the next pending approver of their chain, if any
+        handovers = {}
+        if action == 'approve':
+            for candidate in Approver.objects.filter(
+                approval_chain_id__in=entries, status='Pending'
+            ).order_by('approval_chain_id', 'order'):
+                entry = entries[candidate.approval_chain_id]
+                if candidate.order > entry.order and candidate.approval_chain_id not in handovers:
+                    handovers[candidate.approval_chain_id] = candidate
+        handovers = {
+            approval.minute_id: (approval, handovers[approval.approval_chain_id])
+            for approval in decided if approval.approval_chain_id in handovers
+        }
+        if handovers:
+            cls._hand_over(handovers, timestamp)
+
+        finals = [minute for minute_id, minute in minutes.items() if minute_id not in handovers]
+        if finals:
+            Minute.archive_many(finals, status)
+        return {minute.pk for minute in finals}
+
+    @classmethod
+    def _hand_over(cls, handovers, timestamp):
+        """
+        Make the next approver current for each minute in {minute_id: (decided approval, next Approver)},
+        creating their approval records where missing.
+        """
+        Approver = apps.get_model('approval_chain', 'Approver')
+        ApproverCounter = apps.get_model('approver', 'ApproverCounter')
+        MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+        ChangeEvent = apps.get_model('api', 'ChangeEvent')
+
+        existing = {
+            (approval.minute_id, approval.approver_id): approval
+            for approval in cls.objects.filter(
+                minute_id__in=handovers, approver_id__in={entry.user_id for _, entry in handovers.values()}
+            )
+        }
+        shifts = Counter()
+        created, current = [], []
+        for minute_id, (decided, entry) in handovers.items():
+            approval = existing.get((minute_id, entry.user_id))
+            if approval is None:
+                created.append(cls(
+                    minute_id=minute_id, approval_chain_id=decided.approval_chain_id, approver_id=entry.user_id,
+                    current_approver=True, status='Pending', order=entry.order,
+                ))
+                shifts[entry.user_id, None, ApproverCounter.bucket_for('Pending', True)] += 1
+            else:
+                current.append(approval)
+                shifts[
+                    entry.user_id,
+                    ApproverCounter.bucket_for(approval.status, approval.current_approver),
+                    ApproverCounter.bucket_for(approval.status, True),
+                ] += 1
+
+        cls.objects.bulk_create(created)
+        cls.objects.filter(pk__in=[approval.pk for approval in current]).update(current_approver=True)
+        MinuteParticipation.record_pairs([(approval.approver_id, approval.minute_id) for approval in created], 'approver')
+        ApproverCounter.shift_many(shifts)
+        ChangeEvent.record_pairs('approval', [(approval.pk, approval.minute_id) for approval in created + current])
+
+        Approver.objects.filter(pk__in=[entry.pk for _, entry in handovers.values()]).update(is_current=True)
+        Minute.objects.filter(pk__in=handovers).update(
+            current_approver_id=Case(
+                *[When(pk=minute_id, then=Value(entry.user_id)) for minute_id, (_, entry) in handovers.items()]
+            ),
+            current_since=timestamp,
+            version=F('version') + 1,
+        )
+        Minute.record_changes(handovers)
+
     @transaction.atomic
+    @batched_changes
     def mark_to(self, target_user, order=None):
         from django.apps import apps
         Approver = apps.get_model('approval_chain', 'Approver')
@@ -410,6 +941,7 @@ class MinuteApproval(models.Model):
         logger.info(f"Minute marked to new approver: User={new_approver.user.username}, Order={new_approver.order}")
 
     @transaction.atomic
+    @batched_changes
     def return_to(self, target_user):
         from django.apps import apps
         MinuteApproval = apps.get_model('minute', 'MinuteApproval')
@@ -499,6 +1031,7 @@ class MinuteApproval(models.Model):
         MinuteApproval.objects.filter(
             minute=self.minute, approver=next_approver.user
         ).update(current_approver=True, status='Pending')
+        Minute.set_current_approver(self.minute_id, next_approver.user_id)
 
     def _get_next_approver(self):
         """
@@ -556,9 +1089,9 @@ class MinuteApproval(models.Model):
         )
 
 
-class MinuteActionLog(models.Model):
+class AbstractMinuteActionLog(models.Model):
     """
-    Logs every action taken on a Minute during its approval process.
+    The columns shared by live action logs and their cold copies (see ColdMinuteActionLog).
     """
     ACTION_CHOICES = [
         ('approve', 'Approve'),
@@ -567,17 +1100,38 @@ class MinuteActionLog(models.Model):
         ('return-to', 'Return-To'),
     ]
 
+    action = models.CharField(
+        max_length=20,
+        choices=ACTION_CHOICES,
+        help_text="The action performed on the minute."
+    )
+    remarks = CompressedTextField(
+        null=True,
+        blank=True,
+        help_text="Optional remarks or comments associated with the action."
+    )
+    trace_id = models.CharField(
+        max_length=32,
+        blank=True,
+        default='',
+        db_index=True,
+        help_text="Trace of the request or job that performed the action, to follow it through the logs."
+    )
+
+    class Meta:
+        abstract = True
+
+
+class MinuteActionLog(AbstractMinuteActionLog):
+    """
+    Logs every action taken on a Minute during its approval process.
+    """
     minute = models.ForeignKey(
         Minute,
         on_delete=models.CASCADE,
         related_name="action_logs",
         help_text="The minute document related to this log entry."
     )
-    action = models.CharField(
-        max_length=20,
-        choices=ACTION_CHOICES,
-        help_text="The action performed on the minute."
-    )
     performed_by = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -594,16 +1148,25 @@ class MinuteActionLog(models.Model):
         related_name="targeted_actions",
         help_text="The target user for the action, if applicable (e.g., Mark-To, Return-To)."
     )
-    remarks = models.TextField(
-        null=True,
-        blank=True,
-        help_text="Optional remarks or comments associated with the action."
-    )
     timestamp = models.DateTimeField(
         auto_now_add=True,
         help_text="The time when the action was performed."
     )
 
+    def save(self, *args, **kwargs):
+        """
+        Stamp new log entries with the current trace, invalidate the minute's cached fragments
+        and refresh the performer's participation entry.
+        """
+        is_new = self.pk is None
+        if is_new and not self.trace_id:
+            self.trace_id = current_trace_id() or ''
+        super().save(*args, **kwargs)
+        if is_new:
+            Minute.bump_version(self.minute_id)
+            MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+            MinuteParticipation.record([self.performed_by_id], self.minute_id, 'actor', self.timestamp)
+
     def log_action(self, action, remarks=None, target_user=None, timestamp=None):
         """
         Log an action with optional remarks, target user, and custom timestamp.
@@ -624,6 +1187,7 @@ class MinuteActionLog(models.Model):
     def get_logs_for_minute(cls, minute):
         """
         Retrieve all logs for a given minute, ordered by timestamp.
+        Only the entries still in the database; utils.action_log_archive.minute_history adds the exported ones.
         """
         return cls.objects.filter(minute=minute).order_by('timestamp')
 
@@ -632,9 +1196,181 @@ class MinuteActionLog(models.Model):
             models.Index(fields=['action'], name='action_idx'),
             models.Index(fields=['timestamp'], name='timestamp_idx'),
         ]
+        permissions = [('export_audit_log', "Can export the action history of any department")]
         verbose_name = "Minute Action Log"
         verbose_name_plural = "Minute Action Logs"
 
     def __str__(self):
         return f"{self.action.capitalize()} on {self.minute.title} by {self.performed_by.username if self.performed_by else 'System'}"
 
+
+
+def _column_values(instance, model):
+    """
+    The loaded column values of a live row that `model` also has, as stored:
+    compressed text is copied without decompressing it.
+    """
+    return {
+        field.attname: instance.__dict__[field.attname]
+        for field in model._meta.concrete_fields
+        if field.attname in instance.__dict__
+    }
+
+
+class ColdMinute(AbstractMinute):
+    """
+    An archived minute moved out of the live table by archive tiering (see move_archived),
+    so the live tables only grow with in-flight work. Keeps the id, the columns and the
+    timestamps of the live row. Cold minutes are read-only; the workflow never sees them.
+    """
+    department = models.ForeignKey(
+        'departments.Department',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+',
+        help_text="The department this minute sheet belongs to."
+    )
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="The user who created this minute."
+    )
+    created_at = models.DateTimeField(help_text="Timestamp of when the minute was created.")
+    updated_at = models.DateTimeField(help_text="Timestamp of the last update.")
+    approval_chain = models.ForeignKey(
+        'approval_chain.ApprovalChain',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="The approval chain the minute went through."
+    )
+    moved_at = models.DateTimeField(default=now, help_text="Timestamp of when the minute moved to the cold tier.")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['department', '-archived_at', '-id'], name='cold_minute_archive_dept_idx'),
+            models.Index(fields=['created_by', '-created_at', '-id'], name='cold_minute_creator_idx'),
+        ]
+        verbose_name = "Cold Minute"
+        verbose_name_plural = "Cold Minutes"
+
+    @classmethod
+    def move_archived(cls, archived_before, batch_size=200):
+        """
+        Move one batch of the minutes archived before the given time, with their approval
+        records and action logs, from the live tables to the cold ones in one transaction.
+        Participation entries are re-pointed at the cold copies and approval chains are kept.
+        Returns the number of minutes moved; call again until it returns 0.
+        """
+        ApprovalChain = apps.get_model('approval_chain', 'ApprovalChain')
+        MinuteParticipation = apps.get_model('approver', 'MinuteParticipation')
+
+        with transaction.atomic():
+            minute_ids = list(
+                Minute.objects.filter(archived=True, archived_at__lt=archived_before)
+                .order_by('archived_at', 'id').values_list('id', flat=True)[:batch_size]
+            )
+            if not minute_ids:
+                return 0
+
+            cls.objects.bulk_create(
+                [cls(**_column_values(minute, cls)) for minute in Minute.objects.filter(pk__in=minute_ids)]
+            )
+            ColdMinuteApproval.objects.bulk_create([
+                ColdMinuteApproval(**_column_values(approval, ColdMinuteApproval))
+                for approval in MinuteApproval.objects.filter(minute_id__in=minute_ids)
+            ])
+            ColdMinuteActionLog.objects.bulk_create([
+                ColdMinuteActionLog(**_column_values(log, ColdMinuteActionLog))
+                for log in MinuteActionLog.objects.filter(minute_id__in=minute_ids)
+            ])
+
+            MinuteParticipation.objects.filter(minute_id__in=minute_ids).update(cold_minute=F('minute'), minute=None)
+            ApprovalChain.objects.filter(minute_id__in=minute_ids).update(minute=None)
+            MinuteActionLog.objects.filter(minute_id__in=minute_ids).delete()
+            MinuteApproval.objects.filter(minute_id__in=minute_ids).delete()
+            Minute.objects.filter(pk__in=minute_ids).delete()
+        return len(minute_ids)
+
+
+class ColdMinuteApproval(AbstractMinuteApproval):
+    """
+    An approval record of a cold minute, moved with it.
+    """
+    minute = models.ForeignKey(
+        ColdMinute,
+        on_delete=models.CASCADE,
+        related_name="approvals",
+        help_text="The cold minute this approval record belongs to."
+    )
+    approval_chain = models.ForeignKey(
+        'approval_chain.ApprovalChain',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+',
+        help_text="The approval chain linked to this minute."
+    )
+    approver = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        help_text="The user responsible for reviewing the minute."
+    )
+    target_user = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        help_text="The user to whom this minute was marked (for mark-to action)."
+    )
+    created_at = models.DateTimeField(help_text="Timestamp when the approval record was created.")
+    updated_at = models.DateTimeField(help_text="Timestamp when the approval record was last updated.")
+
+    class Meta:
+        verbose_name = "Cold Minute Approval"
+        verbose_name_plural = "Cold Minute Approvals"
+
+    def __str__(self):
+        return f"{self.minute.title} - {self.status} by {self.approver.username}"
+
+
+class ColdMinuteActionLog(AbstractMinuteActionLog):
+    """
+    An action log entry of a cold minute, moved with it.
+    """
+    minute = models.ForeignKey(
+        ColdMinute,
+        on_delete=models.CASCADE,
+        related_name="action_logs",
+        help_text="The cold minute this log entry belongs to."
+    )
+    performed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="The user who performed the action."
+    )
+    target_user = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        help_text="The target user for the action, if applicable (e.g., Mark-To, Return-To)."
+    )
+    timestamp = models.DateTimeField(help_text="The time when the action was performed.")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['timestamp'], name='cold_log_timestamp_idx'),
+        ]
+        verbose_name = "Cold Minute Action Log"
+        verbose_name_plural = "Cold Minute Action Logs"
+
+    def __str__(self):
+        return f"{self.action.capitalize()} on {self.minute.title} by {self.performed_by.username if self.performed_by else 'System'}"
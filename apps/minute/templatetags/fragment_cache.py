@@ -0,0 +1,39 @@
+from django import template
+
+from utils.fragment_cache import get_fragment, set_fragment
+
+register = template.Library()
+
+
+class MinuteFragmentNode(template.Node):
+    def __init__(self, nodelist, name, minute, vary_on):
+        self.nodelist = nodelist
+        self.name = name
+        self.minute = minute
+        self.vary_on = vary_on
+
+    def render(self, context):
+        name = self.name.resolve(context)
+        minute = self.minute.resolve(context)
+        vary_on = [value.resolve(context) for value in self.vary_on]
+
+        html = get_fragment(name, minute, *vary_on)
+        if html is None:
+            html = self.nodelist.render(context)
+            set_fragment(name, minute, html, *vary_on)
+        return html
+
+
+@register.tag
+def minute_fragment(parser, token):
+    """
+    Cache the enclosed block per minute version:
+    {% minute_fragment "approvers" minute [vary_on ...] %} ... {% endminute_fragment %}
+    """
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes a fragment name and a minute.")
+    nodelist = parser.parse(('endminute_fragment',))
+    parser.delete_first_token()
+    name, minute, *vary_on = (parser.compile_filter(bit) for bit in bits[1:])
+    return MinuteFragmentNode(nodelist, name, minute, vary_on)
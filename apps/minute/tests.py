@@ -1,8 +1,33 @@
-from django.test import TestCase, Client
-from django.urls import reverse
+import json
+import re
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection, transaction
+from django.db import router
+from django.urls import resolve, reverse
 from django.contrib.auth import get_user_model
-from apps.minute.models import Minute
-from apps.approval_chain.models import ApprovalChain
+from django.utils.timezone import now
+from rest_framework_simplejwt.tokens import RefreshToken
+from apps.minute.models import Minute, MinuteApproval, MinuteActionLog
+from apps.approval_chain.models import ApprovalChain, Approver
+from apps.approver.models import ApproverCounter, MinuteParticipation
+from apps.departments.models import Department
+from apps.notifications.models import Notification
+from utils.query_plans import analyze_tables, explain, sequential_scans
+from utils.performance import registry
+from utils.nplusone import NPlusOneError, detect_n_plus_one, detector_settings, fingerprint
+from utils.profiling import issue_token
+from utils.slow_queries import SlowQueryRecorder, group_by_fingerprint, read_slow_queries
+from utils.structured_logging import QueuedRotatingFileHandler, RequestContextMiddleware
+from utils.db_routing import STICKY_COOKIE, ReplicaMiddleware
+from utils.compressed_fields import MAGIC, compress_existing, is_compressed
 
 User = get_user_model()
 
@@ -69,3 +94,674 @@ class MinuteFlowTestCase(TestCase):
         # Verify status update
         minute.refresh_from_db()
         self.assertEqual(minute.status, "Submitted")
+
+
+class CurrentApproverPointerTest(TestCase):
+    """
+    Test the denormalized current-approver pointer kept on Minute by the workflow.
+    """
+
+    def setUp(self):
+        self.faculty = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        self.hod = User.objects.create_user(username="hod", password="password", role="Admin")
+        self.dean = User.objects.create_user(username="dean", password="password", role="Admin")
+
+        self.chain = ApprovalChain.objects.create(name="Pointer Chain", created_by=self.faculty)
+        self.minute = Minute.objects.create(
+            title="Pointer Minute",
+            description="Description",
+            created_by=self.faculty,
+            approval_chain=self.chain,
+            status="Submitted",
+        )
+        for order, user in enumerate([self.hod, self.dean], start=1):
+            Approver.objects.create(approval_chain=self.chain, user=user, order=order, is_current=(order == 1))
+            MinuteApproval.objects.create(
+                minute=self.minute,
+                approval_chain=self.chain,
+                approver=user,
+                order=order,
+                status="Pending",
+                current_approver=(order == 1),
+            )
+
+    def test_pointer_follows_approvals(self):
+        stale = Minute.objects.get(pk=self.minute.pk)
+        self.assertEqual(stale.current_approver, self.hod)
+        self.assertEqual(list(Minute.inbox_for(self.hod)), [self.minute])
+
+        MinuteApproval.objects.get(minute=self.minute, approver=self.hod).approve(remarks="Fine")
+        self.minute.refresh_from_db()
+        self.assertEqual(self.minute.current_approver, self.dean)
+        self.assertIsNotNone(self.minute.current_since)
+
+        # A full save from a stale instance must not move the pointer back
+        stale.title = "Renamed"
+        stale.save()
+        self.minute.refresh_from_db()
+        self.assertEqual(self.minute.current_approver, self.dean)
+
+        MinuteApproval.objects.get(minute=self.minute, approver=self.dean).reject(remarks="No")
+        self.minute.refresh_from_db()
+        self.assertIsNone(self.minute.current_approver)
+        self.assertFalse(Minute.inbox_for(self.dean).exists())
+
+
+class HotQueryPlanTest(TestCase):
+    """
+    Seed a sizeable dataset and EXPLAIN every hot query issued by the list views.
+    Fails if any of them falls back to a sequential scan.
+    """
+    MINUTES = 3000
+    USERS = 60
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(name="Computer Science", code="CS")
+        cls.users = User.objects.bulk_create([
+            User(username=f"user{index}", role="Faculty", department=cls.department, password="!")
+            for index in range(cls.USERS)
+        ])
+        cls.user = cls.users[0]
+
+        chains = ApprovalChain.objects.bulk_create([
+            ApprovalChain(name=f"Chain {index}", created_by=cls.users[index % cls.USERS])
+            for index in range(cls.MINUTES)
+        ])
+        # Production-like mix: most minutes are archived, a small share is in flight
+        statuses = ["Submitted", "Pending", "Returned"] + ["Approved"] * 40 + ["Rejected"] * 17
+        minutes = Minute.objects.bulk_create([
+            Minute(
+                id=index + 1,
+                unique_id=f"DHA/DSU/CS/01-2025/{index + 1:05d}",
+                title=f"Minute {index}",
+                description="Description",
+                department=cls.department,
+                created_by=cls.users[index % cls.USERS],
+                approval_chain=chains[index],
+                status=statuses[index % len(statuses)],
+                archived=statuses[index % len(statuses)] in ("Approved", "Rejected"),
+                archived_at=now() if statuses[index % len(statuses)] in ("Approved", "Rejected") else None,
+                current_approver=cls.users[(index + 1) % cls.USERS],
+            )
+            for index in range(cls.MINUTES)
+        ])
+        Approver.objects.bulk_create([
+            Approver(approval_chain=chains[index], user=cls.users[(index + step) % cls.USERS], order=step)
+            for index in range(cls.MINUTES) for step in (1, 2)
+        ])
+        MinuteApproval.objects.bulk_create([
+            MinuteApproval(
+                minute=minutes[index],
+                approval_chain=chains[index],
+                approver=cls.users[(index + step) % cls.USERS],
+                order=step,
+                current_approver=(step == 1),
+            )
+            for index in range(cls.MINUTES) for step in (1, 2)
+        ])
+        MinuteActionLog.objects.bulk_create([
+            MinuteActionLog(minute=minutes[index], action="approve", performed_by=cls.users[index % cls.USERS])
+            for index in range(cls.MINUTES)
+        ])
+        Notification.objects.bulk_create([
+            Notification(user=cls.users[index % cls.USERS], title="Title", message="Message", is_read=index % 2 == 0)
+            for index in range(cls.MINUTES)
+        ])
+        MinuteParticipation.rebuild()
+        analyze_tables()
+
+    def hot_queries(self):
+        user = self.user
+        minute = Minute.objects.get(pk=1)
+        return {
+            "minute:track": Minute.objects.filter(
+                archived=False, status__in=["Submitted", "Pending", "Marked", "Returned"]
+            ).order_by("-created_at"),
+            "minute:archive": Minute.objects.filter(
+                created_by=user, status__in=["Approved", "Rejected"], archived=True
+            ).order_by("-updated_at", "-id"),
+            "approver:dashboard inbox": Minute.inbox_for(user),
+            "approver:dashboard counters": ApproverCounter.objects.filter(user=user),
+            "approver:department_archive": Minute.objects.filter(
+                archived=True, archived_at__isnull=False, department=self.department
+            ).order_by("-archived_at", "-id"),
+            "approver:approval_tracker": MinuteParticipation.objects.filter(user=user).order_by(
+                "-last_activity", "-id"
+            ),
+            "approver:minute_details current approval": MinuteApproval.objects.filter(
+                minute=minute, approver=user, current_approver=True
+            ),
+            "approver:my pending approvals": MinuteApproval.objects.filter(
+                approver=user, current_approver=True, status="Pending"
+            ),
+            "approval_chain next approver": Approver.objects.filter(
+                approval_chain=minute.approval_chain, status="Pending", order__gt=1
+            ).order_by("order"),
+            "minute:approval_status": MinuteApproval.objects.filter(minute=minute).order_by("order"),
+            "action logs for minute": MinuteActionLog.get_logs_for_minute(minute),
+            "notifications:list": Notification.objects.filter(user=user).order_by("-created_at"),
+            "notifications:mark all read": Notification.objects.filter(user=user, is_read=False),
+        }
+
+    def test_hot_queries_use_indexes(self):
+        failures = {}
+        for name, queryset in self.hot_queries().items():
+            plan = explain(queryset)
+            scans = sequential_scans(plan)
+            if scans:
+                failures[name] = f"sequential scan on {', '.join(scans)}\n{plan}"
+        self.assertFalse(failures, "\n\n".join(f"{name}: {detail}" for name, detail in failures.items()))
+
+
+class PerformanceMiddlewareTest(TestCase):
+    """
+    Test the Server-Timing header and the Prometheus metrics endpoint.
+    """
+
+    def setUp(self):
+        registry.reset()
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        self.staff = User.objects.create_user(username="staff", password="password", role="Admin", is_staff=True)
+        chain = ApprovalChain.objects.create(name="Chain", created_by=self.user)
+        Minute.objects.create(
+            title="Budget", description="Description", created_by=self.user, approval_chain=chain, status="Submitted"
+        )
+
+    def test_server_timing_reports_phases(self):
+        self.client.login(username="faculty", password="password")
+        response = self.client.get(reverse("minute:track"))
+
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r"^total;dur=[\d.]+, db;dur=[\d.]+;desc=\"\d+ queries\", template;dur=[\d.]+$")
+
+    def test_metrics_endpoint_aggregates_per_view(self):
+        self.client.login(username="faculty", password="password")
+        self.client.get(reverse("minute:track"))
+        self.client.get(reverse("minute:track"))
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+
+        self.client.login(username="staff", password="password")
+        body = self.client.get(reverse("metrics")).content.decode()
+        self.assertIn('http_request_duration_seconds_count{view="minute:track",method="GET"} 2', body)
+        self.assertIn('http_responses_total{view="minute:track",method="GET",status="200"} 2', body)
+        self.assertIn("minute_track_chains_rendered_total 2", body)
+
+        self.client.logout()
+        with self.settings(METRICS_TOKEN="scrape-token"):
+            self.assertEqual(self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+            self.assertEqual(self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer scrape-token").status_code, 200)
+
+
+class NPlusOneDetectorTest(TestCase):
+    """
+    Test the N+1 query detector.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        for index in range(7):
+            approver = User.objects.create_user(username=f"approver{index}", password="password", role="Admin")
+            chain = ApprovalChain.objects.create(name=f"Chain {index}", created_by=self.user)
+            minute = Minute.objects.create(
+                title=f"Minute {index}", description="Description", created_by=self.user,
+                approval_chain=chain, status="Submitted",
+            )
+            MinuteApproval.objects.create(minute=minute, approval_chain=chain, approver=approver, order=1)
+
+    def test_fingerprint_collapses_literals_and_in_lists(self):
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = \'x\' LIMIT 21'),
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s) AND name = \'y\'  LIMIT 1'),
+        )
+
+    def test_lazy_loads_in_a_loop_raise_with_the_caller(self):
+        with self.assertRaises(NPlusOneError) as raised:
+            with detect_n_plus_one(threshold=5, allowlist=[], action="raise"):
+                [approval.approver.username for approval in MinuteApproval.objects.all()]
+        self.assertIn("executed 7 times", str(raised.exception))
+        self.assertIn("apps/minute/tests.py", str(raised.exception))
+
+        with detect_n_plus_one(threshold=5, allowlist=[], action="raise"):
+            [approval.approver.username for approval in MinuteApproval.objects.select_related("approver")]
+
+    def test_middleware_raises_unless_view_is_allowlisted(self):
+        self.client.login(username="faculty", password="password")
+        self.assertEqual(self.client.get(reverse("minute:track")).status_code, 200)
+
+        config = {"ENABLED": True, "THRESHOLD": 5, "ACTION": "raise", "ALLOWLIST": []}
+        with override_settings(NPLUSONE=config):
+            client = Client()
+            client.force_login(self.user)
+            with self.assertRaises(NPlusOneError):
+                client.get(reverse("minute:track"))
+
+    def test_suite_runs_with_the_detector_raising(self):
+        config = detector_settings()
+        self.assertEqual((config["ENABLED"], config["ACTION"]), (True, "raise"))
+
+    def test_approval_status_loads_approvers_in_one_query(self):
+        minute = Minute.objects.first()
+        for order, approver in enumerate(User.objects.filter(role="Admin").exclude(approvals__minute=minute), start=2):
+            MinuteApproval.objects.create(
+                minute=minute, approval_chain=minute.approval_chain, approver=approver, order=order,
+            )
+
+        config = {"ENABLED": True, "THRESHOLD": 5, "ACTION": "raise", "ALLOWLIST": []}
+        with override_settings(NPLUSONE=config):
+            client = Client()
+            client.force_login(self.user)
+            response = client.get(reverse("minute:approval_status", args=[minute.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["approval_chain"]), 7)
+
+
+class ProfilingMiddlewareTest(TestCase):
+    """
+    Test on-demand request profiling.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        self.staff = User.objects.create_user(username="staff", password="password", role="Admin", is_staff=True)
+
+    def profile(self, **config):
+        return override_settings(PROFILING={"DIR": self.directory.name, "MAX_PER_MINUTE": 2, **config})
+
+    def test_signed_header_writes_profile_stacks_and_allocations(self):
+        self.client.login(username="faculty", password="password")
+        with self.profile():
+            response = self.client.get(reverse("minute:track"), HTTP_X_PROFILE_TOKEN=issue_token())
+
+        stem = Path(self.directory.name) / response["X-Profile-Id"]
+        self.assertIn("minute-track", stem.name)
+        for suffix in (".prof", ".collapsed", ".alloc.txt"):
+            self.assertTrue(Path(f"{stem}{suffix}").stat().st_size > 0, suffix)
+
+    def test_tokens_are_single_use(self):
+        self.client.login(username="faculty", password="password")
+        token = issue_token()
+        with self.profile():
+            self.assertIn("X-Profile-Id", self.client.get(reverse("minute:track"), HTTP_X_PROFILE_TOKEN=token))
+            self.assertNotIn("X-Profile-Id", self.client.get(reverse("minute:track"), HTTP_X_PROFILE_TOKEN=token))
+
+    def test_only_valid_tokens_and_staff_toggle_are_profiled(self):
+        self.client.login(username="faculty", password="password")
+        with self.profile():
+            self.assertNotIn("X-Profile-Id", self.client.get(reverse("minute:track"), HTTP_X_PROFILE_TOKEN="forged"))
+            self.assertNotIn("X-Profile-Id", self.client.get(reverse("minute:track"), {"_profile": 1}))
+
+            self.client.login(username="staff", password="password")
+            self.assertIn("X-Profile-Id", self.client.get(reverse("minute:track"), {"_profile": 1}))
+
+    def test_a_request_refused_by_the_rate_limit_keeps_its_token(self):
+        self.client.login(username="faculty", password="password")
+        token = issue_token()
+        with self.profile(MAX_PER_MINUTE=0):
+            self.assertNotIn("X-Profile-Id", self.client.get(reverse("minute:track"), HTTP_X_PROFILE_TOKEN=token))
+        with self.profile():
+            self.assertIn("X-Profile-Id", self.client.get(reverse("minute:track"), HTTP_X_PROFILE_TOKEN=token))
+
+    def test_rate_limit(self):
+        self.client.login(username="staff", password="password")
+        with self.profile(MAX_PER_MINUTE=1):
+            profiled = [
+                "X-Profile-Id" in self.client.get(reverse("minute:track"), {"_profile": 1}) for _ in range(3)
+            ]
+        self.assertEqual(profiled, [True, False, False])
+
+
+class SlowQueryLogTest(TestCase):
+    """
+    Test the slow-query log and its admin page.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        self.superuser = User.objects.create_superuser(username="root", password="password")
+
+    def test_slow_statements_are_logged_with_view_and_plan(self):
+        self.client.login(username="faculty", password="password")
+        with override_settings(SLOW_QUERIES={"THRESHOLD_MS": 0, "EXPLAIN": True}):
+            with self.assertLogs("slow_queries") as logs:
+                self.client.get(reverse("minute:track"))
+
+        entries = [json.loads(record.getMessage()) for record in logs.records]
+        selects = [entry for entry in entries if entry["sql"].startswith("SELECT")]
+        self.assertTrue(selects)
+        # Session and user lookups run before URL resolution and carry the path instead
+        self.assertEqual({entry["view"] for entry in entries}, {reverse("minute:track"), "minute:track"})
+        self.assertTrue(all(entry["plan"] for entry in selects))
+        self.assertNotIn("faculty", json.dumps(entries))  # parameters are only fingerprinted
+
+    def test_failed_explain_is_contained_in_a_savepoint(self):
+        recorder = SlowQueryRecorder(connection, "test", {"THRESHOLD_MS": 0, "SAMPLE_RATE": 1.0, "EXPLAIN": True})
+        with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+            with self.assertLogs("slow_queries") as logs:
+                recorder.record("SELECT * FROM missing_table", [], False, 1.0)
+            self.assertTrue(User.objects.filter(username="faculty").exists())
+
+        self.assertTrue(json.loads(logs.records[0].getMessage())["plan"].startswith("EXPLAIN failed"))
+        statements = [query["sql"] for query in queries]
+        self.assertTrue(statements[0].startswith("SAVEPOINT"))
+        self.assertTrue(any(statement.startswith("ROLLBACK TO SAVEPOINT") for statement in statements))
+
+    def test_admin_page_groups_by_fingerprint(self):
+        entry = {"timestamp": "2024-01-01T00:00:00", "view": "minute:track", "sql": "SELECT 1", "plan": "SCAN t"}
+        lines = [
+            dict(entry, fingerprint="SELECT ? FROM a", duration_ms=400),
+            dict(entry, fingerprint="SELECT ? FROM a", duration_ms=600),
+            dict(entry, fingerprint="SELECT ? FROM b", duration_ms=350),
+        ]
+        self.assertEqual(
+            [(group["fingerprint"], group["count"], group["slowest"]["duration_ms"]) for group in group_by_fingerprint(lines)],
+            [("SELECT ? FROM a", 2, 600), ("SELECT ? FROM b", 1, 350)],
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = Path(directory) / "slow_queries.log"
+            log_file.write_text("".join(json.dumps(line) + "\n" for line in lines) + "not json\n")
+            self.assertEqual(list(read_slow_queries(log_file)), lines)
+            self.client.login(username="faculty", password="password")
+            self.assertEqual(self.client.get(reverse("slow_queries")).status_code, 302)
+
+            self.client.login(username="root", password="password")
+            with override_settings(SLOW_QUERIES={"LOG_FILE": log_file}):
+                response = self.client.get(reverse("slow_queries"))
+        self.assertContains(response, "SELECT ? FROM a")
+        self.assertEqual(response.context["groups"][0]["count"], 2)
+
+
+class StructuredLoggingTest(TestCase):
+    """
+    Test the queued JSON logging pipeline and the request context.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.log_file = Path(directory.name) / "app.log"
+        self.logger = logging.getLogger("apps.tests.structured")
+        self.logger.propagate = False
+        self.addCleanup(setattr, self.logger, "propagate", True)
+
+    def attach(self, handler):
+        self.logger.addHandler(handler)
+        self.addCleanup(self.logger.removeHandler, handler)
+        self.addCleanup(handler.close)
+        return handler
+
+    def read(self, handler):
+        handler.flush()
+        return [json.loads(line) for line in self.log_file.read_text().splitlines()]
+
+    def test_pid_in_the_filename_gives_each_process_its_own_file(self):
+        handler = self.attach(QueuedRotatingFileHandler(self.log_file.with_name("app.{pid}.log")))
+        self.logger.warning("From this process")
+        handler.flush()
+
+        [entry] = [json.loads(line) for line in self.log_file.with_name(f"app.{os.getpid()}.log").read_text().splitlines()]
+        self.assertEqual(entry["message"], "From this process")
+
+    def test_records_carry_request_context_and_exceptions(self):
+        handler = self.attach(QueuedRotatingFileHandler(self.log_file))
+
+        def view(request):
+            self.logger.warning("Minute %s returned", 7, extra={"minute_id": 7})
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                self.logger.exception("Action failed")
+            return HttpResponse()
+
+        request = RequestFactory().get("/", HTTP_X_REQUEST_ID="req-1",
+                                       HTTP_TRACEPARENT="00-" + "a" * 32 + "-" + "b" * 16 + "-01")
+        response = RequestContextMiddleware(view)(request)
+
+        returned, failed = self.read(handler)
+        self.assertEqual(response["X-Request-ID"], "req-1")
+        self.assertEqual(returned["message"], "Minute 7 returned")
+        self.assertEqual((returned["request_id"], returned["trace_id"], returned["minute_id"]), ("req-1", "a" * 32, 7))
+        self.assertIn("ValueError: boom", failed["exception"])
+
+    def test_invalid_inbound_ids_are_replaced(self):
+        response = RequestContextMiddleware(lambda request: HttpResponse())(
+            RequestFactory().get("/", HTTP_X_REQUEST_ID="bad id\nforged")
+        )
+        self.assertRegex(response["X-Request-ID"], r"^[0-9a-f]{32}$")
+
+    def test_rotates_by_size(self):
+        handler = self.attach(QueuedRotatingFileHandler(self.log_file, maxBytes=2000, backupCount=2))
+        for index in range(100):
+            self.logger.warning("Record %s", index)
+        handler.flush()
+        self.assertTrue(Path(f"{self.log_file}.1").exists())
+        self.assertLessEqual(self.log_file.stat().st_size, 2000)
+
+
+@override_settings(REPLICA_DATABASES=["replica_1", "replica_2"], REPLICA_VIEWS=["minute:track"], REPLICA_STICKY_SECONDS=10)
+class ReplicaRoutingTest(TestCase):
+    """
+    Test routing of read-only views to replicas and read-your-writes stickiness.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+
+    def serve(self, request, write=False):
+        """
+        Run the request through the middleware; return the response and the database reads would use.
+        """
+        used = {}
+
+        def view(request):
+            middleware.process_view(request, None, (), {})
+            used["alias"] = router.db_for_read(Minute)
+            if write:
+                MinuteActionLog.objects.filter(pk=0).delete()
+                Minute.objects.filter(pk=0).update(title="x")
+            return HttpResponse()
+
+        middleware = ReplicaMiddleware(view)
+        request.resolver_match = resolve(request.path)
+        return middleware(request), used["alias"]
+
+    def test_read_views_use_a_replica_and_others_the_primary(self):
+        factory = RequestFactory()
+        self.assertIn(self.serve(factory.get(reverse("minute:track")))[1], ["replica_1", "replica_2"])
+        self.assertEqual(self.serve(factory.get(reverse("minute:archive")))[1], "default")
+        self.assertEqual(self.serve(factory.post(reverse("minute:track")))[1], "default")
+        self.assertEqual(router.db_for_read(Minute), "default")  # nothing leaks past the request
+
+    def test_writes_pin_the_client_to_the_primary(self):
+        factory = RequestFactory()
+        response, _ = self.serve(factory.post(reverse("minute:create")), write=True)
+        self.assertIn(STICKY_COOKIE, response.cookies)
+        self.assertNotIn(STICKY_COOKIE, self.serve(factory.get(reverse("minute:track")))[0].cookies)
+
+        request = factory.get(reverse("minute:track"))
+        request.COOKIES[STICKY_COOKIE] = response.cookies[STICKY_COOKIE].value
+        self.assertEqual(self.serve(request)[1], "default")
+
+
+class FragmentCacheTest(TestCase):
+    """
+    Test the per-version fragment cache of the minute pages.
+    """
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        self.hod = User.objects.create_user(username="hod", password="password", role="Admin")
+        chain = ApprovalChain.objects.create(name="Chain", created_by=self.user)
+        self.minute = Minute.objects.create(
+            title="Budget", description="Description", created_by=self.user, approval_chain=chain, status="Submitted"
+        )
+        Approver.objects.create(approval_chain=chain, user=self.hod, order=1, is_current=True)
+        self.approval = MinuteApproval.objects.create(
+            minute=self.minute, approval_chain=chain, approver=self.hod, order=1, current_approver=True
+        )
+        self.client.login(username="faculty", password="password")
+
+    def render_detail(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("minute:track_detail", args=[self.minute.pk]))
+        self.assertEqual(response.status_code, 200)
+        # The CSRF token is masked differently on every render
+        return re.sub(r'value="[\w]{64}"', '', response.content.decode()), len(queries)
+
+    def test_second_render_is_served_from_cache(self):
+        first, first_queries = self.render_detail()
+        second, second_queries = self.render_detail()
+
+        self.assertEqual(first, second)
+        self.assertLess(second_queries, first_queries)
+        metrics = registry.render()
+        self.assertIn('fragment_cache_total{fragment="track_approvers",result="hit"} 1', metrics)
+        self.assertIn('fragment_cache_total{fragment="sheet",result="miss"} 1', metrics)
+
+    def test_workflow_transition_invalidates_fragments(self):
+        version = Minute.objects.get(pk=self.minute.pk).version
+        self.assertNotIn("bg-success", self.render_detail()[0])
+
+        self.approval.status = "Approved"
+        self.approval.current_approver = False
+        self.approval.save()
+
+        self.assertGreater(Minute.objects.get(pk=self.minute.pk).version, version)
+        self.assertIn("bg-success", self.render_detail()[0])
+
+
+class DescriptionPaginationTest(TestCase):
+    """
+    Test the page offsets stored on save and the pages served from them.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        sentence = "The committee reviewed the proposal in detail. "
+        self.minute = Minute.objects.create(
+            title="Long", description=sentence * 70, created_by=self.user  # 490 words
+        )
+        self.client.login(username="faculty", password="password")
+
+    def test_offsets_keep_sentences_whole(self):
+        pages = list(self.minute.description_pages)
+
+        self.assertEqual(len(self.minute.description_page_offsets), 3)
+        self.assertEqual(" ".join(pages), self.minute.description.strip())
+        for page in pages:
+            self.assertTrue(page.endswith("."))
+            self.assertLessEqual(len(page.split()), Minute.WORDS_PER_PAGE)
+
+    def test_offsets_follow_description_changes(self):
+        self.minute.description = "Short. " * 3
+        self.minute.save(update_fields=["description"])
+
+        self.assertEqual(Minute.objects.get(pk=self.minute.pk).description_page_offsets, [0])
+
+    def test_sheet_and_json_endpoint_serve_the_same_pages(self):
+        response = self.client.get(reverse("minute:description_pages", args=[self.minute.pk]))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["total_pages"], 3)
+
+        sheet = self.client.get(reverse("minute:preview_minute", args=[self.minute.pk]), {"page": 9})
+        self.assertEqual(sheet.context["current_page"], 3)
+        self.assertEqual(sheet.context["total_pages"], 3)
+        self.assertEqual(sheet.context["current_description"], data["pages"][2])
+
+
+class ListProjectionTest(TestCase):
+    """
+    Test that list pages load display columns and the excerpt, not the long text fields.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        self.minute = Minute.objects.create(
+            title="Long", subject="Subject " * 100, description="Word " * 2000, created_by=self.user, status="Pending",
+        )
+
+    def test_excerpt_is_computed_on_save(self):
+        self.assertLessEqual(len(self.minute.excerpt), Minute.EXCERPT_LENGTH)
+        self.assertTrue(self.minute.excerpt.startswith("Word Word"))
+
+    def test_list_pages_skip_description(self):
+        self.client.login(username="faculty", password="password")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("minute:track"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, self.minute.excerpt)
+        minute_queries = [query["sql"] for query in queries if 'FROM "minute_minute"' in query["sql"]]
+        self.assertTrue(minute_queries)
+        for sql in minute_queries:
+            self.assertNotIn('"minute_minute"."description"', sql)
+            self.assertNotIn('"minute_minute"."subject"', sql.replace('SUBSTR("minute_minute"."subject"', ''))
+
+    def test_saving_a_projected_minute_keeps_the_long_fields(self):
+        minute = Minute.for_list().get(pk=self.minute.pk)
+        minute.title = "Renamed"
+        with self.assertNumQueries(3):  # the update bumping the version, reading it back and the feed entry
+            minute.save()
+        self.assertEqual(minute.version, Minute.objects.get(pk=minute.pk).version)
+
+        minute = Minute.objects.get(pk=self.minute.pk)
+        self.assertEqual((minute.title, minute.description), ("Renamed", self.minute.description))
+
+    def test_api_lists_own_minutes_with_excerpt(self):
+        token = RefreshToken.for_user(self.user).access_token
+        response = self.client.get(reverse("minute-api-create"), HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        self.assertEqual(response.status_code, 200)
+        [row] = response.json()["results"]
+        self.assertEqual(row["excerpt"], self.minute.excerpt)
+        self.assertNotIn("description", row)
+
+
+class CompressedTextFieldTest(TestCase):
+    """
+    Test the compressed storage of descriptions and remarks.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="faculty", password="password", role="Faculty")
+        self.text = " ".join(f"Item {index} of the budget was discussed." for index in range(200))
+
+    def stored(self, minute):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT description FROM minute_minute WHERE id = %s", [minute.pk])
+            return bytes(cursor.fetchone()[0])
+
+    def test_long_text_is_stored_compressed_and_read_back(self):
+        minute = Minute.objects.create(title="Long", description=self.text, created_by=self.user)
+        short = Minute.objects.create(title="Short", description="Brief.", created_by=self.user)
+
+        self.assertTrue(self.stored(minute).startswith(MAGIC))
+        self.assertLess(len(self.stored(minute)), len(self.text) / 2)
+        self.assertEqual(self.stored(short), b"Brief.")
+        self.assertEqual(Minute.objects.get(pk=minute.pk).description, self.text)
+        self.assertEqual(Minute.objects.get(pk=short.pk).description, "Brief.")
+
+    def test_untouched_text_is_saved_without_decompressing(self):
+        minute = Minute.objects.create(title="Long", description=self.text, created_by=self.user)
+        loaded = Minute.objects.get(pk=minute.pk)
+        loaded.title = "Renamed"
+        loaded.save()
+
+        self.assertTrue(is_compressed(loaded, "description"))
+        self.assertEqual(Minute.objects.get(pk=minute.pk).description, self.text)
+
+    def test_backfill_compresses_plain_rows(self):
+        minute = Minute.objects.create(title="Long", description="Short.", created_by=self.user)
+        with connection.cursor() as cursor:  # a row written before the column was compressed
+            cursor.execute("UPDATE minute_minute SET description = %s WHERE id = %s", [self.text, minute.pk])
+
+        field = Minute._meta.get_field("description")
+        self.assertEqual(list(compress_existing(Minute, field, batch_size=10)), [(1, 1)])
+        self.assertTrue(self.stored(minute).startswith(MAGIC))
+        self.assertEqual(Minute.objects.get(pk=minute.pk).description, self.text)
@@ -22,6 +22,9 @@ urlpatterns = [
     # Approval chain status API
     path('api/approval_status/<int:minute_id>/', views.ApprovalChainStatusView.as_view(), name='approval_status'),
 
+    # All pages of a minute's description, for paging without reloads
+    path('api/description_pages/<int:minute_id>/', views.MinuteDescriptionPagesView.as_view(), name='description_pages'),
+
     # Preview the formatted minute sheet
     path('preview/<int:minute_id>/', views.preview_minute_sheet, name='preview_minute'),
 
@@ -4,7 +4,8 @@ from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import HttpResponse
 from django.template.loader import render_to_string
-from apps.minute.models import Minute, MinuteApproval
+from django.utils.functional import SimpleLazyObject
+from apps.minute.models import ColdMinute, Minute, MinuteApproval
 from apps.minute.forms import MinuteForm
 from apps.approval_chain.models import ApprovalChain
 from django.conf import settings
@@ -20,6 +21,9 @@ from django.core.serializers.json import DjangoJSONEncoder
 import textwrap
 from django.template.loader import get_template
 import pdfkit
+from utils.performance import increment, timed
+from utils.tiering import minute_or_404
+from utils.pagination import keyset_paginate_merged
 
 
 class CreateMinuteView(LoginRequiredMixin, CreateView):
@@ -227,10 +231,12 @@ class TrackMinuteView(LoginRequiredMixin, ListView):
         """
         Retrieve all minutes with statuses indicating they are in progress (not archived).
         Only show minutes with statuses 'Submitted', 'Pending', 'Marked', or 'Returned'.
+        Filtering on archived=False lets the query use the partial in-flight index.
         """
-        return Minute.objects.filter(
+        return Minute.for_list(Minute.objects.filter(
+            archived=False,
             status__in=['Submitted', 'Pending', 'Marked', 'Returned']
-        ).order_by('-created_at')
+        )).select_related('created_by', 'approval_chain').order_by('-created_at')
 
     def get_context_data(self, **kwargs):
         """
@@ -262,32 +268,41 @@ class TrackMinuteView(LoginRequiredMixin, ListView):
         context['approval_chains'] = approval_chains
         context['approvers_status_map'] = approvers_status_map
 
-        # Debugging logs to verify data
-        print("Approval Chains:", context['approval_chains'])
-        print("Approvers Status Map:", context['approvers_status_map'])
+        increment('minute_track_chains_rendered', len(approval_chains))
 
         return context
 
 class ArchiveView(LoginRequiredMixin, ListView):
     """
-    View to display archived minutes (Approved/Rejected).
+    View to display archived minutes (Approved/Rejected), keyset-paginated by last update.
     """
     model = Minute
     template_name = 'minute/archive.html'
     context_object_name = 'archived_minutes'  # ✅ Fix: Ensure correct variable name
+    page_size = 25
 
     def get_queryset(self):
         """
-        Retrieve archived minutes (Approved/Rejected) only.
-        """
-        return Minute.objects.filter(
-            created_by=self.request.user,
-            status__in=['Approved', 'Rejected'],  # Ensure only final statuses are included
-            archived=True  # ✅ Fix: Ensure only minutes marked as archived appear
-        ).order_by('-updated_at')  # Sort by last update time
-
+        One page of the archived minutes (Approved/Rejected) only, merged from the live and the cold tier.
+        """
+        return keyset_paginate_merged(
+            [
+                model.for_list(model.objects.filter(
+                    created_by=self.request.user,
+                    status__in=['Approved', 'Rejected'],  # Ensure only final statuses are included
+                    archived=True  # ✅ Fix: Ensure only minutes marked as archived appear
+                )).select_related('created_by')
+                for model in (Minute, ColdMinute)
+            ],
+            ordering=('-updated_at', '-id'),  # Sort by last update time
+            cursor=self.request.GET.get('cursor'),
+            per_page=self.page_size,
+        )
 
-import re
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({'archived_minutes': self.object_list.items, 'page': self.object_list})
+        return context
 
 
 class TrackMinuteDetailView(LoginRequiredMixin, DetailView):
@@ -299,30 +314,13 @@ class TrackMinuteDetailView(LoginRequiredMixin, DetailView):
     template_name = 'minute/track_minute_detail.html'
     context_object_name = 'minute'
 
-    def split_description_into_pages(self, description, words_per_page=150):
+    def get_object(self, queryset=None):
         """
-        Splits the description into pages while keeping sentences intact.
+        The minute from either tier; archived minutes may have moved to the cold tables.
         """
-        if not description or not isinstance(description, str):
-            return ["No description available."]
-
-        # Sentence-based splitting to avoid cutting sentences awkwardly
-        sentences = re.split(r'(?<=[.!?])\s+', description.strip())
-
-        pages = []
-        current_page = ""
-
-        for sentence in sentences:
-            if len(current_page.split()) + len(sentence.split()) <= words_per_page:
-                current_page += sentence + " "
-            else:
-                pages.append(current_page.strip())
-                current_page = sentence + " "
-
-        if current_page:
-            pages.append(current_page.strip())  # Append last page
-
-        return pages
+        if not hasattr(self, 'object'):
+            self.object = minute_or_404(self.kwargs['pk'])
+        return self.object
 
     def get_context_data(self, **kwargs):
         """
@@ -332,40 +330,13 @@ class TrackMinuteDetailView(LoginRequiredMixin, DetailView):
         minute = self.get_object()
         chain = getattr(minute, 'approval_chain', None)
 
-        # ✅ Read current page from request GET
-        try:
-            current_page = int(self.request.GET.get("page", 1))  # Default to 1
-        except ValueError:
-            current_page = 1  # Fallback if invalid
-
-        # ✅ Paginate description
-        description_pages = self.split_description_into_pages(minute.description, words_per_page=150)
-        total_pages = len(description_pages)
-
-        # ✅ Ensure current page is within range
-        current_page = max(1, min(current_page, total_pages))
-
-        # ✅ Get content for current page
-        current_description = description_pages[current_page - 1] if description_pages else "No content available."
-
-        # ✅ Fetch approval chain details
-        approvers_status = []
-        current_approver = None
+        # ✅ Approval chain details, only built when a cached fragment misses
+        approvers_status = SimpleLazyObject(lambda: self.approvers_status(minute, chain))
+        current_approver = SimpleLazyObject(
+            lambda: next((entry['approver'] for entry in approvers_status if entry['is_current']), None)
+        )
         return_to_history = []
 
-        if chain:
-            for approver in chain.approvers.order_by('order'):
-                approval_entry = minute.approvals.filter(approver=approver.user).first()
-                approvers_status.append({
-                    'approver': approver.user.username,
-                    'status': approval_entry.status if approval_entry else 'Pending',
-                    'action_time': approval_entry.action_time if approval_entry else None,
-                    'remarks': approval_entry.remarks if approval_entry else None,
-                    'is_current': approval_entry and approval_entry.current_approver,
-                })
-                if approval_entry and approval_entry.current_approver:
-                    current_approver = approver.user.username
-
         show_success_message = minute.status == 'Submitted'
 
         # ✅ Update context with paginated description and approval details
@@ -376,14 +347,30 @@ class TrackMinuteDetailView(LoginRequiredMixin, DetailView):
             'return_to_history': return_to_history,
             'show_success_message': show_success_message,
             'success_message': "Your minute has been successfully submitted and is now pending approval.",
-            'description_pages': description_pages,  # 🔥 Add paginated description
-            'current_description': current_description,  # 🔥 Only show current page's content
-            'total_pages': total_pages,  # 🔥 Track total pages
-            'current_page': current_page,  # 🔥 Start from correct page
+            **description_page_context(self.request, minute),  # 🔥 Only the requested page's content
         })
 
         return context
 
+    def approvers_status(self, minute, chain):
+        """
+        Status of every approver in the chain, in chain order.
+        """
+        if not chain:
+            return []
+        approvals = {approval.approver_id: approval for approval in minute.approvals.all()}
+        approvers_status = []
+        for approver in chain.approvers.select_related('user').order_by('order'):
+            approval_entry = approvals.get(approver.user_id)
+            approvers_status.append({
+                'approver': approver.user.username,
+                'status': approval_entry.status if approval_entry else 'Pending',
+                'action_time': approval_entry.action_time if approval_entry else None,
+                'remarks': approval_entry.remarks if approval_entry else None,
+                'is_current': approval_entry and approval_entry.current_approver,
+            })
+        return approvers_status
+
 
 class ApprovalChainStatusView(View):
     """
@@ -395,10 +382,10 @@ class ApprovalChainStatusView(View):
         Returns JSON data for the approval chain status.
         """
         try:
-            minute = Minute.objects.get(pk=minute_id)
+            minute = Minute.in_any_tier(minute_id)
 
             # ✅ FIX: Explicitly order approvals by 'order' field
-            approvals = MinuteApproval.objects.filter(minute=minute).order_by('order')
+            approvals = minute.approvals.select_related('approver').order_by('order')
 
             # If no approvals found, return a message
             if not approvals.exists():
@@ -435,34 +422,18 @@ def preview_minute_sheet(request, minute_id):
     """
     Preview the formatted minute sheet with automatic pagination.
     """
-    minute = get_object_or_404(Minute, pk=minute_id)
+    minute = minute_or_404(minute_id)
     approval_chain = getattr(minute, 'approval_chain', None)
 
-    # ✅ Read current page from request GET
-    try:
-        page = int(request.GET.get("page", 1))  # Default to 1
-    except ValueError:
-        page = 1  # Fallback if invalid
-
-    # ✅ Define words per page
-    MAX_WORDS_PER_PAGE = 200
-
-    # ✅ Paginate description
-    description_pages = split_description_into_pages(minute.description, MAX_WORDS_PER_PAGE)
-    total_pages = len(description_pages)
-
-    # ✅ Ensure page is within range
-    page = max(1, min(page, total_pages))
-
-    # ✅ Get content for current page
-    current_description = description_pages[page - 1] if description_pages else "No content available."
-
-    # ✅ Fetch Approval Chain & Approvers
-    approvers_status = []
-    if approval_chain:
-        for approver in approval_chain.approvers.order_by('order'):
-            approval_entry = MinuteApproval.objects.filter(minute=minute, approver=approver.user).first()
-            approvers_status.append({
+    # ✅ Fetch Approval Chain & Approvers, only when the cached sheet misses
+    def approvers_status():
+        if not approval_chain:
+            return []
+        approvals = {approval.approver_id: approval for approval in minute.approvals.all()}
+        entries = []
+        for approver in approval_chain.approvers.select_related('user').order_by('order'):
+            approval_entry = approvals.get(approver.user_id)
+            entries.append({
                 'approver': approver.user.get_full_name(),
                 'status': approval_entry.status if approval_entry else 'Pending',
                 'action_time': approval_entry.action_time.strftime(
@@ -470,29 +441,49 @@ def preview_minute_sheet(request, minute_id):
                 'remarks': approval_entry.remarks if approval_entry else "No remarks provided",
                 'is_current': approval_entry and approval_entry.current_approver,
             })
+        return entries
 
     return render(request, 'minute/minute_sheet.html', {
         'minute': minute,
         'approval_chain': approval_chain,
-        'approvers_status': approvers_status,
-        'current_description': current_description,
-        'total_pages': total_pages,
-        'current_page': page,
+        'approvers_status': SimpleLazyObject(approvers_status),
+        **description_page_context(request, minute),
     })
 
 
-
-def split_description_into_pages(description, words_per_page=200):
+def description_page_context(request, minute):
     """
-    Automatically splits long descriptions into multiple pages, keeping sentences intact.
+    The page of the description requested with ?page=, clamped to the existing pages.
+    Pages are sliced from the offsets stored on the minute (see Minute.save).
     """
-    if not description or not isinstance(description, str):
-        return ["No description available."]
+    pages = minute.description_pages
+    total_pages = max(len(pages), 1)
 
-    words = description.split()
-    pages = [" ".join(words[i:i + words_per_page]) for i in range(0, len(words), words_per_page)]
+    try:
+        current_page = int(request.GET.get("page", 1))
+    except ValueError:
+        current_page = 1
+    current_page = max(1, min(current_page, total_pages))
 
-    return pages
+    return {
+        'current_description': pages.page(current_page) if pages else "No description available.",
+        'current_page': current_page,
+        'total_pages': total_pages,
+    }
+
+
+class MinuteDescriptionPagesView(LoginRequiredMixin, View):
+    """
+    API View returning every page of a minute's description, for paging without reloads.
+    """
+    def get(self, request, minute_id, *args, **kwargs):
+        minute = minute_or_404(minute_id, fields=('id', 'description', 'description_page_offsets'))
+        pages = list(minute.description_pages)
+        return JsonResponse({
+            "minute": minute.pk,
+            "total_pages": len(pages),
+            "pages": pages,
+        })
 
 
 class GenerateMinutePDFView(View):
@@ -500,21 +491,17 @@ class GenerateMinutePDFView(View):
     Generates a PDF of the minute sheet with proper formatting.
     """
     def get(self, request, minute_id, *args, **kwargs):
-        minute = get_object_or_404(Minute, id=minute_id)
+        minute = minute_or_404(minute_id)
 
         # ✅ Fetch approval chain (Static for PDF)
-        approvals = MinuteApproval.objects.filter(minute=minute).order_by('order')
+        approvals = minute.approvals.select_related('approver').order_by('order')
         approval_chain_text = " ---> ".join([
             f"{approval.approver.get_full_name()} ({approval.status})"
             for approval in approvals
         ])
 
-        # ✅ Paginate description properly
-        MAX_WORDS_PER_PAGE = 200  # Ensure it matches the Track/Preview logic
-        description_pages = split_description_into_pages(minute.description, MAX_WORDS_PER_PAGE)
-
         # ✅ Merge all description pages for the PDF (no Next/Prev needed)
-        full_description = "\n\n".join(description_pages)  # Ensure smooth merging
+        full_description = "\n\n".join(minute.description_pages) or "No description available."
 
         # ✅ Render template with full description (No Pagination)
         template = get_template("minute/minute_pdf_template.html")  # ✅ Use a separate template for PDFs
@@ -537,8 +524,9 @@ class GenerateMinutePDFView(View):
         }
 
         # ✅ Generate PDF
-        pdf = pdfkit.from_string(html_content, False, options=pdf_options,
-                                 configuration=pdfkit.configuration(wkhtmltopdf=settings.WKHTMLTOPDF_PATH))
+        with timed('pdf'):
+            pdf = pdfkit.from_string(html_content, False, options=pdf_options,
+                                     configuration=pdfkit.configuration(wkhtmltopdf=settings.WKHTMLTOPDF_PATH))
 
         # ✅ Return as a downloadable file
         response = HttpResponse(pdf, content_type='application/pdf')
@@ -1,5 +1,6 @@
 from channels.generic.websocket import AsyncWebsocketConsumer
 import json
+from utils.tracing import continued_trace, with_trace
 
 class NotificationConsumer(AsyncWebsocketConsumer):
     async def connect(self):
@@ -20,16 +21,20 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         data = json.loads(text_data)
         message = data.get('message', '')
 
-        await self.channel_layer.group_send(
-            self.group_name,
-            {
-                'type': 'send_notification',
-                'message': message,
-            }
-        )
+        # Each WebSocket message starts a trace, unless the client sends one along
+        with continued_trace({'traceparent': data.get('traceparent', '')}, 'websocket'):
+            await self.channel_layer.group_send(
+                self.group_name,
+                with_trace({
+                    'type': 'send_notification',
+                    'message': message,
+                })
+            )
 
     async def send_notification(self, event):
         message = event['message']
-        await self.send(text_data=json.dumps({
-            'message': message,
-        }))
+        with continued_trace(event.get('trace'), 'channel_layer') as trace_id:
+            await self.send(text_data=json.dumps({
+                'message': message,
+                'trace_id': trace_id,
+            }))
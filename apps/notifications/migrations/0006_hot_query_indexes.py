@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-19 12:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0005_alter_notification_options_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "is_read"], name="notification_user_read_idx"
+            ),
+        ),
+    ]
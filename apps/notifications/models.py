@@ -1,4 +1,5 @@
-from django.db import models
+from django.apps import apps
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.utils.timezone import now, timedelta
 
@@ -53,11 +54,27 @@ class Notification(models.Model):
     def save(self, *args, **kwargs):
         """
         Override the save method to ensure notifications have a default expiry of 7 days
-        if not explicitly set.
+        if not explicitly set, and append the change to the recipient's change feed.
         """
         if not self.expires_at:
             self.expires_at = now() + timedelta(days=7)  # Default expiry: 7 days
         super().save(*args, **kwargs)
+        Notification.record_changes(self.user_id, [self.pk])
+
+    @classmethod
+    @transaction.atomic
+    def mark_all_read(cls, user):
+        """
+        Mark every unread notification of the user as read in one update.
+        """
+        unread = list(cls.objects.filter(user=user, is_read=False).values_list('pk', flat=True))
+        cls.objects.filter(pk__in=unread).update(is_read=True)
+        cls.record_changes(user.pk, unread)
+
+    @classmethod
+    def record_changes(cls, user_id, notification_ids):
+        ChangeEvent = apps.get_model('api', 'ChangeEvent')
+        ChangeEvent.record('notification', notification_ids, user_id=user_id)
 
     def __str__(self):
         return f"{self.title} ({self.type}) - {self.user.username}"
@@ -66,3 +83,6 @@ class Notification(models.Model):
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
         ordering = ['-created_at']  # Ensures notifications are ordered by the newest first
+        indexes = [
+            models.Index(fields=['user', 'is_read'], name='notification_user_read_idx'),
+        ]
@@ -38,5 +38,5 @@ class MarkAllNotificationsAsReadView(LoginRequiredMixin, View):
     Mark all notifications for the logged-in user as read via AJAX.
     """
     def post(self, request, *args, **kwargs):
-        Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+        Notification.mark_all_read(request.user)
         return JsonResponse({'success': True, 'message': 'All notifications marked as read.'})
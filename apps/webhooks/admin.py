@@ -0,0 +1,30 @@
+from django.contrib import admin
+from .models import WebhookDeadLetter, WebhookDelivery, WebhookEndpoint
+
+
+@admin.register(WebhookEndpoint)
+class WebhookEndpointAdmin(admin.ModelAdmin):
+    list_display = ('name', 'url', 'department', 'event_types', 'is_active', 'created_at')
+    list_filter = ('is_active', 'department')
+    search_fields = ('name', 'url')
+
+
+@admin.register(WebhookDelivery)
+class WebhookDeliveryAdmin(admin.ModelAdmin):
+    list_display = ('event', 'endpoint', 'created_at', 'attempts', 'next_attempt_at', 'last_error')
+    list_filter = ('event', 'endpoint')
+    list_select_related = ('endpoint',)
+    readonly_fields = ('endpoint', 'event', 'payload', 'created_at', 'attempts', 'last_error')
+
+
+@admin.register(WebhookDeadLetter)
+class WebhookDeadLetterAdmin(admin.ModelAdmin):
+    list_display = ('event', 'endpoint', 'created_at', 'attempts', 'failed_at', 'last_error')
+    list_filter = ('event', 'endpoint')
+    list_select_related = ('endpoint',)
+    actions = ['requeue']
+
+    @admin.action(description="Queue the selected events again")
+    def requeue(self, request, queryset):
+        count = WebhookDeadLetter.requeue(queryset)
+        self.message_user(request, f"{count} events queued again.")
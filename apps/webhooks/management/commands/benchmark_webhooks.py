@@ -0,0 +1,57 @@
+import json
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+
+from apps.webhooks.models import WebhookDelivery, WebhookEndpoint, generate_secret
+from utils.webhook_receiver import WebhookReceiver
+from utils.webhooks import WebhookWorker, webhook_settings
+
+
+class Command(BaseCommand):
+    """
+    Measure webhook delivery throughput against the local stand-in receiver: queue synthetic
+    events for throwaway endpoints, deliver them with one worker and report events per second.
+    The endpoints and their events are deleted afterwards.
+    """
+    help = "Benchmark webhook delivery (batching, signing, pooled connections) against a local receiver."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=5000, help="Events queued per endpoint.")
+        parser.add_argument('--endpoints', type=int, default=2, help="Endpoints the events are spread over.")
+        parser.add_argument(
+            '--batch-size', type=int, default=webhook_settings()['BATCH_SIZE'], help="Events per request."
+        )
+
+    def handle(self, *args, **options):
+        if min(options['events'], options['endpoints'], options['batch_size']) < 1:
+            raise CommandError("--events, --endpoints and --batch-size must be positive.")
+
+        secret = generate_secret()
+        with WebhookReceiver(secret=secret, keep_batches=False) as receiver:
+            endpoints = [
+                WebhookEndpoint.objects.create(name=f"Benchmark {index}", url=receiver.url, secret=secret)
+                for index in range(options['endpoints'])
+            ]
+            try:
+                payload = {'minute_id': 0, 'unique_id': 'DHA/DSU/BENCH/00-0000/0000', 'title': "Benchmark", 'status': 'Approved'}
+                WebhookDelivery.objects.bulk_create([
+                    WebhookDelivery(endpoint=endpoint, event='minute.approved', payload=payload, next_attempt_at=now())
+                    for endpoint in endpoints for _ in range(options['events'])
+                ], batch_size=1000)
+
+                worker = WebhookWorker(BATCH_SIZE=options['batch_size'])
+                started = perf_counter()
+                stats = worker.run_once()
+                seconds = perf_counter() - started
+            finally:
+                WebhookEndpoint.objects.filter(pk__in=[endpoint.pk for endpoint in endpoints]).delete()
+
+        self.stdout.write(json.dumps({
+            **stats,
+            'received': receiver.events,
+            'rejected': receiver.rejected,
+            'seconds': round(seconds, 3),
+            'events_per_second': round(stats['delivered'] / seconds) if seconds else None,
+        }, indent=2))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.webhooks import WebhookWorker, webhook_settings
+
+
+class Command(BaseCommand):
+    """
+    The webhook delivery worker: sends the queued approval and rejection events to the
+    subscribed endpoints, in signed batches, retrying with backoff. Run it as a long-lived
+    process next to the web workers; several can run side by side.
+    """
+    help = "Deliver queued webhook events until interrupted, or once with --once."
+
+    def add_arguments(self, parser):
+        options = webhook_settings()
+        parser.add_argument('--once', action='store_true', help="Send what is due now and exit.")
+        parser.add_argument(
+            '--batch-size', type=int, default=options['BATCH_SIZE'], help="Events per request to one endpoint."
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        worker = WebhookWorker(BATCH_SIZE=options['batch_size'])
+        if options['once']:
+            stats = worker.run_once()
+            self.stdout.write(
+                f"{stats['delivered']} events delivered in {stats['requests']} requests, "
+                f"{stats['failed']} failed, {stats['dead_lettered']} dead-lettered."
+            )
+            return
+        try:
+            worker.run()
+        except KeyboardInterrupt:
+            self.stdout.write("Stopped.")
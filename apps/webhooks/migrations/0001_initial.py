@@ -0,0 +1,226 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:47
+
+import apps.webhooks.models
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("departments", "0003_department_dean"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WebhookEndpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="Name of the receiving system.", max_length=100
+                    ),
+                ),
+                (
+                    "url",
+                    models.URLField(help_text="URL the event batches are POSTed to."),
+                ),
+                (
+                    "secret",
+                    models.CharField(
+                        default=apps.webhooks.models.generate_secret,
+                        help_text="Shared secret the batches are signed with (HMAC-SHA256).",
+                        max_length=128,
+                    ),
+                ),
+                (
+                    "event_types",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text='Event types to send, e.g. ["minute.approved"]; all of them when empty.',
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        default=True,
+                        help_text="Inactive endpoints keep their queue but get nothing.",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "department",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Only send events of this department; all departments when empty.",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="webhook_endpoints",
+                        to="departments.department",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Webhook Endpoint",
+                "verbose_name_plural": "Webhook Endpoints",
+            },
+        ),
+        migrations.CreateModel(
+            name="WebhookDeadLetter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("minute.approved", "Minute approved"),
+                            ("minute.rejected", "Minute rejected"),
+                        ],
+                        help_text="Type of the event.",
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(help_text="The event data sent to the endpoint."),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Timestamp of the event.",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Failed delivery attempts so far."
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, help_text="Why the last attempt failed."
+                    ),
+                ),
+                (
+                    "failed_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When the event was given up on.",
+                    ),
+                ),
+                (
+                    "endpoint",
+                    models.ForeignKey(
+                        help_text="The endpoint the event was meant for.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dead_letters",
+                        to="webhooks.webhookendpoint",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Webhook Dead Letter",
+                "verbose_name_plural": "Webhook Dead Letters",
+            },
+        ),
+        migrations.CreateModel(
+            name="WebhookDelivery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("minute.approved", "Minute approved"),
+                            ("minute.rejected", "Minute rejected"),
+                        ],
+                        help_text="Type of the event.",
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(help_text="The event data sent to the endpoint."),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Timestamp of the event.",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Failed delivery attempts so far."
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, help_text="Why the last attempt failed."
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When the event is due; pushed back after failures and while a worker sends it.",
+                    ),
+                ),
+                (
+                    "endpoint",
+                    models.ForeignKey(
+                        help_text="The endpoint the event goes to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deliveries",
+                        to="webhooks.webhookendpoint",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Webhook Delivery",
+                "verbose_name_plural": "Webhook Deliveries",
+                "indexes": [
+                    models.Index(
+                        fields=["next_attempt_at"], name="webhook_delivery_due_idx"
+                    ),
+                    models.Index(
+                        fields=["endpoint", "next_attempt_at", "id"],
+                        name="webhook_delivery_batch_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,179 @@
+from django.db import models, transaction
+from django.db.models import Q, prefetch_related_objects
+from django.utils.crypto import get_random_string
+from django.utils.timezone import now
+
+from utils.tracing import with_trace
+
+
+def generate_secret():
+    return get_random_string(48)
+
+
+class WebhookEndpoint(models.Model):
+    """
+    A downstream system (registrar, finance, ...) told when minutes are decided.
+    Subscribes to one department or all of them, and to some event types or all of them.
+    """
+    EVENT_CHOICES = [
+        ('minute.approved', 'Minute approved'),
+        ('minute.rejected', 'Minute rejected'),
+    ]
+
+    name = models.CharField(max_length=100, help_text="Name of the receiving system.")
+    url = models.URLField(help_text="URL the event batches are POSTed to.")
+    secret = models.CharField(
+        max_length=128,
+        default=generate_secret,
+        help_text="Shared secret the batches are signed with (HMAC-SHA256)."
+    )
+    department = models.ForeignKey(
+        'departments.Department',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='webhook_endpoints',
+        help_text="Only send events of this department; all departments when empty."
+    )
+    event_types = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Event types to send, e.g. [\"minute.approved\"]; all of them when empty."
+    )
+    is_active = models.BooleanField(default=True, help_text="Inactive endpoints keep their queue but get nothing.")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Webhook Endpoint"
+        verbose_name_plural = "Webhook Endpoints"
+
+    def __str__(self):
+        return f"{self.name} ({self.url})"
+
+    @classmethod
+    def subscribed_to(cls, event, department_ids):
+        """
+        The active endpoints that want the event from any of the departments. The event types
+        are matched in Python: there are few endpoints, and SQLite has no JSON containment lookup.
+        """
+        endpoints = cls.objects.filter(is_active=True).filter(
+            Q(department__isnull=True) | Q(department_id__in=department_ids)
+        )
+        return [endpoint for endpoint in endpoints if not endpoint.event_types or event in endpoint.event_types]
+
+
+class AbstractWebhookEvent(models.Model):
+    """
+    The columns shared by queued deliveries and dead letters.
+    """
+    event = models.CharField(max_length=50, choices=WebhookEndpoint.EVENT_CHOICES, help_text="Type of the event.")
+    payload = models.JSONField(help_text="The event data sent to the endpoint.")
+    created_at = models.DateTimeField(default=now, help_text="Timestamp of the event.")
+    attempts = models.PositiveIntegerField(default=0, help_text="Failed delivery attempts so far.")
+    last_error = models.TextField(blank=True, help_text="Why the last attempt failed.")
+
+    class Meta:
+        abstract = True
+
+
+class WebhookDelivery(AbstractWebhookEvent):
+    """
+    An event waiting to be sent to one endpoint: an outbox row written in the transaction
+    that decided the minute, and deleted once the endpoint acknowledged it (see utils.webhooks).
+    """
+    endpoint = models.ForeignKey(
+        WebhookEndpoint,
+        on_delete=models.CASCADE,
+        related_name='deliveries',
+        help_text="The endpoint the event goes to."
+    )
+    next_attempt_at = models.DateTimeField(
+        default=now,
+        help_text="When the event is due; pushed back after failures and while a worker sends it."
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['next_attempt_at'], name='webhook_delivery_due_idx'),
+            models.Index(fields=['endpoint', 'next_attempt_at', 'id'], name='webhook_delivery_batch_idx'),
+        ]
+        verbose_name = "Webhook Delivery"
+        verbose_name_plural = "Webhook Deliveries"
+
+    def __str__(self):
+        return f"{self.event} to {self.endpoint_id} (attempt {self.attempts + 1})"
+
+    @staticmethod
+    def minute_payload(minute):
+        return {
+            'minute_id': minute.pk,
+            'unique_id': minute.unique_id,
+            'title': minute.title,
+            'status': minute.status,
+            'department': minute.department.code if minute.department_id else None,
+            'archived_at': minute.archived_at.isoformat() if minute.archived_at else None,
+        }
+
+    @classmethod
+    def enqueue(cls, minute, event):
+        """
+        Queue the event for every endpoint subscribed to it, in the caller's transaction,
+        so an event is sent if and only if the decision is committed.
+        """
+        return cls.enqueue_many([minute], event)
+
+    @classmethod
+    def enqueue_many(cls, minutes, event):
+        """
+        Queue the event of each minute for its subscribed endpoints, with one lookup and one insert.
+        The payloads carry the current trace, which the worker continues when it delivers them.
+        """
+        endpoints = WebhookEndpoint.subscribed_to(event, {minute.department_id for minute in minutes})
+        if not endpoints:
+            return 0
+        prefetch_related_objects([minute for minute in minutes if minute.department_id], 'department')
+        deliveries = [
+            cls(endpoint=endpoint, event=event, payload=with_trace(cls.minute_payload(minute)))
+            for minute in minutes
+            for endpoint in endpoints
+            if endpoint.department_id in (None, minute.department_id)
+        ]
+        cls.objects.bulk_create(deliveries)
+        return len(deliveries)
+
+
+class WebhookDeadLetter(AbstractWebhookEvent):
+    """
+    An event given up on after WEBHOOKS['MAX_ATTEMPTS'] failed attempts, kept for inspection and requeueing.
+    """
+    endpoint = models.ForeignKey(
+        WebhookEndpoint,
+        on_delete=models.CASCADE,
+        related_name='dead_letters',
+        help_text="The endpoint the event was meant for."
+    )
+    failed_at = models.DateTimeField(default=now, help_text="When the event was given up on.")
+
+    class Meta:
+        verbose_name = "Webhook Dead Letter"
+        verbose_name_plural = "Webhook Dead Letters"
+
+    def __str__(self):
+        return f"{self.event} to {self.endpoint_id}, failed {self.attempts} times"
+
+    @classmethod
+    @transaction.atomic
+    def requeue(cls, dead_letters):
+        """
+        Queue the given dead letters again with fresh attempts, e.g. once the endpoint is fixed.
+        """
+        dead_letters = list(dead_letters)
+        WebhookDelivery.objects.bulk_create([
+            WebhookDelivery(
+                endpoint_id=letter.endpoint_id, event=letter.event, payload=letter.payload,
+                created_at=letter.created_at, last_error=letter.last_error,
+            )
+            for letter in dead_letters
+        ])
+        cls.objects.filter(pk__in=[letter.pk for letter in dead_letters]).delete()
+        return len(dead_letters)
@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils.timezone import now
+
+from apps.approval_chain.models import ApprovalChain
+from apps.departments.models import Department
+from apps.minute.models import Minute
+from apps.webhooks.models import WebhookDeadLetter, WebhookDelivery, WebhookEndpoint
+from utils.performance import registry
+from utils.structured_logging import bound_log_context
+from utils.webhook_receiver import WebhookReceiver
+from utils.webhooks import WebhookWorker, sign, verify_signature
+
+User = get_user_model()
+
+
+class WebhookDeliveryTest(TestCase):
+    """
+    Test the webhook outbox, the batched signed delivery and the retries, against the local receiver.
+    """
+
+    def setUp(self):
+        self.department = Department.objects.create(name="Computer Science", code="CS")
+        self.other_department = Department.objects.create(name="Physics", code="PH")
+        self.faculty = User.objects.create_user(
+            username='faculty', password='password', role='Faculty', department=self.department
+        )
+        self.receiver = WebhookReceiver().start()
+        self.addCleanup(self.receiver.stop)
+        self.endpoint = WebhookEndpoint.objects.create(name="Registrar", url=self.receiver.url)
+        self.receiver.secret = self.endpoint.secret
+
+    def decide(self, status, department=None):
+        chain = ApprovalChain.objects.create(name=f"Chain {ApprovalChain.objects.count()}", created_by=self.faculty)
+        minute = Minute.objects.create(
+            title="Budget", description="Description", created_by=self.faculty,
+            department=department or self.department, approval_chain=chain, status='Submitted',
+        )
+        minute.archive(status)
+        minute.archive(status)  # the workflow archives twice for some actions
+        return minute
+
+    def test_events_are_queued_for_subscribed_endpoints(self):
+        finance = WebhookEndpoint.objects.create(
+            name="Finance", url=self.receiver.url, department=self.department, event_types=['minute.rejected']
+        )
+        approved = self.decide('Approved')
+        self.decide('Rejected')
+        self.decide('Rejected', department=self.other_department)
+
+        self.assertEqual(
+            sorted(WebhookDelivery.objects.values_list('endpoint__name', 'event', 'payload__department')),
+            [('Finance', 'minute.rejected', 'CS'), ('Registrar', 'minute.approved', 'CS'),
+             ('Registrar', 'minute.rejected', 'CS'), ('Registrar', 'minute.rejected', 'PH')],
+        )
+        self.assertEqual(
+            WebhookDelivery.objects.get(event='minute.approved').payload['unique_id'], approved.unique_id
+        )
+        self.assertEqual(finance.deliveries.count(), 1)
+
+    def test_worker_sends_signed_batches(self):
+        for _ in range(5):
+            self.decide('Approved')
+
+        stats = WebhookWorker(BATCH_SIZE=2).run_once()
+
+        self.assertEqual(stats, {'requests': 3, 'delivered': 5, 'failed': 0, 'dead_lettered': 0})
+        self.assertEqual([len(batch) for batch in self.receiver.batches], [2, 2, 1])
+        self.assertEqual(self.receiver.rejected, 0)
+        self.assertFalse(WebhookDelivery.objects.exists())
+
+        body = b'{"events":[]}'
+        self.assertTrue(verify_signature('secret', body, sign('secret', body, 1000), at=1100))
+        self.assertFalse(verify_signature('other', body, sign('secret', body, 1000), at=1100))
+        self.assertFalse(verify_signature('secret', body, sign('secret', body, 1000), at=2000))
+
+    def test_deliveries_continue_the_trace_of_the_decision(self):
+        with bound_log_context(trace_id="b" * 32):
+            self.decide('Approved')
+        delivery = WebhookDelivery.objects.get()
+        self.assertRegex(delivery.payload['trace']['traceparent'], rf"^00-{'b' * 32}-[0-9a-f]{{16}}-01$")
+
+        WebhookWorker().run_once()
+
+        self.assertNotIn('trace', self.receiver.batches[0][0]['data'])
+        self.assertIn('trace_hops_total{hop="webhook"} 1', registry.render())
+
+    def test_failures_back_off_then_dead_letter(self):
+        self.decide('Approved')
+        worker = WebhookWorker(MAX_ATTEMPTS=2, BACKOFF_SECONDS=60)
+
+        self.receiver.fail_next(2)
+        stats = worker.run_once()
+        delivery = WebhookDelivery.objects.get()
+        self.assertEqual(stats['failed'], 1)
+        self.assertEqual((delivery.attempts, delivery.last_error[:8]), (1, 'HTTP 503'))
+        self.assertGreater(delivery.next_attempt_at, now() + timedelta(seconds=50))
+        self.assertEqual(worker.run_once()['requests'], 0)  # not due yet
+
+        WebhookDelivery.objects.update(next_attempt_at=now())
+        self.assertEqual(worker.run_once()['dead_lettered'], 1)
+        self.assertFalse(WebhookDelivery.objects.exists())
+
+        WebhookDeadLetter.requeue(WebhookDeadLetter.objects.all())
+        self.assertEqual(worker.run_once()['delivered'], 1)
+        self.assertEqual(self.receiver.events, 1)
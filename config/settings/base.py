@@ -16,6 +16,38 @@ DATABASES = {
     'default': env.db('DATABASE_URL', default='sqlite:///db.sqlite3')
 }
 
+# Read replicas, e.g. DATABASE_REPLICA_URLS=sqlite:///db_replica.sqlite3 locally (a copy of db.sqlite3).
+# ReplicaMiddleware serves safe requests to REPLICA_VIEWS from them; tests mirror them to `default`.
+REPLICA_DATABASES = []
+for index, url in enumerate(env.list('DATABASE_REPLICA_URLS', default=[]), start=1):
+    DATABASES[f'replica_{index}'] = {**env.db_url_config(url), 'TEST': {'MIRROR': 'default'}}
+    REPLICA_DATABASES.append(f'replica_{index}')
+DATABASE_ROUTERS = ['utils.db_routing.ReplicaRouter']
+REPLICA_STICKY_SECONDS = 10  # reads stay on the primary this long after a client's write
+REPLICA_VIEWS = [
+    'minute:track',
+    'minute:archive',
+    'minute:approval_status',
+    'minute:description_pages',
+    'approver:department_archive',
+    'approver:approval_tracker',
+    'minute-api-detail',
+    'approval-chain-api-detail',
+    'audit-log-export',
+    'change-feed',
+]
+
+# Local memory per process by default; point CACHE_URL at Redis or Memcached
+# (e.g. rediscache://127.0.0.1:6379/1) to share the cache between workers
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+# Rendered approver tables, minute sheets and action timelines, keyed by Minute.version
+FRAGMENT_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 24 * 60 * 60,
+}
+
 SECRET_KEY = env("SECRET_KEY", default="dummy-secret-key")
 DEBUG = env("DEBUG", default=False)
 ALLOWED_HOSTS = env.list("ALLOWED_HOSTS", default=["127.0.0.1", "localhost"])
@@ -35,6 +67,7 @@ INSTALLED_APPS = [
     "apps.api" ,
     "apps.departments",
     "apps.approver",
+    "apps.webhooks",
     "widget_tweaks",
     "rest_framework",
     'rest_framework_simplejwt',# Django REST Framework
@@ -45,12 +78,18 @@ INSTALLED_APPS = [
 
 # Middleware
 MIDDLEWARE = [
+    "utils.structured_logging.RequestContextMiddleware",  # Request and trace ids for every log record
+    "utils.performance.PerformanceMiddleware",  # Outermost, so it times the whole request
+    "utils.nplusone.NPlusOneMiddleware",  # Only active in DEBUG and tests, see NPLUSONE
+    "utils.slow_queries.SlowQueryMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "utils.db_routing.ReplicaMiddleware",  # Only active with REPLICA_DATABASES
+    "utils.profiling.ProfilingMiddleware",  # After auth, for the staff ?_profile=1 toggle
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     'apps.users.middleware.RoleBasedRedirectMiddleware',
@@ -74,7 +113,7 @@ CHANNEL_LAYERS = {
 # Templates and Static files
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "utils.performance.TimedDjangoTemplates",  # DjangoTemplates reporting render time
         "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -143,16 +182,101 @@ CORS_ALLOWED_ORIGINS = [
 
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 
+TEST_RUNNER = 'utils.test_runner.TestRunner'
+
+# N+1 query detection: on in DEBUG (logs) and in the test suite, where TEST_RUNNER switches it to raise.
+# ALLOWLIST entries are view names or SQL fragments of known, not yet fixed offenders.
+NPLUSONE = {
+    'ENABLED': None,
+    'THRESHOLD': 5,
+    'ACTION': 'log',
+    'ALLOWLIST': [
+        'minute:track',  # chain approvers and approvals loaded per listed minute
+        'minute:track_detail',
+        'admin:approval_chain_approver_changelist',  # ApproverAdmin.get_remarks queries per row
+    ],
+}
+
+# Bearer token for the Prometheus scrape endpoint (/metrics/); staff users can always read it
+METRICS_TOKEN = env("METRICS_TOKEN", default=None)
+
+# On-demand request profiling, off unless PROFILING_DIR is set. A request is profiled when it
+# carries a single-use token from `manage.py profiling_token` in X-Profile-Token, or comes from staff with ?_profile=1.
+# Tokens and MAX_PER_MINUTE are tracked in the default cache, which must be shared (CACHE_URL) with several workers.
+PROFILING = {
+    'DIR': env("PROFILING_DIR", default=None),
+    'MAX_PER_MINUTE': 2,
+}
+
+# Application and slow query logs, one file per process ({pid}) so workers never rotate
+# each other's files; the default logs/ directory is ignored by git
+LOG_DIR = Path(env("LOG_DIR", default=str(BASE_DIR / 'logs')))
+LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+# Statements slower than THRESHOLD_MS are logged with their EXPLAIN plan to LOG_FILE
+# (rotated by the slow_queries handler below) and listed at /admin/slow-queries/
+SLOW_QUERIES = {
+    'THRESHOLD_MS': env.int("SLOW_QUERY_THRESHOLD_MS", default=300),
+    'SAMPLE_RATE': 1.0,
+    'EXPLAIN': True,
+    'LOG_FILE': LOG_DIR / 'slow_queries.{pid}.log',
+}
+
+# Minutes archived longer ago than AFTER_DAYS are moved, with their approvals and action logs,
+# to the cold tables by `manage.py tier_archived_minutes` (run it from cron); reads check both tiers
+ARCHIVE_TIERING = {
+    'AFTER_DAYS': env.int("ARCHIVE_TIERING_AFTER_DAYS", default=365),
+    'BATCH_SIZE': 200,
+}
+
+# Action logs older than KEEP_MONTHS are exported by `manage.py archive_action_logs` (run it monthly)
+# to gzip-compressed NDJSON files in DIR, one per month, and dropped from the database. On PostgreSQL
+# the log is partitioned by month and the command also creates the partitions ahead of time.
+ACTION_LOG_ARCHIVE = {
+    'DIR': env("ACTION_LOG_ARCHIVE_DIR", default=str(BASE_DIR / 'action_log_archive')),
+    'KEEP_MONTHS': 12,
+    'PRECREATE_MONTHS': 3,
+}
+
+# Sync clients read /api/changes/ in batches of BATCH_SIZE changes, or ?limit= up to MAX_BATCH_SIZE
+CHANGE_FEED = {
+    'BATCH_SIZE': 500,
+    'MAX_BATCH_SIZE': 5000,
+}
+
+# Approval and rejection events are queued per subscribed endpoint and sent by
+# `manage.py deliver_webhooks`, in signed batches, retried with exponential backoff
+WEBHOOKS = {
+    'BATCH_SIZE': 100,
+    'MAX_ATTEMPTS': 8,
+    'BACKOFF_SECONDS': 30,
+    'MAX_BACKOFF_SECONDS': 6 * 3600,
+    'TIMEOUT': 10,
+}
+
 # Add the BASE_URL setting
 BASE_URL = 'http://127.0.0.1:8000'
+# Handlers only queue records; a listener thread per process formats them as JSON lines
+# (with the request and trace id) and writes them to size-rotated files
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(message)s'},
+    },
     'handlers': {
+        'slow_queries': {
+            'class': 'utils.structured_logging.QueuedRotatingFileHandler',
+            'filename': SLOW_QUERIES['LOG_FILE'],
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 5,
+            'formatter': 'message',  # the records are JSON lines already
+        },
         'file': {
-            'level': 'WARNING',  # Change DEBUG to WARNING to suppress logs
-            'class': 'logging.FileHandler',
-            'filename': 'django.log',
+            'class': 'utils.structured_logging.QueuedRotatingFileHandler',
+            'filename': LOG_DIR / 'django.{pid}.log',
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 5,
         },
     },
     'loggers': {
@@ -166,6 +290,21 @@ LOGGING = {
             'level': 'WARNING',  # Change from DEBUG to WARNING
             'propagate': False,
         },
+        'apps': {
+            'handlers': ['file'],
+            'level': env("APPS_LOG_LEVEL", default='WARNING'),  # INFO adds the approval workflow trail
+            'propagate': False,
+        },
+        'utils': {
+            'handlers': ['file'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+        'slow_queries': {
+            'handlers': ['slow_queries'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
     },
 }
 
@@ -2,8 +2,11 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from utils.performance import metrics_view
+from utils.slow_queries import slow_queries_admin_view
 
 urlpatterns = [
+    path('admin/slow-queries/', admin.site.admin_view(slow_queries_admin_view), name='slow_queries'),
     path('admin/', admin.site.urls),
 
     # Ensure the root URL serves the landing page from the users app
@@ -17,6 +20,9 @@ urlpatterns = [
     path('api/', include('apps.api.urls')),
     path('departments/', include('apps.departments.urls', namespace='departments')),
     path('approver/', include('apps.approver.urls', namespace='approver')),
+
+    # Prometheus metrics of this worker process
+    path('metrics/', metrics_view, name='metrics'),
 ]
 
 # Serve media files during development
@@ -0,0 +1,315 @@
+# utils/action_log_archive.py
+import gzip
+import json
+import os
+import re
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils.dateparse import parse_datetime
+
+from apps.minute.models import MinuteActionLog
+
+DEFAULTS = {
+    'DIR': settings.BASE_DIR / 'action_log_archive',
+    'KEEP_MONTHS': 12,  # months kept in the database, the current one included
+    'PRECREATE_MONTHS': 3,  # PostgreSQL partitions created ahead of time
+}
+
+# Columns written to the export files, in file order
+COLUMNS = ('id', 'minute_id', 'action', 'performed_by_id', 'target_user_id', 'remarks', 'timestamp', 'trace_id')
+FILE_NAME = re.compile(r'^action_log_(\d{4})-(\d{2})\.ndjson\.gz$')
+
+
+def action_log_archive_settings():
+    return {**DEFAULTS, **getattr(settings, 'ACTION_LOG_ARCHIVE', {})}
+
+
+def month_start(value):
+    """
+    The first instant of the UTC month of a date or datetime. Partitions and export files are UTC months.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def month_logs(month):
+    start = month_start(month)
+    return MinuteActionLog.objects.filter(timestamp__gte=start, timestamp__lt=add_months(start, 1))
+
+
+# PostgreSQL partitions (see migration minute 0020); other backends keep one table and
+# only drop the exported rows, the months being ranges of timestamp_idx.
+
+def partitioned():
+    return connection.vendor == 'postgresql'
+
+
+def partition_name(month):
+    return f"{MinuteActionLog._meta.db_table}_y{month.year:04d}m{month.month:02d}"
+
+
+def default_partition_name():
+    return f"{MinuteActionLog._meta.db_table}_default"
+
+
+def ensure_partitions(first_month, last_month):
+    """
+    Create the monthly partitions from first_month to last_month, both included, that do not exist yet.
+    Rows of months without a partition land in the default partition, so a missing one never fails
+    an insert; PostgreSQL refuses a partition for a month the default one holds rows of, so those
+    rows are moved into the new partition while the default one is detached.
+    """
+    if not partitioned():
+        return []
+    table = MinuteActionLog._meta.db_table
+    default = default_partition_name()
+    created = []
+    month = month_start(first_month)
+    with connection.cursor() as cursor:
+        while month <= month_start(last_month):
+            name = partition_name(month)
+            cursor.execute("SELECT to_regclass(%s)", [name])
+            if cursor.fetchone()[0] is None:
+                bounds = [month, add_months(month, 1)]
+                with transaction.atomic():
+                    cursor.execute(
+                        f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE "timestamp" >= %s AND "timestamp" < %s)',
+                        bounds,
+                    )
+                    stranded = cursor.fetchone()[0]
+                    if stranded:
+                        cursor.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{default}"')
+                    cursor.execute(
+                        f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                        f"FOR VALUES FROM ('{bounds[0].isoformat()}') TO ('{bounds[1].isoformat()}')"
+                    )
+                    if stranded:
+                        cursor.execute(
+                            f'INSERT INTO "{table}" SELECT * FROM "{default}" '
+                            f'WHERE "timestamp" >= %s AND "timestamp" < %s',
+                            bounds,
+                        )
+                        cursor.execute(
+                            f'DELETE FROM "{default}" WHERE "timestamp" >= %s AND "timestamp" < %s', bounds
+                        )
+                        cursor.execute(f'ALTER TABLE "{table}" ATTACH PARTITION "{default}" DEFAULT')
+                created.append(name)
+            month = add_months(month, 1)
+    return created
+
+
+def drop_partition(month):
+    if partitioned():
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS "{partition_name(month)}"')
+
+
+# Export files: one gzip-compressed NDJSON file per month, sorted by (timestamp, id) so the audit export
+# streams them as they are (files from before carry no 'sorted_by' in their index and are by minute),
+# with a sidecar index of the minutes and actions it holds so readers only open the files they need.
+
+def archive_dir():
+    return action_log_archive_settings()['DIR']
+
+
+def export_path(month, directory=None):
+    return os.path.join(directory or archive_dir(), f"action_log_{month:%Y-%m}.ndjson.gz")
+
+
+def index_path(path):
+    return path.replace('.ndjson.gz', '.index.json')
+
+
+# Parsed sidecar indexes by path, with the modification time they were read at
+_indexes = {}
+
+
+def read_index(path):
+    """
+    The sidecar index of an export file with its minutes and actions as sets, parsed once
+    per process and again only when the file changes (a month merged with late entries).
+    """
+    path = index_path(path)
+    modified = os.stat(path).st_mtime_ns
+    cached = _indexes.get(path)
+    if cached is None or cached[0] != modified:
+        with open(path) as file:
+            index = json.load(file)
+        index['minute_ids'] = frozenset(index['minute_ids'])
+        index['actions'] = frozenset(index['actions'])
+        cached = _indexes[path] = (modified, index)
+    return cached[1]
+
+
+def log_record(log):
+    return {
+        **{column: getattr(log, column) for column in COLUMNS},
+        'timestamp': log.timestamp.astimezone(timezone.utc).isoformat(),
+    }
+
+
+def export_month(month, directory=None, batch_size=2000):
+    """
+    Write the action logs of one month to its export file, then delete them from the database
+    (dropping the partition on PostgreSQL). The file is written under a temporary name and renamed
+    before anything is deleted, and only the rows written to it are deleted, so an interrupted
+    export loses nothing. A month exported before is merged with the new rows, e.g. entries that
+    arrived late. Returns the number of entries in the file.
+    """
+    month = month_start(month)
+    directory = directory or archive_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = export_path(month, directory)
+
+    records = {}
+    if os.path.exists(path):
+        records = {record['id']: record for record in ActionLogArchive(directory).read_file(path)}
+    last_pk = None
+    for log in month_logs(month).order_by('pk').iterator(chunk_size=batch_size):
+        records[log.pk] = log_record(log)
+        last_pk = log.pk
+    if last_pk is None:
+        return len(records)
+
+    ordered = sorted(records.values(), key=lambda record: (parse_datetime(record['timestamp']), record['id']))
+    temporary = f"{path}.tmp"
+    with gzip.open(temporary, 'wt', encoding='utf-8') as file:
+        for record in ordered:
+            file.write(json.dumps(record, separators=(',', ':')) + '\n')
+    with open(f"{index_path(path)}.tmp", 'w') as file:
+        json.dump({
+            'month': f"{month:%Y-%m}",
+            'sorted_by': 'timestamp',
+            'entries': len(ordered),
+            'minute_ids': sorted({record['minute_id'] for record in ordered}),
+            'actions': sorted({record['action'] for record in ordered}),
+        }, file)
+    # The index first: it lists a superset of the old file's contents, so readers never skip an entry
+    os.replace(f"{index_path(path)}.tmp", index_path(path))
+    os.replace(temporary, path)
+
+    with transaction.atomic():
+        month_logs(month).filter(pk__lte=last_pk).delete()
+        if not month_logs(month).exists():
+            drop_partition(month)
+    return len(ordered)
+
+
+def exportable_months(keep_months=None):
+    """
+    The months with action logs in the database that are older than the months to keep.
+    """
+    keep_months = action_log_archive_settings()['KEEP_MONTHS'] if keep_months is None else keep_months
+    cutoff = add_months(month_start(datetime.now(timezone.utc)), 1 - keep_months)
+    oldest = MinuteActionLog.objects.filter(timestamp__lt=cutoff).order_by('timestamp').values_list(
+        'timestamp', flat=True
+    ).first()
+    months = []
+    month = month_start(oldest) if oldest else cutoff
+    while month < cutoff:
+        if month_logs(month).exists():
+            months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+class ActionLogArchive:
+    """
+    Read adapter over the exported action logs: the same filters as the live table
+    (per minute, by action, by time) answered from the export files and their indexes.
+    Entries come back as unsaved MinuteActionLog instances with their users attached.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or archive_dir()
+
+    def files(self):
+        """
+        (month, path, index) of every export file, oldest first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        found = []
+        for name in sorted(os.listdir(self.directory)):
+            match = FILE_NAME.match(name)
+            if match:
+                path = os.path.join(self.directory, name)
+                found.append((datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc), path, read_index(path)))
+        return found
+
+    def newest_month(self):
+        """
+        The latest exported month, found from the file names alone, or None.
+        """
+        if not os.path.isdir(self.directory):
+            return None
+        months = [FILE_NAME.match(name) for name in os.listdir(self.directory)]
+        return max(
+            (datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc) for match in months if match),
+            default=None,
+        )
+
+    def read_file(self, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            for line in file:
+                yield json.loads(line)
+
+    def records(self, minute_id=None, action=None, since=None, until=None):
+        """
+        Exported records matching the filters, file by file. Files are skipped by month for time
+        filters and by their index for minute and action filters.
+        """
+        for month, path, index in self.files():
+            if since is not None and add_months(month, 1) <= since:
+                continue
+            if until is not None and month >= until:
+                continue
+            if minute_id is not None and minute_id not in index['minute_ids']:
+                continue
+            if action is not None and action not in index['actions']:
+                continue
+            for record in self.read_file(path):
+                if minute_id is not None and record['minute_id'] != minute_id:
+                    continue
+                timestamp = parse_datetime(record['timestamp'])
+                if action is not None and record['action'] != action:
+                    continue
+                if (since is not None and timestamp < since) or (until is not None and timestamp >= until):
+                    continue
+                yield {**record, 'timestamp': timestamp}
+
+    def entries(self, **filters):
+        """
+        The matching records as MinuteActionLog instances, ordered by timestamp.
+        """
+        logs = [MinuteActionLog(**record) for record in self.records(**filters)]
+        user_ids = {log.performed_by_id for log in logs} | {log.target_user_id for log in logs}
+        users = get_user_model().objects.in_bulk(user_ids - {None})
+        for log in logs:
+            log.performed_by = users.get(log.performed_by_id)
+            log.target_user = users.get(log.target_user_id)
+        return sorted(logs, key=lambda log: (log.timestamp, log.pk))
+
+
+def minute_history(minute):
+    """
+    Every action log entry of a minute, exported or live, oldest first.
+    Works for live and cold minutes alike.
+    """
+    live = minute.action_logs.select_related('performed_by', 'target_user')
+    archive = ActionLogArchive()
+    # A minute created after the newest exported month has no exported entries
+    newest = archive.newest_month()
+    exported = []
+    if newest is not None and minute.created_at < add_months(newest, 1):
+        exported = archive.entries(minute_id=minute.pk)
+    return sorted([*exported, *live], key=lambda log: (log.timestamp, log.pk))
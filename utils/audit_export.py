@@ -0,0 +1,189 @@
+# utils/audit_export.py
+import csv
+import heapq
+import json
+from datetime import datetime, time
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import get_current_timezone, is_naive, make_aware
+
+from apps.departments.models import Department
+from apps.minute.models import ColdMinute, ColdMinuteActionLog, Minute, MinuteActionLog
+from utils.action_log_archive import ActionLogArchive, add_months
+from utils.pagination import decode_cursor, encode_cursor, keyset_seek
+
+DEFAULTS = {
+    'CHUNK_SIZE': 2000,  # rows fetched per round trip, and exported entries enriched per batch
+}
+
+# Columns of an export row, in CSV order; every row ends with the cursor to resume after it
+COLUMNS = (
+    'id', 'timestamp', 'minute_id', 'minute_unique_id', 'action',
+    'performed_by', 'target_user', 'remarks', 'trace_id', 'cursor',
+)
+ORDERING = ('timestamp', 'id')
+FORMATS = ('csv', 'ndjson')
+
+
+def audit_export_settings():
+    return {**DEFAULTS, **getattr(settings, 'AUDIT_EXPORT', {})}
+
+
+def exportable_departments(user):
+    """
+    Departments whose action history the user may export: every department for superusers
+    and auditors (the minute.export_audit_log permission), the ones they head or are dean of otherwise.
+    """
+    if user.is_superuser or user.has_perm('minute.export_audit_log'):
+        return Department.objects.all()
+    return Department.objects.filter(Q(head_of_department=user) | Q(dean=user))
+
+
+def parse_time_bound(value):
+    """
+    A since/until bound given as an ISO date (midnight, current time zone) or datetime.
+    Raises ValueError for anything else.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Not an ISO date or datetime: {value!r}.")
+        moment = datetime.combine(day, time.min)
+    return make_aware(moment, get_current_timezone()) if is_naive(moment) else moment
+
+
+def _database_rows(model, using, department_id, since, until, cursor, chunk_size):
+    """
+    Rows of one action log table, joined with the minute and the users in the query itself.
+    """
+    logs = model.objects.using(using)
+    if department_id is not None:
+        logs = logs.filter(minute__department_id=department_id)
+    if since is not None:
+        logs = logs.filter(timestamp__gte=since)
+    if until is not None:
+        logs = logs.filter(timestamp__lt=until)
+    remarks = model._meta.get_field('remarks')
+    rows = keyset_seek(logs, ORDERING, cursor).values_list(
+        'id', 'timestamp', 'minute_id', 'minute__unique_id', 'action',
+        'performed_by__username', 'target_user__username', 'remarks', 'trace_id',
+    )
+    for row in rows.iterator(chunk_size=chunk_size):
+        row = dict(zip(COLUMNS, row))
+        row['remarks'] = remarks.to_python(row['remarks'])
+        yield row
+
+
+def _exported_rows(using, department_id, since, until, cursor, chunk_size):
+    """
+    Rows of the action log months exported to files (see utils.action_log_archive), in batches
+    looked up against both minute tiers and the users. Month files are sorted by (timestamp, id)
+    and streamed as they are; only files exported before that order, sorted by minute, are
+    re-sorted in memory.
+    """
+    after = decode_cursor(cursor)
+    try:
+        after = (parse_datetime(after[0]), int(after[1])) if after and len(after) == len(ORDERING) else None
+    except (TypeError, ValueError):
+        after = None
+    if after is not None and after[0] is None:
+        after = None
+    archive = ActionLogArchive()
+
+    def in_range(record):
+        timestamp = record['timestamp'] = parse_datetime(record['timestamp'])
+        if (since is not None and timestamp < since) or (until is not None and timestamp >= until):
+            return False
+        return after is None or (timestamp, record['id']) > after
+
+    def in_order():
+        # Months are disjoint and listed in order, so sorting within a month orders the whole stream
+        for month, path, index in archive.files():
+            month_end = add_months(month, 1)
+            if (since is not None and month_end <= since) or (until is not None and month >= until):
+                continue
+            if after is not None and month_end <= after[0]:
+                continue
+            month_records = (record for record in archive.read_file(path) if in_range(record))
+            if index.get('sorted_by') == 'timestamp':
+                yield from month_records
+            else:
+                yield from sorted(month_records, key=lambda record: (record['timestamp'], record['id']))
+
+    records = in_order()
+    users = get_user_model().objects.using(using)
+    while batch := list(islice(records, chunk_size)):
+        minute_ids = {record['minute_id'] for record in batch}
+        minutes = {
+            pk: (unique_id, department)
+            for model in (Minute, ColdMinute)
+            for pk, unique_id, department in model.objects.using(using).filter(pk__in=minute_ids).values_list(
+                'id', 'unique_id', 'department_id'
+            )
+        }
+        user_ids = {record['performed_by_id'] for record in batch} | {record['target_user_id'] for record in batch}
+        usernames = dict(users.filter(pk__in=user_ids - {None}).values_list('id', 'username'))
+        for record in batch:
+            unique_id, department = minutes.get(record['minute_id'], (None, None))
+            if department_id is not None and department != department_id:
+                continue
+            yield {
+                'id': record['id'],
+                'timestamp': record['timestamp'],
+                'minute_id': record['minute_id'],
+                'minute_unique_id': unique_id,
+                'action': record['action'],
+                'performed_by': usernames.get(record['performed_by_id']),
+                'target_user': usernames.get(record['target_user_id']),
+                'remarks': record['remarks'],
+                'trace_id': record['trace_id'],
+            }
+
+
+def audit_rows(department_id=None, since=None, until=None, cursor=None, using='default', chunk_size=None):
+    """
+    The complete action history, oldest first: the live and cold action logs and the exported
+    months, merged by (timestamp, id). Each source is read in chunks, so memory stays flat however
+    many rows are exported. Every row carries the cursor that resumes the export right after it.
+    """
+    chunk_size = chunk_size or audit_export_settings()['CHUNK_SIZE']
+    filters = (using, department_id, since, until, cursor, chunk_size)
+    sources = [
+        _database_rows(MinuteActionLog, *filters),
+        _database_rows(ColdMinuteActionLog, *filters),
+        _exported_rows(*filters),
+    ]
+    for row in heapq.merge(*sources, key=lambda row: (row['timestamp'], row['id'])):
+        row['cursor'] = encode_cursor([row['timestamp'], row['id']])
+        yield row
+
+
+class _Echo:
+    """
+    A file-like object handing back what csv.writer writes, so rows are streamed one by one.
+    """
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(COLUMNS)
+    for row in rows:
+        yield writer.writerow([
+            row['timestamp'].isoformat() if column == 'timestamp' else row[column] for column in COLUMNS
+        ])
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps({**row, 'timestamp': row['timestamp'].isoformat()}, separators=(',', ':')) + '\n'
+
+
+def export_lines(rows, output_format):
+    return csv_lines(rows) if output_format == 'csv' else ndjson_lines(rows)
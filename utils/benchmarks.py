@@ -0,0 +1,326 @@
+# utils/benchmarks.py
+import json
+import logging
+import math
+import tracemalloc
+from dataclasses import dataclass
+from time import perf_counter
+
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.minute.models import Minute
+from apps.approver.models import ApproverCounter
+from utils.compressed_fields import CompressedText
+
+# Metrics compared against the baseline; for all of them, more is worse
+COMPARED_METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'db_ms', 'queries', 'bytes')
+
+# Timing differences below this are scheduler noise, whatever the relative growth
+NOISE_FLOOR_MS = 2.0
+
+# Cases known to be far off the budget of the others. They are held to a budget of their own
+# instead of the baseline, and reported on every run, so they neither fail every comparison
+# nor drown out the regressions of the other views. minute:track renders every in-flight
+# minute unpaginated and queries each chain row by row: on 50k synthetic minutes it took
+# p50 98 s and 115,565 queries per request.
+KNOWN_OUTLIERS = {
+    'minute:track': {'p50_ms': 120_000, 'queries': 150_000},
+}
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    One URL to benchmark. API cases authenticate with a JWT instead of the session.
+    """
+    name: str
+    path: str
+    api: bool = False
+
+
+class QueryTimer:
+    """
+    Database execute wrapper counting queries and the time spent in the database.
+    """
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.seconds += perf_counter() - started
+
+
+def percentile(samples, fraction):
+    """
+    Nearest-rank percentile of a non-empty list of samples.
+    """
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def default_benchmark_user():
+    """
+    The approver with the largest pending inbox, i.e. the most expensive dashboard to render.
+    """
+    counter = ApproverCounter.objects.select_related('user').order_by('-pending', 'user_id').first()
+    return counter.user if counter else None
+
+
+def benchmark_cases(user):
+    """
+    The real URL set, with sample objects picked from the user's own inbox and minutes.
+    Cases whose sample object does not exist for this user are left out.
+    """
+    cases = [
+        BenchmarkCase('minute:track', reverse('minute:track')),
+        BenchmarkCase('minute:archive', reverse('minute:archive')),
+        BenchmarkCase('approver:dashboard', reverse('approver:dashboard')),
+        BenchmarkCase('approver:pending_minutes', reverse('approver:pending_minutes')),
+        BenchmarkCase('approver:department_archive', reverse('approver:department_archive')),
+        BenchmarkCase('approver:approval_tracker', reverse('approver:approval_tracker')),
+    ]
+
+    own_minute = Minute.objects.filter(created_by=user).exclude(status='Draft').order_by('-pk').first()
+    if own_minute:
+        cases.append(BenchmarkCase('minute:track_detail', reverse('minute:track_detail', args=[own_minute.pk])))
+
+    inbox_minute = Minute.inbox_for(user).first() or own_minute
+    if inbox_minute:
+        cases += [
+            BenchmarkCase('minute:approval_status', reverse('minute:approval_status', args=[inbox_minute.pk])),
+            BenchmarkCase('api:minute-detail', reverse('minute-api-detail', args=[inbox_minute.pk]), api=True),
+        ]
+        if inbox_minute.approval_chain_id:
+            cases.append(BenchmarkCase(
+                'api:approval-chain-detail',
+                reverse('approval-chain-api-detail', args=[inbox_minute.approval_chain_id]),
+                api=True,
+            ))
+    return cases
+
+
+def run_benchmarks(user, cases=None, iterations=20, warmup=3):
+    """
+    Drive every case through the Django test client as `user` and report per case:
+    status code, p50/p95/p99 latency, queries, database time and response size per request.
+    """
+    # The test client's default host is not in ALLOWED_HOSTS outside the test runner;
+    # view errors are reported as HTTP 500 rather than aborting the whole run
+    client = Client(SERVER_NAME='localhost', raise_request_exception=False)
+    client.force_login(user)
+    api_headers = {'HTTP_AUTHORIZATION': f"Bearer {RefreshToken.for_user(user).access_token}"}
+
+    results = {}
+    for case in cases or benchmark_cases(user):
+        headers = api_headers if case.api else {}
+        for _ in range(warmup):
+            client.get(case.path, **headers)
+
+        timings = []
+        timer = QueryTimer()
+        with connection.execute_wrapper(timer):
+            for _ in range(iterations):
+                started = perf_counter()
+                response = client.get(case.path, **headers)
+                timings.append((perf_counter() - started) * 1000)
+
+        results[case.name] = {
+            'path': case.path,
+            'status': response.status_code,
+            'p50_ms': round(percentile(timings, 0.50), 2),
+            'p95_ms': round(percentile(timings, 0.95), 2),
+            'p99_ms': round(percentile(timings, 0.99), 2),
+            'db_ms': round(timer.seconds * 1000 / iterations, 2),
+            'queries': timer.queries // iterations,
+            'bytes': len(response.content),
+        }
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25, outliers=KNOWN_OUTLIERS):
+    """
+    List the regressions of `results` against `baseline`.
+    Query counts are a hard budget; timings and sizes may grow by `tolerance` (a fraction),
+    and timings additionally by NOISE_FLOOR_MS. Known outliers are checked against their
+    own budget instead.
+    """
+    regressions = []
+    for name, current in results.items():
+        if current['status'] >= 400:
+            regressions.append(f"{name}: returned HTTP {current['status']}")
+        if name in outliers:
+            regressions += [
+                f"{name}: {metric} {current[metric]} exceeds its outlier budget {budget}"
+                for metric, budget in outliers[name].items() if current[metric] > budget
+            ]
+            continue
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in COMPARED_METRICS:
+            allowed = previous[metric] if metric == 'queries' else previous[metric] * (1 + tolerance)
+            if metric.endswith('_ms'):
+                allowed = max(allowed, previous[metric] + NOISE_FLOOR_MS)
+            if current[metric] > allowed:
+                regressions.append(f"{name}: {metric} {current[metric]} exceeds baseline {previous[metric]}")
+    return regressions
+
+
+def outlier_report(results, outliers=KNOWN_OUTLIERS):
+    """
+    One line per known outlier in `results`: what it measured against its budget.
+    """
+    return [
+        f"{name}: " + ", ".join(f"{metric} {results[name][metric]} (budget {budget})" for metric, budget in budget.items())
+        for name, budget in outliers.items() if name in results
+    ]
+
+
+def load_baseline(path):
+    """
+    Read a baseline written by `save_baseline`; a missing file is an empty baseline.
+    """
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, results):
+    """
+    Store the results as the new baseline.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+
+
+def logging_overhead(handler, records, records_per_request):
+    """
+    Time the caller's side of `records` log calls through `handler`, as the request thread sees it.
+    Returns per-record percentiles in microseconds and the mean cost of one request's records.
+    """
+    logger = logging.Logger('benchmark', logging.INFO)
+    logger.addHandler(handler)
+    samples = []
+    try:
+        for index in range(records):
+            started = perf_counter()
+            logger.info("Approval saved: ID=%s, Status=%s", index, 'Approved', extra={'minute_id': index})
+            samples.append((perf_counter() - started) * 1_000_000)
+        handler.flush()
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    mean = sum(samples) / len(samples)
+    return {
+        'p50_us': round(percentile(samples, 0.50), 1),
+        'p99_us': round(percentile(samples, 0.99), 1),
+        'max_us': round(max(samples), 1),
+        'mean_us': round(mean, 1),
+        'per_request_us': round(mean * records_per_request, 1),
+    }
+
+
+def _value_size(value):
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, memoryview)):
+        return len(value)
+    return len(str(value).encode())
+
+
+def queryset_footprint(queryset):
+    """
+    What loading a queryset costs: the bytes of column data the database sends back,
+    the peak Python memory of building the model instances, and the time taken.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    transfer = sum(_value_size(value) for row in rows for value in row)
+    del rows
+
+    started = perf_counter()
+    instances = list(queryset.all())
+    elapsed = perf_counter() - started
+    del instances
+
+    # Traced separately, tracing slows the load down several times
+    tracemalloc.start()
+    try:
+        instances = list(queryset.all())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'rows': len(instances),
+        'transfer_bytes': transfer,
+        'peak_memory_bytes': peak,
+        'ms': round(elapsed * 1000, 1),
+    }
+
+
+def list_projection_footprint(rows=10000):
+    """
+    Compare loading the newest `rows` archived minutes as whole rows and through
+    the list projection (Minute.for_list) used by the list pages.
+    """
+    archive = Minute.objects.filter(archived=True).select_related('created_by').order_by('-archived_at', '-id')
+    return {
+        'full': queryset_footprint(archive[:rows]),
+        'list': queryset_footprint(Minute.for_list(archive)[:rows]),
+    }
+
+
+def compressed_text_footprint(model, field, limit=5000):
+    """
+    Storage and read cost of a CompressedTextField over up to `limit` rows: the bytes
+    stored against the bytes of the text, the time to decompress one value, and the
+    time to load the rows as instances and read the field.
+    """
+    values = list(
+        model._base_manager.exclude(**{f"{field.attname}__isnull": True})
+        .order_by('pk').values_list(field.attname, flat=True)[:limit]
+    )
+    stored = text = 0
+    samples = []
+    for value in values:
+        if isinstance(value, CompressedText):
+            started = perf_counter()
+            decompressed = value.decompress()
+            samples.append((perf_counter() - started) * 1_000_000)
+            stored += len(value)
+            text += len(decompressed.encode())
+        else:
+            stored += len(value.encode())
+            text += len(value.encode())
+
+    queryset = model._base_manager.only('pk', field.attname).order_by('pk')[:limit]
+    started = perf_counter()
+    for instance in queryset:
+        getattr(instance, field.attname)
+    load_ms = (perf_counter() - started) * 1000
+
+    return {
+        'rows': len(values),
+        'compressed_rows': len(samples),
+        'text_bytes': text,
+        'stored_bytes': stored,
+        'saved': f"{1 - stored / max(text, 1):.0%}",
+        'decompress_p50_us': round(percentile(samples, 0.50), 1) if samples else None,
+        'decompress_p99_us': round(percentile(samples, 0.99), 1) if samples else None,
+        'load_and_read_ms': round(load_ms, 1),
+    }
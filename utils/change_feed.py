@@ -0,0 +1,123 @@
+# utils/change_feed.py
+from django.conf import settings
+from django.db.models import Q
+
+from apps.api.models import ChangeEvent
+from apps.approver.models import MinuteParticipation
+from apps.minute.models import ColdMinute, ColdMinuteApproval, Minute, MinuteApproval
+from apps.notifications.models import Notification
+from utils.pagination import decode_cursor, encode_cursor
+
+DEFAULTS = {
+    'BATCH_SIZE': 500,  # changes per response unless ?limit= asks otherwise
+    'MAX_BATCH_SIZE': 5000,
+}
+
+# The fields sent for each kind of object, the id aside; the models of the live tier come first
+PAYLOADS = {
+    'minute': ((Minute, ColdMinute), (
+        'unique_id', 'title', 'status', 'archived', 'archived_at', 'department_id',
+        'created_by_id', 'current_approver_id', 'version', 'updated_at',
+    )),
+    'approval': ((MinuteApproval, ColdMinuteApproval), (
+        'minute_id', 'approver_id', 'target_user_id', 'status', 'action',
+        'current_approver', 'order', 'action_time', 'updated_at',
+    )),
+    'notification': ((Notification,), (
+        'title', 'message', 'link', 'type', 'is_read', 'created_at', 'expires_at',
+    )),
+}
+
+
+def change_feed_settings():
+    return {**DEFAULTS, **getattr(settings, 'CHANGE_FEED', {})}
+
+
+def parse_since(token):
+    """
+    The sequence number a ?since= cursor resumes after: 0 when there is none,
+    None when the cursor is invalid.
+    """
+    if not token:
+        return 0
+    values = decode_cursor(token)
+    if not values or len(values) != 1 or not isinstance(values[0], int) or values[0] < 0:
+        return None
+    return values[0]
+
+
+def visible_changes(user, using='default'):
+    """
+    The change feed entries the user may see: their notifications, the minutes they created or
+    take part in, in either tier, with their approval records, and deletions addressed to them.
+    Superusers see every minute.
+    """
+    addressed = Q(user_id=user.pk)
+    if user.is_superuser:
+        return ChangeEvent.objects.using(using).filter(addressed | Q(kind__in=('minute', 'approval')))
+    participations = MinuteParticipation.objects.using(using).filter(user=user)
+    return ChangeEvent.objects.using(using).filter(
+        addressed
+        | Q(minute_id__in=Minute.objects.using(using).filter(created_by=user).values('pk'))
+        | Q(minute_id__in=ColdMinute.objects.using(using).filter(created_by=user).values('pk'))
+        | Q(minute_id__in=participations.filter(minute__isnull=False).values('minute_id'))
+        | Q(minute_id__in=participations.filter(cold_minute__isnull=False).values('cold_minute_id'))
+    )
+
+
+def _states(user, kind, object_ids, using):
+    """
+    The current fields of the changed objects of one kind, by id, looked up in both tiers.
+    Objects that no longer exist are missing.
+    """
+    models, fields = PAYLOADS[kind]
+    states = {}
+    for model in models:
+        missing = object_ids - states.keys()
+        if not missing:
+            break
+        rows = model.objects.using(using).filter(pk__in=missing)
+        if model is Notification:
+            rows = rows.filter(user=user)
+        present = [field for field in fields if field in {f.attname for f in model._meta.concrete_fields}]
+        for row in rows.values('pk', *present):
+            states[row.pop('pk')] = {field: row.get(field) for field in fields}
+    return states
+
+
+def read_changes(user, since=0, limit=None, using='default'):
+    """
+    The next batch of changes visible to the user after the sequence number `since`, oldest first.
+    Changes to the same object within the batch collapse into its latest one, which carries the
+    object's current fields, or `deleted` once it is gone. Returns (changes, next cursor, has_more);
+    the next cursor resumes after the last entry read, and equals `since` when nothing changed.
+    """
+    options = change_feed_settings()
+    limit = min(limit or options['BATCH_SIZE'], options['MAX_BATCH_SIZE'])
+    entries = list(
+        visible_changes(user, using).filter(seq__gt=since).order_by('seq')
+        .values_list('seq', 'kind', 'object_id')[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    latest = {}
+    for seq, kind, object_id in entries:
+        latest[kind, object_id] = seq
+    states = {
+        kind: _states(user, kind, {object_id for k, object_id in latest if k == kind}, using)
+        for kind in PAYLOADS
+    }
+
+    changes = []
+    for (kind, object_id), seq in sorted(latest.items(), key=lambda item: item[1]):
+        change = {'seq': seq, 'type': kind, 'id': object_id}
+        state = states[kind].get(object_id)
+        if state is None:
+            change['deleted'] = True
+        else:
+            change['data'] = state
+        changes.append(change)
+
+    next_seq = entries[-1][0] if entries else since
+    return changes, encode_cursor([next_seq]), has_more
@@ -0,0 +1,160 @@
+# utils/compressed_fields.py
+import struct
+import zlib
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.query_utils import DeferredAttribute
+
+DEFAULTS = {
+    'MIN_BYTES': 256,  # shorter texts are stored as plain UTF-8, compression would not pay off
+    'LEVEL': 6,
+}
+
+# Frame: NUL + 'c', the codec, the length of the text in bytes, then the compressed payload.
+# Plain text never starts with NUL, so unframed values are read as UTF-8 as they are.
+HEADER = struct.Struct('>2sBI')
+MAGIC = b'\x00c'
+ZLIB = 1
+
+
+def compressed_text_settings():
+    return {**DEFAULTS, **getattr(settings, 'COMPRESSED_TEXT', {})}
+
+
+class CompressedText(bytes):
+    """
+    A framed value as read from the database, decompressed on first access through the model.
+    """
+    def decompress(self):
+        _, codec, size = HEADER.unpack_from(self)
+        if codec != ZLIB:
+            raise ValueError(f"Unknown compressed text codec {codec}.")
+        return zlib.decompress(self[HEADER.size:], bufsize=max(size, 1)).decode()
+
+
+def compress_text(text, min_bytes=None, level=None):
+    """
+    Encode text for storage: framed zlib when that is smaller, plain UTF-8 otherwise.
+    """
+    options = compressed_text_settings()
+    min_bytes = options['MIN_BYTES'] if min_bytes is None else min_bytes
+    level = options['LEVEL'] if level is None else level
+
+    raw = text.encode()
+    if len(raw) < min_bytes:
+        return raw
+    framed = HEADER.pack(MAGIC, ZLIB, len(raw)) + zlib.compress(raw, level)
+    return framed if len(framed) < len(raw) else raw
+
+
+def stored_value(value):
+    """
+    A column value as the field reads it: compressed frames stay compressed, anything else is text.
+    """
+    if value is None or isinstance(value, str):
+        return value  # rows written before the column held bytes
+    value = bytes(value)
+    if value.startswith(MAGIC):
+        return CompressedText(value)
+    return value.decode()
+
+
+def is_compressed(instance, field_name):
+    """
+    Whether the field still holds the compressed value read from the database,
+    i.e. it was neither read nor assigned since the instance was loaded.
+    """
+    return isinstance(instance.__dict__.get(field_name), CompressedText)
+
+
+class CompressedTextDescriptor(DeferredAttribute):
+    """
+    Decompress the value on first access and keep the text on the instance.
+    """
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, CompressedText):
+            value = instance.__dict__[self.field.attname] = value.decompress()
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+
+class CompressedTextField(models.TextField):
+    """
+    A TextField stored in a binary column, zlib-compressed once it reaches
+    COMPRESSED_TEXT['MIN_BYTES']. Values are decompressed lazily, on first access,
+    and a loaded value that was never read is saved back without recompressing.
+    Database lookups see the stored bytes, so it is meant for text that is displayed, not searched.
+    """
+    descriptor_class = CompressedTextDescriptor
+
+    def get_internal_type(self):
+        return 'BinaryField'
+
+    def from_db_value(self, value, expression, connection):
+        return stored_value(value)
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            value = stored_value(value)
+            return value.decompress() if isinstance(value, CompressedText) else value
+        return super().to_python(value)
+
+    def pre_save(self, model_instance, add):
+        # Read around the descriptor, so an untouched value is not decompressed just to be compressed again
+        if self.attname in model_instance.__dict__:
+            return model_instance.__dict__[self.attname]
+        return super().pre_save(model_instance, add)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is None:
+            return None
+        if not isinstance(value, CompressedText):
+            if not prepared:
+                value = self.get_prep_value(value)
+            value = compress_text(value)
+        return connection.Database.Binary(value)
+
+
+def compressed_fields():
+    """
+    Every (model, field) pair of the project that uses CompressedTextField.
+    """
+    return [
+        (model, field)
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+        if isinstance(field, CompressedTextField)
+    ]
+
+
+def compress_existing(model, field, batch_size=500):
+    """
+    Rewrite the rows whose value is still plain text, in primary key order and one
+    transaction per batch, so the backfill can be interrupted and resumed.
+    Yields (rows scanned, rows compressed) after every batch.
+    """
+    min_bytes = compressed_text_settings()['MIN_BYTES']
+    rows = model._base_manager.exclude(**{f"{field.attname}__isnull": True}).order_by('pk')
+    last_pk = None
+    while True:
+        batch = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+        batch = list(batch.values_list('pk', field.attname)[:batch_size])
+        if not batch:
+            return
+        last_pk = batch[-1][0]
+
+        pending = [
+            model(pk=pk, **{field.attname: value})
+            for pk, value in batch
+            if isinstance(value, str) and len(value.encode()) >= min_bytes
+        ]
+        with transaction.atomic():
+            model._base_manager.bulk_update(pending, [field.attname])
+        yield len(batch), len(pending)
@@ -0,0 +1,95 @@
+# utils/db_routing.py
+import random
+from contextvars import ContextVar
+from time import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+# Cookie marking a client that wrote recently; its reads stay on the primary until it expires
+STICKY_COOKIE = 'db_primary_until'
+
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE', 'REPLAC')
+
+# The replica chosen for the read-only request being handled, if any
+_read_alias = ContextVar('read_alias', default=None)
+
+
+class ReplicaRouter:
+    """
+    Route reads of replica-enabled requests (see ReplicaMiddleware) to the chosen replica.
+    Everything else, all writes and all migrations use the primary `default` database.
+    """
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        pool = {'default', *settings.REPLICA_DATABASES}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.REPLICA_DATABASES
+
+
+class WriteDetector:
+    """
+    Execute wrapper on the primary noting whether the request changed any data.
+    """
+    def __init__(self):
+        self.wrote = False
+
+    def __call__(self, execute, sql, params, many, context):
+        if not self.wrote and sql.lstrip()[:6].upper() in WRITE_STATEMENTS:
+            self.wrote = True
+        return execute(sql, params, many, context)
+
+
+class ReplicaMiddleware:
+    """
+    Serve safe requests to the views in REPLICA_VIEWS from a random replica in
+    REPLICA_DATABASES. A request that writes gets a cookie pinning the client's reads
+    to the primary for REPLICA_STICKY_SECONDS, so users always see their own changes.
+    Only installed when replicas are configured.
+    """
+    def __init__(self, get_response):
+        if not settings.REPLICA_DATABASES:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        detector = WriteDetector()
+        token = _read_alias.set(None)
+        try:
+            with connections['default'].execute_wrapper(detector):
+                response = self.get_response(request)
+        finally:
+            _read_alias.reset(token)
+
+        if detector.wrote:
+            sticky_seconds = settings.REPLICA_STICKY_SECONDS
+            response.set_cookie(
+                STICKY_COOKIE, str(int(time() + sticky_seconds)),
+                max_age=sticky_seconds, httponly=True, samesite='Lax',
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in ('GET', 'HEAD') or request.resolver_match.view_name not in settings.REPLICA_VIEWS:
+            return None
+        if self.pinned_to_primary(request):
+            return None
+        _read_alias.set(random.choice(settings.REPLICA_DATABASES))
+        return None
+
+    def pinned_to_primary(self, request):
+        try:
+            return float(request.COOKIES.get(STICKY_COOKIE, 0)) > time()
+        except ValueError:
+            return False
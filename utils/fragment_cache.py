@@ -0,0 +1,47 @@
+# utils/fragment_cache.py
+from django.conf import settings
+from django.core.cache import caches
+
+from utils.performance import increment
+
+DEFAULTS = {
+    'ALIAS': 'default',
+    'TIMEOUT': 24 * 60 * 60,  # versions make entries stale, the timeout only reclaims memory
+}
+
+
+def fragment_cache_settings():
+    return {**DEFAULTS, **getattr(settings, 'FRAGMENT_CACHE', {})}
+
+
+def fragment_cache():
+    return caches[fragment_cache_settings()['ALIAS']]
+
+
+def fragment_key(name, minute, *vary_on):
+    """
+    Cache key of a fragment of one minute at its current version, e.g. "fragment:approvers:12.1718000000123456:v7".
+    Any workflow transition bumps Minute.version, so stale entries are simply never read again.
+    The creation time tells apart minutes that reuse the id of a deleted one.
+    """
+    suffix = ''.join(f":{value}" for value in vary_on)
+    return f"fragment:{name}:{minute.pk}.{minute.created_at.timestamp() * 1_000_000:.0f}:v{minute.version}{suffix}"
+
+
+def get_fragment(name, minute, *vary_on):
+    html = fragment_cache().get(fragment_key(name, minute, *vary_on))
+    increment('fragment_cache', result='miss' if html is None else 'hit', fragment=name)
+    return html
+
+
+def set_fragment(name, minute, html, *vary_on):
+    fragment_cache().set(fragment_key(name, minute, *vary_on), html, fragment_cache_settings()['TIMEOUT'])
+
+
+def cached_fragment_ids(name, minutes, *vary_on):
+    """
+    The ids of the minutes whose fragment is cached, looked up in one round trip,
+    so views can skip loading the data of rows that will not be rendered.
+    """
+    keys = {fragment_key(name, minute, *vary_on): minute.pk for minute in minutes}
+    return {keys[key] for key in fragment_cache().get_many(keys)}
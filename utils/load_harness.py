@@ -0,0 +1,337 @@
+# utils/load_harness.py
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter, sleep
+
+from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection
+from django.db.models import Count, Exists, F, Max, Min, OuterRef, Q
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.approval_chain.models import Approver
+from apps.minute.models import Minute, MinuteApproval, MinuteActionLog
+from apps.approver.models import ApproverCounter
+from utils.benchmarks import QueryTimer, percentile
+
+User = get_user_model()
+
+ACTION_WEIGHTS = {'approve': 60, 'reject': 15, 'mark-to': 15, 'return-to': 10}
+IN_FLIGHT_STATUSES = ['Submitted', 'Pending', 'Marked', 'Returned']
+
+# Fragments of database errors caused by lock contention, across backends
+LOCK_ERRORS = ('database is locked', 'database table is locked', 'deadlock', 'lock timeout', 'could not serialize')
+
+# Ids listed per violated invariant in the report
+MAX_REPORTED_IDS = 20
+
+
+@dataclass
+class ApprovalTask:
+    """
+    One approver action to submit, possibly several times at once.
+    """
+    approval_id: int
+    minute_id: int
+    approver_id: int
+    action: str
+    target_user_id: int = None
+    order: int = None
+
+
+@dataclass
+class RequestOutcome:
+    endpoint: str
+    action: str
+    outcome: str
+    seconds: float
+    db_seconds: float
+    lock_errors: int
+
+
+class LockAwareTimer(QueryTimer):
+    """
+    Query timer that also counts queries failing on lock contention.
+    """
+    def __init__(self):
+        super().__init__()
+        self.lock_errors = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        try:
+            return super().__call__(execute, sql, params, many, context)
+        except OperationalError as error:
+            if any(fragment in str(error).lower() for fragment in LOCK_ERRORS):
+                self.lock_errors += 1
+            raise
+
+
+class LockWaitMonitor(threading.Thread):
+    """
+    Sample the number of backends waiting on a lock while the load runs (PostgreSQL only).
+    """
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        try:
+            while not self.stopped.is_set():
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT count(*) FROM pg_locks WHERE NOT granted")
+                    self.samples.append(cursor.fetchone()[0])
+                sleep(self.interval)
+        finally:
+            connection.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def plan_round(rng, limit):
+    """
+    Pick up to `limit` minutes waiting on an approver and decide what each approver does.
+    Mark-to targets a user outside the chain, return-to the nearest earlier approver;
+    when neither is possible the approver approves instead.
+    """
+    approvals = (
+        MinuteApproval.objects.filter(current_approver=True, status='Pending', minute__archived=False)
+        .select_related('minute')
+        .order_by('minute_id')[:limit]
+    )
+    user_ids = list(User.objects.filter(is_active=True).values_list('pk', flat=True))
+
+    tasks = []
+    for approval in approvals:
+        action = rng.choices(list(ACTION_WEIGHTS), list(ACTION_WEIGHTS.values()))[0]
+        task = ApprovalTask(approval.pk, approval.minute_id, approval.approver_id, action)
+
+        if action == 'mark-to':
+            members = set(Approver.objects.filter(approval_chain_id=approval.approval_chain_id).values_list(
+                'user_id', flat=True
+            ))
+            candidates = [user_id for user_id in rng.sample(user_ids, min(len(user_ids), 20)) if user_id not in members]
+            if candidates:
+                task.target_user_id, task.order = candidates[0], approval.order + 1
+            else:
+                task.action = 'approve'
+        elif action == 'return-to':
+            previous = (
+                MinuteApproval.objects.filter(minute_id=approval.minute_id, order__lt=approval.order)
+                .exclude(status='Rejected').order_by('-order').values_list('approver_id', flat=True).first()
+            )
+            if previous:
+                task.target_user_id = previous
+            else:
+                task.action = 'approve'
+        tasks.append(task)
+    return tasks
+
+
+class ApprovalLoad:
+    """
+    Submit approval tasks concurrently through the approver view (process_action)
+    and/or the REST API (UpdateMinuteStatusAPIView), one simulated approver per request.
+    """
+    def __init__(self, endpoints=('view', 'api')):
+        self.endpoints = endpoints
+        self.local = threading.local()
+        self.users = {}
+        self.tokens = {}
+        self.lock = threading.Lock()
+
+    def user(self, user_id):
+        with self.lock:
+            if user_id not in self.users:
+                self.users[user_id] = User.objects.get(pk=user_id)
+            return self.users[user_id]
+
+    def client_for(self, user_id):
+        clients = getattr(self.local, 'clients', None)
+        if clients is None:
+            clients = self.local.clients = {}
+        if user_id not in clients:
+            client = Client(SERVER_NAME='localhost', raise_request_exception=False)
+            client.force_login(self.user(user_id))
+            clients[user_id] = client
+        return clients[user_id]
+
+    def token_for(self, user_id):
+        user = self.user(user_id)
+        with self.lock:
+            if user_id not in self.tokens:
+                self.tokens[user_id] = str(RefreshToken.for_user(user).access_token)
+            return self.tokens[user_id]
+
+    def submit(self, task, endpoint):
+        """
+        Send one request for the task and classify its outcome: ok, refused (the workflow
+        declined it, e.g. no longer the current approver) or error (HTTP 5xx).
+        """
+        client = self.client_for(task.approver_id)
+        headers = {'HTTP_AUTHORIZATION': f"Bearer {self.token_for(task.approver_id)}"} if endpoint == 'api' else {}
+        timer = LockAwareTimer()
+        started = perf_counter()
+        with connection.execute_wrapper(timer):
+            if endpoint == 'api':
+                response = client.post(
+                    reverse('minute-status-update', args=[task.minute_id]),
+                    {'action': task.action, 'target_user': task.target_user_id},
+                    content_type='application/json',
+                    **headers,
+                )
+            else:
+                response = client.post(reverse('approver:process_action', args=[task.approval_id]), {
+                    'action': task.action,
+                    'remarks': f"Load test {task.action}",
+                    'target_user_id': task.target_user_id or '',
+                    'order': task.order or '',
+                })
+        elapsed = perf_counter() - started
+
+        if response.status_code >= 500:
+            outcome = 'error'
+        elif endpoint == 'view':
+            # process_action redirects to the tracker on success and back to the details page otherwise
+            success_url = reverse('approver:track_admin_minute', args=[task.minute_id])
+            outcome = 'ok' if response.status_code == 302 and response.url == success_url else 'refused'
+        else:
+            outcome = 'ok' if response.status_code == 200 else 'refused'
+        return RequestOutcome(endpoint, task.action, outcome, elapsed, timer.seconds, timer.lock_errors)
+
+    def run(self, tasks, workers=8, duplicates=2):
+        """
+        Submit every task `duplicates` times (a double click, a retried request) across
+        `workers` threads. With one worker everything runs inline in the calling thread.
+        """
+        jobs = [
+            (task, self.endpoints[(index + copy) % len(self.endpoints)])
+            for index, task in enumerate(tasks) for copy in range(duplicates)
+        ]
+        if workers == 1:
+            return [self.submit(task, endpoint) for task, endpoint in jobs]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda job: self.submit_from_worker(*job), jobs))
+
+    def submit_from_worker(self, task, endpoint):
+        """
+        Submit from a pool thread, which owns its own database connection.
+        """
+        try:
+            return self.submit(task, endpoint)
+        finally:
+            connection.close()
+
+
+def summarize(outcomes, wall_seconds, lock_samples=None):
+    """
+    Throughput, latency percentiles, DB time, outcomes and lock contention of a load run.
+    """
+    latencies = [outcome.seconds * 1000 for outcome in outcomes]
+    summary = {
+        'requests': len(outcomes),
+        'throughput_rps': round(len(outcomes) / wall_seconds, 2) if wall_seconds else 0.0,
+        'outcomes': dict(Counter(outcome.outcome for outcome in outcomes)),
+        'lock_errors': sum(outcome.lock_errors for outcome in outcomes),
+        'db_ms_total': round(sum(outcome.db_seconds for outcome in outcomes) * 1000, 2),
+        'latency_ms': {},
+    }
+    if lock_samples:
+        summary['lock_waiters_max'] = max(lock_samples)
+        summary['lock_waiters_avg'] = round(sum(lock_samples) / len(lock_samples), 2)
+
+    by_action = defaultdict(list)
+    for outcome, latency in zip(outcomes, latencies):
+        by_action[f"{outcome.endpoint} {outcome.action}"].append(latency)
+    for name, samples in sorted(by_action.items()):
+        summary['latency_ms'][name] = {
+            'count': len(samples),
+            'p50': round(percentile(samples, 0.50), 2),
+            'p95': round(percentile(samples, 0.95), 2),
+            'p99': round(percentile(samples, 0.99), 2),
+        }
+    return summary
+
+
+def workflow_invariant_violations():
+    """
+    Check the approval workflow invariants and return {invariant: [offending ids]} for
+    every invariant that does not hold. Ids are minute ids unless noted otherwise.
+
+    - one_current_approval: at most one current MinuteApproval per minute
+    - in_flight_has_current: every in-flight minute has a current MinuteApproval
+    - one_current_chain_approver: at most one current Approver per chain (chain ids)
+    - contiguous_chain_orders / contiguous_approval_orders: orders run 1..n without gaps
+    - approvers_match_approvals: Approver and MinuteApproval agree on who, order, status and current
+    - no_duplicate_decisions: nobody approved or rejected the same minute twice without a return-to
+    - current_pointer_matches: Minute.current_approver matches the pending current approval
+    - counters_match: ApproverCounter equals the live aggregate (user ids)
+    """
+    violations = {}
+
+    def report(name, ids):
+        ids = sorted(set(ids))
+        if ids:
+            violations[name] = ids[:MAX_REPORTED_IDS] + (['...'] if len(ids) > MAX_REPORTED_IDS else [])
+
+    report('one_current_approval', MinuteApproval.objects.filter(current_approver=True).values('minute_id').annotate(
+        total=Count('id')).filter(total__gt=1).values_list('minute_id', flat=True))
+
+    report('in_flight_has_current', Minute.objects.filter(
+        archived=False, status__in=IN_FLIGHT_STATUSES, approval_chain__isnull=False
+    ).exclude(Exists(
+        MinuteApproval.objects.filter(minute=OuterRef('pk'), current_approver=True)
+    )).values_list('pk', flat=True))
+
+    report('one_current_chain_approver', Approver.objects.filter(is_current=True).values('approval_chain_id').annotate(
+        total=Count('id')).filter(total__gt=1).values_list('approval_chain_id', flat=True))
+
+    gaps = ~Q(lowest=1) | ~Q(highest=F('total')) | ~Q(distinct=F('total'))
+    report('contiguous_chain_orders', Approver.objects.filter(
+        approval_chain__linked_minute__isnull=False
+    ).values('approval_chain__linked_minute__id').annotate(
+        lowest=Min('order'), highest=Max('order'), total=Count('id'), distinct=Count('order', distinct=True)
+    ).filter(gaps).values_list('approval_chain__linked_minute__id', flat=True))
+    report('contiguous_approval_orders', MinuteApproval.objects.values('minute_id').annotate(
+        lowest=Min('order'), highest=Max('order'), total=Count('id'), distinct=Count('order', distinct=True)
+    ).filter(gaps).values_list('minute_id', flat=True))
+
+    chain_steps = defaultdict(set)
+    for minute_id, user_id, order, status, current in Approver.objects.filter(
+        approval_chain__linked_minute__isnull=False
+    ).values_list('approval_chain__linked_minute__id', 'user_id', 'order', 'status', 'is_current').iterator():
+        chain_steps[minute_id].add((user_id, order, status, current))
+    approval_steps = defaultdict(set)
+    for minute_id, user_id, order, status, current in MinuteApproval.objects.values_list(
+        'minute_id', 'approver_id', 'order', 'status', 'current_approver'
+    ).iterator():
+        approval_steps[minute_id].add((user_id, order, status, current))
+    report('approvers_match_approvals', [
+        minute_id for minute_id in set(chain_steps) | set(approval_steps)
+        if chain_steps.get(minute_id) != approval_steps.get(minute_id)
+    ])
+
+    returned = MinuteActionLog.objects.filter(minute=OuterRef('minute'), action='return-to')
+    report('no_duplicate_decisions', MinuteActionLog.objects.filter(
+        action__in=['approve', 'reject']
+    ).exclude(Exists(returned)).values('minute_id', 'performed_by_id', 'action').annotate(
+        total=Count('id')).filter(total__gt=1).values_list('minute_id', flat=True))
+
+    expected = dict(MinuteApproval.objects.filter(
+        current_approver=True, status='Pending', minute__archived=False
+    ).values_list('minute_id', 'approver_id'))
+    pointers = dict(Minute.objects.filter(
+        Q(current_approver__isnull=False) | Q(archived=False, status__in=IN_FLIGHT_STATUSES)
+    ).values_list('pk', 'current_approver_id'))
+    report('current_pointer_matches', [
+        minute_id for minute_id, approver_id in pointers.items() if expected.get(minute_id) != approver_id
+    ])
+
+    report('counters_match', ApproverCounter.mismatches())
+    return violations
@@ -0,0 +1,146 @@
+# utils/nplusone.py
+import logging
+import re
+import traceback
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': None,  # None follows settings.DEBUG
+    'THRESHOLD': 5,
+    'ACTION': 'log',  # or 'raise'
+    'ALLOWLIST': [],
+}
+
+# Number of application frames kept in the reported stack
+STACK_DEPTH = 8
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class NPlusOneError(Exception):
+    """
+    Raised when a request repeats the same query shape more often than allowed.
+    """
+
+
+def detector_settings():
+    return {**DEFAULTS, **getattr(settings, 'NPLUSONE', {})}
+
+
+def fingerprint(sql):
+    """
+    Reduce a statement to its shape: literals and IN-lists of any length collapse to one form.
+    """
+    shape = _STRING_LITERAL.sub('?', sql)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = _PLACEHOLDER_LIST.sub('(...)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+def _application_stack():
+    """
+    The innermost application frames of the current stack; library code and the
+    instrumentation in utils/ (execute wrappers, middleware) are left out.
+    """
+    apps_dir = str(settings.BASE_DIR / 'apps')
+    frames = [frame for frame in traceback.extract_stack() if frame.filename.startswith(apps_dir)]
+    return ''.join(traceback.format_list(frames[-STACK_DEPTH:]))
+
+
+class QueryShapeCounter:
+    """
+    Database execute wrapper counting statements per shape, remembering the
+    stack of the first statement that crosses the threshold for each shape.
+    """
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.counts = Counter()
+        self.stacks = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        shape = fingerprint(sql)
+        self.counts[shape] += 1
+        if self.counts[shape] == self.threshold + 1:
+            self.stacks[shape] = _application_stack()
+        return execute(sql, params, many, context)
+
+    def repeated(self, allowlist=(), view_name=None):
+        """
+        The shapes repeated more than the threshold, minus allowlisted ones.
+        An allowlist entry matches a view name exactly or any substring of the shape.
+        """
+        if view_name in allowlist:
+            return {}
+        return {
+            shape: count for shape, count in self.counts.items()
+            if count > self.threshold and not any(entry in shape for entry in allowlist)
+        }
+
+    def report(self, repeated, where):
+        return "\n\n".join(
+            f"N+1 query in {where}: executed {count} times\n  {shape}\n{self.stacks.get(shape, '')}"
+            for shape, count in repeated.items()
+        )
+
+
+@contextmanager
+def detect_n_plus_one(threshold=None, allowlist=None, action=None, where='block'):
+    """
+    Watch the queries run inside the block and log or raise on repeated shapes,
+    e.g. `with detect_n_plus_one(threshold=3, action='raise'):` in a test.
+    """
+    config = detector_settings()
+    counter = QueryShapeCounter(config['THRESHOLD'] if threshold is None else threshold)
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+    _handle(counter, counter.repeated(config['ALLOWLIST'] if allowlist is None else allowlist),
+            action or config['ACTION'], where)
+
+
+def _handle(counter, repeated, action, where):
+    if not repeated:
+        return
+    message = counter.report(repeated, where)
+    if action == 'raise':
+        raise NPlusOneError(message)
+    logger.warning(message)
+
+
+class NPlusOneMiddleware:
+    """
+    Fingerprint the SQL of every request and log or raise when one statement shape
+    repeats more than NPLUSONE['THRESHOLD'] times. Only installed when NPLUSONE['ENABLED']
+    (by default settings.DEBUG) is true.
+    """
+    def __init__(self, get_response):
+        config = detector_settings()
+        enabled = config['ENABLED'] if config['ENABLED'] is not None else settings.DEBUG
+        if not enabled:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.config = config
+
+    def __call__(self, request):
+        counter = QueryShapeCounter(self.config['THRESHOLD'])
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+
+        match = request.resolver_match
+        view_name = match.view_name if match else None
+        repeated = counter.repeated(self.config['ALLOWLIST'], view_name)
+        _handle(counter, repeated, self.config['ACTION'], f"{request.method} {request.path} ({view_name})")
+        return response
@@ -0,0 +1,202 @@
+# utils/pagination.py
+import base64
+import datetime
+import json
+import re
+from functools import cmp_to_key
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class KeysetPage:
+    """
+    A single page of keyset-paginated results.
+    """
+    def __init__(self, items, next_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder keeping the microseconds of datetimes, which it would cut to milliseconds:
+    a cursor has to name the exact row, or the next page skips or repeats rows.
+    """
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values):
+    """
+    Encode the ordering values of the last row into an opaque URL-safe token.
+    """
+    raw = json.dumps(list(values), cls=CursorEncoder)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Decode a cursor produced by `encode_cursor`. Returns None for invalid tokens.
+    """
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return values if isinstance(values, list) else None
+
+
+def _after_cursor(ordering, values):
+    """
+    Build the "row comes after the cursor" condition for the given ordering, e.g.
+    (-archived_at, -id) -> archived_at < a OR (archived_at = a AND id < b).
+    """
+    condition = Q()
+    for position, field in enumerate(ordering):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        clause = Q(**{f"{name}__{lookup}": values[position]})
+        for previous, previous_field in enumerate(ordering[:position]):
+            clause &= Q(**{previous_field.lstrip('-'): values[previous]})
+        condition |= clause
+    return condition
+
+
+def keyset_seek(queryset, ordering, cursor):
+    """
+    Order the queryset and skip the rows up to and including the cursor's row.
+    """
+    model = queryset.model
+    values = decode_cursor(cursor)
+
+    queryset = queryset.order_by(*ordering)
+    if values is not None and len(values) == len(ordering):
+        try:
+            values = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(ordering, values)
+            ]
+        except ValidationError:
+            values = None
+        if values is not None:
+            queryset = queryset.filter(_after_cursor(ordering, values))
+    return queryset
+
+
+def _ordering_values(item, ordering):
+    return [getattr(item, item._meta.get_field(field.lstrip('-')).attname) for field in ordering]
+
+
+def _page(items, ordering, per_page):
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = encode_cursor(_ordering_values(items[-1], ordering))
+    return KeysetPage(items, next_cursor)
+
+
+def keyset_paginate(queryset, ordering, cursor=None, per_page=25):
+    """
+    Paginate a queryset by seeking past the last row of the previous page
+    instead of using OFFSET, so every page is a bounded index range read.
+
+    `ordering` must end with a unique column (usually '-id' or 'id') so that
+    the sort order is total.
+    """
+    return _page(list(keyset_seek(queryset, ordering, cursor)[:per_page + 1]), ordering, per_page)
+
+
+def keyset_paginate_merged(querysets, ordering, cursor=None, per_page=25):
+    """
+    keyset_paginate over several querysets sharing the ordering columns, e.g. the live
+    and the cold tier of a table. Each queryset reads at most one page past the cursor
+    and the rows are merged in order. The ordering must be total across the querysets.
+    """
+    def compare(first, second):
+        for field, a, b in zip(ordering, _ordering_values(first, ordering), _ordering_values(second, ordering)):
+            if a != b:
+                result = -1 if a < b else 1
+                return -result if field.startswith('-') else result
+        return 0
+
+    items = []
+    for queryset in querysets:
+        items.extend(keyset_seek(queryset, ordering, cursor)[:per_page + 1])
+    items.sort(key=cmp_to_key(compare))
+    return _page(items, ordering, per_page)
+
+
+WORD = re.compile(r'\S+')
+# A word closing a sentence, possibly followed by closing quotes or brackets
+SENTENCE_END = re.compile(r'[.!?][\'")\]]*$')
+
+
+def _sentences(text):
+    """
+    The start offsets of the words of each sentence of the text.
+    """
+    sentence = []
+    for word in WORD.finditer(text):
+        sentence.append(word.start())
+        if SENTENCE_END.search(word.group()):
+            yield sentence
+            sentence = []
+    if sentence:
+        yield sentence
+
+
+def text_page_offsets(text, words_per_page):
+    """
+    Character offsets at which the pages of the text start, filling pages with whole
+    sentences of at most words_per_page words. A sentence longer than a page is cut
+    at word boundaries. An empty text has no pages.
+    """
+    offsets = []
+    used = words_per_page  # the first word always opens a page
+    for sentence in _sentences(text or ''):
+        if used + len(sentence) > words_per_page:
+            offsets.extend(sentence[::words_per_page])
+            used = (len(sentence) - 1) % words_per_page + 1
+        else:
+            used += len(sentence)
+    return offsets
+
+
+class TextPages:
+    """
+    The pages of a text, sliced directly from precomputed page start offsets.
+    """
+    def __init__(self, text, offsets):
+        self.text = text or ''
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __iter__(self):
+        return (self.page(number) for number in range(1, len(self) + 1))
+
+    def page(self, number):
+        """
+        The text of the 1-based page number.
+        """
+        if not 1 <= number <= len(self):
+            raise IndexError(f"Page {number} out of range 1-{len(self)}.")
+        end = self.offsets[number] if number < len(self) else None
+        return self.text[self.offsets[number - 1]:end].strip()
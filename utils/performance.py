@@ -0,0 +1,242 @@
+# utils/performance.py
+import hmac
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+from django.template.backends.django import DjangoTemplates, Template
+
+# Upper bounds (seconds) of the request duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Timed phases besides the database, as reported in Server-Timing and the metrics
+PHASES = ('template', 'pdf')
+
+_current_request = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """
+    Timings collected while handling one request.
+    """
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.phases = defaultdict(float)
+
+    def __call__(self, execute, sql, params, many, context):
+        # Database execute wrapper: count and time every query of the request
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_seconds += perf_counter() - started
+
+
+def current_request_metrics():
+    """
+    The metrics of the request being handled in this context, or None outside a request.
+    """
+    return _current_request.get()
+
+
+@contextmanager
+def timed(phase):
+    """
+    Add the time spent in the block to `phase` of the current request, e.g. `with timed('pdf'):`.
+    """
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current_request.get()
+        if metrics is not None:
+            metrics.phases[phase] += perf_counter() - started
+
+
+class TimedTemplate(Template):
+    """
+    Django template whose top-level renders are counted as template time.
+    Included and extended templates render inside it, so nothing is counted twice.
+    """
+    def render(self, context=None, request=None):
+        with timed('template'):
+            return super().render(context, request)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    The Django template backend, returning templates that report their render time.
+    """
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
+
+
+class ViewStats:
+    """
+    Aggregated request metrics of one view and HTTP method.
+    """
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.statuses = defaultdict(int)
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.phases = defaultdict(float)
+
+
+class MetricsRegistry:
+    """
+    In-process aggregate of request metrics per URL name, plus free-form event counters.
+    Each worker process keeps its own registry, so every worker has to be scraped.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.views = defaultdict(ViewStats)
+            self.counters = defaultdict(float)
+
+    def observe(self, view, method, status, seconds, metrics):
+        with self.lock:
+            stats = self.views[(view, method)]
+            stats.count += 1
+            stats.seconds += seconds
+            position = bisect_left(DURATION_BUCKETS, seconds)
+            if position < len(DURATION_BUCKETS):
+                stats.buckets[position] += 1
+            stats.statuses[status] += 1
+            stats.queries += metrics.queries
+            stats.db_seconds += metrics.db_seconds
+            for phase, phase_seconds in metrics.phases.items():
+                stats.phases[phase] += phase_seconds
+
+    def increment(self, name, value=1, **labels):
+        """
+        Add `value` to the event counter `name` with the given labels.
+        """
+        with self.lock:
+            self.counters[(name, tuple(sorted(labels.items())))] += value
+
+    def render(self):
+        """
+        The registry in the Prometheus text exposition format.
+        """
+        with self.lock:
+            views = sorted(self.views.items())
+            counters = sorted(self.counters.items())
+
+        lines = [
+            "# HELP http_request_duration_seconds Request duration per view.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (view, method), stats in views:
+            labels = _labels(view=view, method=method)
+            cumulative = 0
+            for bound, observed in zip(DURATION_BUCKETS, stats.buckets):
+                cumulative += observed
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {stats.seconds:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+        lines += ["# HELP http_responses_total Responses per view and status code.", "# TYPE http_responses_total counter"]
+        for (view, method), stats in views:
+            for status, total in sorted(stats.statuses.items()):
+                lines.append(f"http_responses_total{{{_labels(view=view, method=method, status=status)}}} {total}")
+
+        totals = [
+            ('http_request_db_queries_total', "Database queries issued per view.", lambda stats: stats.queries),
+            ('http_request_db_seconds_total', "Time spent in the database per view.", lambda stats: stats.db_seconds),
+        ] + [
+            (f"http_request_{phase}_seconds_total", f"Time spent in {phase} rendering per view.",
+             lambda stats, phase=phase: stats.phases.get(phase, 0.0))
+            for phase in PHASES
+        ]
+        for name, help_text, value in totals:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for (view, method), stats in views:
+                lines.append(f"{name}{{{_labels(view=view, method=method)}}} {value(stats):g}")
+
+        for name in sorted({name for (name, _), _ in counters}):
+            lines.append(f"# TYPE {name}_total counter")
+            for (counter_name, labels), total in counters:
+                if counter_name == name:
+                    selector = f"{{{_labels(**dict(labels))}}}" if labels else ""
+                    lines.append(f"{name}_total{selector} {total:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+registry = MetricsRegistry()
+increment = registry.increment
+
+
+class PerformanceMiddleware:
+    """
+    Record total time, database queries and time, template time and PDF engine time of
+    every request, report them in the Server-Timing header and aggregate them per URL name.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current_request.set(metrics)
+        started = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        elapsed = perf_counter() - started
+
+        match = request.resolver_match
+        # Unresolved paths share one label so random URLs cannot grow the registry
+        view = match.view_name if match else 'unresolved'
+        registry.observe(view, request.method, response.status_code, elapsed, metrics)
+
+        timings = [
+            f"total;dur={elapsed * 1000:.1f}",
+            f'db;dur={metrics.db_seconds * 1000:.1f};desc="{metrics.queries} queries"',
+        ] + [
+            f"{phase};dur={metrics.phases[phase] * 1000:.1f}" for phase in PHASES if phase in metrics.phases
+        ]
+        response['Server-Timing'] = ", ".join(timings)
+        return response
+
+
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint. Open to staff users and to requests carrying
+    `Authorization: Bearer <METRICS_TOKEN>`.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    authorized = request.user.is_authenticated and request.user.is_staff
+    if token and hmac.compare_digest(request.headers.get('Authorization', '').encode(), f"Bearer {token}".encode()):
+        authorized = True
+    if not authorized:
+        return HttpResponseForbidden()
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,189 @@
+# utils/profiling.py
+import cProfile
+import logging
+import sys
+import threading
+import tracemalloc
+import uuid
+from collections import Counter
+from pathlib import Path
+from time import sleep, time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+DEFAULTS = {
+    'DIR': None,  # None disables profiling
+    'HEADER': 'X-Profile-Token',
+    'QUERY_PARAM': '_profile',  # staff toggle, e.g. ?_profile=1
+    'TOKEN_MAX_AGE': 300,
+    'MAX_PER_MINUTE': 2,
+    'SAMPLE_INTERVAL': 0.005,
+    'TRACEMALLOC_FRAMES': 10,
+    'TOP_ALLOCATIONS': 50,
+}
+
+SIGNING_SALT = 'utils.profiling'
+
+logger = logging.getLogger(__name__)
+
+# One profiled request at a time per process; others run normally
+_busy = threading.Lock()
+
+
+def profiling_settings():
+    return {**DEFAULTS, **getattr(settings, 'PROFILING', {})}
+
+
+def issue_token():
+    """
+    A signed, short-lived token that opts one request into profiling via the header.
+    """
+    return signing.TimestampSigner(salt=SIGNING_SALT).sign(uuid.uuid4().hex)
+
+
+def token_nonce(token, max_age):
+    """
+    The nonce of a token from issue_token() that is correctly signed and not expired, else None.
+    """
+    try:
+        return signing.TimestampSigner(salt=SIGNING_SALT).unsign(token, max_age=max_age)
+    except signing.BadSignature:
+        return None
+
+
+def consume_token(token, max_age):
+    """
+    Accept a token from issue_token() once: its nonce is recorded in the cache until it
+    expires, so a replayed token (e.g. copied from a log) is refused. Only as strong as
+    the cache is shared: with a per-process cache a token replays once per worker.
+    """
+    nonce = token_nonce(token, max_age)
+    return nonce is not None and cache.add(f"profiling:token:{nonce}", True, timeout=max_age)
+
+
+def shared_cache():
+    """
+    Whether the default cache is shared between worker processes, as the single-use
+    tokens and the rate limit need.
+    """
+    return not isinstance(caches['default'], (LocMemCache, DummyCache))
+
+
+def _within_rate_limit(limit):
+    """
+    Allow at most `limit` profiled requests per minute, counted in the cache.
+    """
+    key = f"profiling:{int(time() // 60)}"
+    cache.add(key, 0, timeout=60)
+    try:
+        return cache.incr(key) <= limit
+    except ValueError:
+        return False
+
+
+class StackSampler(threading.Thread):
+    """
+    Sample the stack of one thread at a fixed interval and count collapsed stacks
+    ("outer;inner;innermost"), the input format of flamegraph tools.
+    """
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+            sleep(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+class ProfilingMiddleware:
+    """
+    Profile a single request on demand, when it carries an unused signed token in the
+    PROFILING['HEADER'] header or comes from a staff user with ?_profile=1.
+    Writes <id>.prof (cProfile), <id>.collapsed (sampled stacks) and <id>.alloc.txt
+    (tracemalloc top allocations) to PROFILING['DIR'] and returns the id in X-Profile-Id.
+    Rate limited to PROFILING['MAX_PER_MINUTE'] and to one request at a time per process;
+    the limit and the single use of tokens hold across workers only with a shared cache.
+    A token is spent only by a request that is actually profiled.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if profiling_settings()['DIR'] and not shared_cache():
+            logger.warning(
+                "Profiling is enabled with a per-process cache: tokens can be replayed once per worker "
+                "and MAX_PER_MINUTE applies per worker. Set CACHE_URL to a shared cache."
+            )
+
+    def __call__(self, request):
+        config = profiling_settings()
+        token = request.headers.get(config['HEADER'])
+        if not config['DIR'] or not self.requested(request, config, token):
+            return self.get_response(request)
+        if not _busy.acquire(blocking=False):
+            return self.get_response(request)
+        try:
+            if not _within_rate_limit(config['MAX_PER_MINUTE']):
+                return self.get_response(request)
+            if token and not consume_token(token, config['TOKEN_MAX_AGE']):
+                return self.get_response(request)
+            return self.profile(request, config)
+        finally:
+            _busy.release()
+
+    def requested(self, request, config, token):
+        if token:
+            return token_nonce(token, config['TOKEN_MAX_AGE']) is not None
+        user = getattr(request, 'user', None)
+        return bool(request.GET.get(config['QUERY_PARAM'])) and bool(user and user.is_staff)
+
+    def profile(self, request, config):
+        profile_id = uuid.uuid4().hex[:12]
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(config['TRACEMALLOC_FRAMES'])
+
+        sampler = StackSampler(threading.get_ident(), config['SAMPLE_INTERVAL'])
+        profiler = cProfile.Profile()
+        sampler.start()
+        try:
+            response = profiler.runcall(self.get_response, request)
+        finally:
+            sampler.stop()
+            snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+
+        directory = Path(config['DIR'])
+        directory.mkdir(parents=True, exist_ok=True)
+        view = request.resolver_match.view_name.replace(':', '-') if request.resolver_match else 'unresolved'
+        stem = directory / f"{int(time())}-{view}-{profile_id}"
+
+        profiler.dump_stats(f"{stem}.prof")
+        with open(f"{stem}.collapsed", 'w') as handle:
+            handle.writelines(f"{stack} {count}\n" for stack, count in sampler.stacks.most_common())
+        with open(f"{stem}.alloc.txt", 'w') as handle:
+            handle.write(f"{request.method} {request.get_full_path()}\n")
+            handle.writelines(
+                f"{statistic}\n" for statistic in snapshot.statistics('traceback')[:config['TOP_ALLOCATIONS']]
+            )
+
+        response['X-Profile-Id'] = stem.name
+        return response
@@ -0,0 +1,35 @@
+# utils/query_plans.py
+import re
+
+from django.db import connection
+
+# SQLite: "SCAN minute_minute" (no index), PostgreSQL: "Seq Scan on minute_minute"
+SQLITE_FULL_SCAN = re.compile(r'\bSCAN (?!CONSTANT ROW)(\w+)(?!.*\bUSING\b)')
+POSTGRES_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+
+
+def explain(queryset):
+    """
+    Return the database's plan for the queryset as text.
+    """
+    return queryset.explain()
+
+
+def sequential_scans(plan, vendor=None):
+    """
+    List the tables the plan reads with a full sequential scan.
+    """
+    vendor = vendor or connection.vendor
+    if vendor == 'postgresql':
+        return POSTGRES_SEQ_SCAN.findall(plan)
+    if vendor == 'sqlite':
+        return [match for line in plan.splitlines() for match in SQLITE_FULL_SCAN.findall(line)]
+    return []
+
+
+def analyze_tables():
+    """
+    Refresh planner statistics so plans reflect the seeded data volume.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
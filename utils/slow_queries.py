@@ -0,0 +1,176 @@
+# utils/slow_queries.py
+import hashlib
+import json
+import logging
+import random
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+from django.conf import settings
+from django.contrib import admin
+from django.db import connections, transaction
+from django.shortcuts import render
+
+from utils.nplusone import fingerprint
+
+logger = logging.getLogger('slow_queries')
+
+DEFAULTS = {
+    'THRESHOLD_MS': 300,
+    'SAMPLE_RATE': 1.0,  # share of slow statements that are recorded
+    'EXPLAIN': True,
+    'LOG_FILE': None,  # read by the admin page, may contain {pid}; the LOGGING handler writes it
+}
+
+# Statements safe to EXPLAIN without side effects on every backend
+EXPLAINABLE = ('select', 'with')
+
+
+def slow_query_settings():
+    return {**DEFAULTS, **getattr(settings, 'SLOW_QUERIES', {})}
+
+
+def params_fingerprint(params):
+    """
+    A short hash of the parameters, so repeated calls can be told apart without logging values.
+    """
+    return hashlib.sha1(repr(params).encode()).hexdigest()[:12]
+
+
+def explain_statement(connection, sql, params):
+    """
+    The database's plan for a statement as text, or None when it cannot be explained.
+    """
+    if not sql.lstrip().lower().startswith(EXPLAINABLE):
+        return None
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql, params)
+        rows = cursor.fetchall()
+    # SQLite rows are (id, parent, notused, detail); the others return one text column
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+class SlowQueryRecorder:
+    """
+    Database execute wrapper logging every statement slower than SLOW_QUERIES['THRESHOLD_MS']
+    as one JSON line, with its fingerprint, duration, calling view and EXPLAIN plan.
+    """
+    def __init__(self, connection, where=None, config=None):
+        self.connection = connection
+        self.where = where
+        self.config = config or slow_query_settings()
+        self.explaining = False
+
+    def __call__(self, execute, sql, params, many, context):
+        # The EXPLAIN itself runs through this wrapper; pass it straight on
+        if self.explaining:
+            return execute(sql, params, many, context)
+        started = perf_counter()
+        result = execute(sql, params, many, context)
+        elapsed_ms = (perf_counter() - started) * 1000
+        if elapsed_ms >= self.config['THRESHOLD_MS'] and random.random() < self.config['SAMPLE_RATE']:
+            self.record(sql, params, many, elapsed_ms)
+        return result
+
+    def record(self, sql, params, many, elapsed_ms):
+        plan = None
+        if self.config['EXPLAIN'] and not many:
+            self.explaining = True
+            try:
+                # In a savepoint: on PostgreSQL a failed EXPLAIN would abort the request's transaction
+                with transaction.atomic(using=self.connection.alias):
+                    plan = explain_statement(self.connection, sql, params)
+            except Exception as error:
+                plan = f"EXPLAIN failed: {error}"
+            finally:
+                self.explaining = False
+
+        logger.warning(json.dumps({
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'database': self.connection.alias,
+            'duration_ms': round(elapsed_ms, 2),
+            'fingerprint': fingerprint(sql),
+            'params_fingerprint': params_fingerprint(params),
+            'view': self.where() if callable(self.where) else self.where,
+            'sql': sql,
+            'plan': plan,
+        }))
+
+
+class SlowQueryMiddleware:
+    """
+    Record the slow statements of every request, tagged with the URL name of the view.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = slow_query_settings()
+
+        def where():
+            match = request.resolver_match
+            return match.view_name if match else request.path
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(SlowQueryRecorder(connection, where, config)))
+            return self.get_response(request)
+
+
+def read_slow_queries(path):
+    """
+    Yield the entries of the slow-query log and its rotated backups one line at a time,
+    skipping unparsable lines, so a large log is never held in memory. A `{pid}` in the
+    file name matches the logs of every worker process.
+    """
+    path = Path(path)
+    for log_file in sorted(path.parent.glob(f"{path.name.replace('{pid}', '*')}*")):
+        with open(log_file) as handle:
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def group_by_fingerprint(entries):
+    """
+    Aggregate log entries per statement shape, slowest total time first, while reading them:
+    only one entry per shape, the slowest, is kept to supply the example SQL and plan.
+    """
+    groups = {}
+    for entry in entries:
+        group = groups.setdefault(entry['fingerprint'], {
+            'fingerprint': entry['fingerprint'], 'count': 0, 'total_ms': 0.0,
+            'views': set(), 'last_seen': '', 'slowest': entry,
+        })
+        group['count'] += 1
+        group['total_ms'] += entry['duration_ms']
+        group['views'].add(entry.get('view') or '-')
+        group['last_seen'] = max(group['last_seen'], entry['timestamp'])
+        if entry['duration_ms'] > group['slowest']['duration_ms']:
+            group['slowest'] = entry
+
+    for group in groups.values():
+        group['mean_ms'] = group['total_ms'] / group['count']
+        group['views'] = sorted(group['views'])
+    return sorted(groups.values(), key=lambda group: group['total_ms'], reverse=True)
+
+
+def slow_queries_admin_view(request):
+    """
+    Admin page listing the logged slow statements grouped by fingerprint.
+    Wrapped in admin.site.admin_view in the URLconf, so only staff can reach it.
+    """
+    log_file = slow_query_settings()['LOG_FILE']
+    groups = group_by_fingerprint(read_slow_queries(log_file)) if log_file else []
+    return render(request, 'admin/slow_queries.html', {
+        **admin.site.each_context(request),
+        'title': "Slow queries",
+        'groups': groups,
+        'log_file': log_file,
+        'threshold_ms': slow_query_settings()['THRESHOLD_MS'],
+    })
@@ -0,0 +1,198 @@
+# utils/structured_logging.py
+import atexit
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Identifiers of the request being handled, copied onto every log record
+_log_context = ContextVar('log_context', default={})
+
+# A trustworthy inbound X-Request-ID: short and free of separators
+REQUEST_ID = re.compile(r'^[\w.-]{1,64}$')
+# W3C trace context, e.g. "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+TRACEPARENT = re.compile(r'^[\da-f]{2}-([\da-f]{32})-[\da-f]{16}-[\da-f]{2}$')
+
+# Record attributes that are not user-supplied `extra` fields
+_STANDARD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+def log_context():
+    """
+    The request and trace id of the current context, e.g. {'request_id': ..., 'trace_id': ...}.
+    """
+    return _log_context.get()
+
+
+@contextmanager
+def bound_log_context(**values):
+    """
+    Add `values` to the context of every record logged inside the block.
+    """
+    token = _log_context.set({**_log_context.get(), **values})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: time, level, logger, message, request/trace ids,
+    source location, exception text and any `extra` fields.
+    """
+    def format(self, record):
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'line': record.lineno,
+            'process': record.process,
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler for request threads: stamps the record with the request context,
+    renders message and traceback while they can still be rendered, and drops the
+    record instead of waiting when the queue is full.
+    """
+    dropped = 0  # records lost to a full queue, across all handlers of the process
+
+    def prepare(self, record):
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        for key, value in _log_context.get().items():
+            setattr(record, key, value)
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            NonBlockingQueueHandler.dropped += 1
+
+
+class DrainingQueueListener(QueueListener):
+    """
+    QueueListener whose stop waits for room in a full queue, so every queued record is written.
+    """
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class QueuedRotatingFileHandler(logging.Handler):
+    """
+    Drop-in for a file handler in LOGGING: callers only put records on a bounded queue,
+    and a QueueListener thread formats them and writes them to a size-rotated file.
+    The listener starts on first use in each process, so it survives forking servers.
+    Rotation is not safe across processes; with several workers put `{pid}` in the
+    filename (e.g. django.{pid}.log) so each process writes and rotates its own file.
+    """
+    def __init__(self, filename, maxBytes=10 * 1024 * 1024, backupCount=5, queue_size=10000, level=logging.NOTSET):
+        super().__init__(level)
+        self.filename = str(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.target_formatter = JsonFormatter()
+        self.queue_size = queue_size
+        self.lock_start = threading.Lock()
+        self.pid = None
+        self.target = None
+        self.front = None
+        self.listener = None
+
+    def setFormatter(self, fmt):
+        # The formatter runs in the listener thread, on the file handler
+        super().setFormatter(fmt)
+        self.target_formatter = fmt
+        if self.target:
+            self.target.setFormatter(fmt)
+
+    def start(self):
+        with self.lock_start:
+            if self.pid == os.getpid():
+                return
+            if self.target:
+                self.target.close()
+            filename = self.filename.replace('{pid}', str(os.getpid()))
+            self.target = RotatingFileHandler(filename, maxBytes=self.maxBytes, backupCount=self.backupCount, delay=True)
+            self.target.setFormatter(self.target_formatter)
+            records = queue.Queue(self.queue_size)
+            self.front = NonBlockingQueueHandler(records)
+            self.listener = DrainingQueueListener(records, self.target)
+            self.listener.start()
+            self.pid = os.getpid()
+            atexit.register(self.stop)
+
+    def stop(self):
+        with self.lock_start:
+            if self.listener and self.pid == os.getpid():
+                self.listener.stop()  # writes out what is still queued
+            self.pid = self.listener = None
+
+    def emit(self, record):
+        if self.pid != os.getpid():
+            self.start()
+        self.front.handle(record)
+
+    def flush(self):
+        """
+        Wait until every record queued so far is written.
+        """
+        if self.listener and self.pid == os.getpid():
+            self.listener.stop()
+            self.listener.start()
+        if self.target:
+            self.target.flush()
+
+    def close(self):
+        self.stop()
+        if self.target:
+            self.target.close()
+        super().close()
+
+
+def _inbound_id(value, pattern):
+    match = pattern.match(value or '')
+    return (match.group(1) if match.groups() else match.group(0)) if match else None
+
+
+class RequestContextMiddleware:
+    """
+    Give every request a request id (the inbound X-Request-ID, or a new one) and a trace id
+    (from an inbound W3C traceparent header, or a new one) that all log records of the
+    request carry. The request id is echoed in the X-Request-ID response header.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        context = {
+            'request_id': _inbound_id(request.headers.get('X-Request-ID'), REQUEST_ID) or uuid.uuid4().hex,
+            'trace_id': _inbound_id(request.headers.get('traceparent'), TRACEPARENT) or uuid.uuid4().hex,
+        }
+        with bound_log_context(**context):
+            response = self.get_response(request)
+        response['X-Request-ID'] = context['request_id']
+        return response
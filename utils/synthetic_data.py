@@ -0,0 +1,341 @@
+# utils/synthetic_data.py
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Max
+from django.utils.timezone import now
+
+from apps.departments.models import Department
+from apps.approval_chain.models import ApprovalChain, Approver
+from apps.minute.models import ColdMinute, Minute, MinuteApproval, MinuteActionLog
+from apps.notifications.models import Notification
+from apps.approver.models import ArchiveFacetRollup, MinuteParticipation, ApproverCounter
+from utils.pagination import text_page_offsets
+
+User = get_user_model()
+
+# Share of generated minutes per status, roughly what production looks like:
+# most minutes are decided and archived, a minority is still in flight.
+STATUS_WEIGHTS = {
+    'Draft': 4,
+    'Submitted': 6,
+    'Pending': 8,
+    'Marked': 3,
+    'Returned': 3,
+    'Approved': 56,
+    'Rejected': 20,
+}
+
+SYNTHETIC_CODE_PREFIX = 'SYN'
+
+
+@dataclass
+class DatasetScale:
+    """
+    Size of a generated dataset.
+    """
+    minutes: int = 10000
+    departments: int = 10
+    users_per_department: int = 50
+    max_chain_length: int = 5
+    attachment_ratio: float = 0.3
+    notifications_per_minute: int = 2
+    days: int = 730
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    """
+    Temporarily disable auto_now/auto_now_add on the given models so bulk_create
+    keeps the timestamps we spread over the simulated history.
+    """
+    saved = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                saved.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def synthetic_data_present():
+    """
+    True if a previous run already generated departments in this database.
+    """
+    return Department.objects.filter(code__startswith=SYNTHETIC_CODE_PREFIX).exists()
+
+
+def generate_dataset(scale=None, seed=42, batch_size=2000, password='password', log=None):
+    """
+    Bulk-generate a realistic, deterministic dataset: departments, users with roles,
+    approval chains of varying length, minutes in every status (some with attachments),
+    approvals, action logs and notifications. Derived tables are rebuilt at the end: the
+    participation index chunk by chunk, the archive rollups from aggregates computed by the
+    database, and the counters of the generated users only.
+
+    Every row is written with bulk_create in batches of `batch_size` minutes. The password
+    is hashed once and the hash shared by all generated users, so user creation costs one
+    hasher call instead of one per user. Returns the number of rows created per model.
+    """
+    scale = scale or DatasetScale()
+    rng = random.Random(seed)
+    log = log or (lambda message: None)
+    counts = dict.fromkeys(
+        ['departments', 'users', 'chains', 'approvers', 'minutes', 'approvals', 'action_logs', 'notifications'], 0
+    )
+
+    departments, members = _create_departments_and_users(scale, rng, password)
+    counts['departments'] = len(departments)
+    counts['users'] = sum(len(users) for users in members.values())
+    log(f"Created {counts['departments']} departments and {counts['users']} users.")
+
+    started = now() - timedelta(days=scale.days)
+    history = timedelta(days=scale.days).total_seconds()
+    offsets = sorted(rng.random() * history for _ in range(scale.minutes))
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+    # Ids continue after both tiers, as Minute._get_next_id() does: cold minutes keep theirs
+    next_id = max(model.objects.aggregate(last=Max('pk'))['last'] or 0 for model in (Minute, ColdMinute)) + 1
+
+    with explicit_timestamps(ApprovalChain, Minute, MinuteApproval, MinuteActionLog, Notification):
+        for batch_start in range(0, scale.minutes, batch_size):
+            plans = []
+            for offset in offsets[batch_start:batch_start + batch_size]:
+                department = rng.choice(departments)
+                users = members[department.pk]
+                status = rng.choices(statuses, weights)[0]
+                # Mark-to and return-to need somebody to hand the minute over to
+                shortest = 2 if status in ('Marked', 'Returned') else 1
+                chain_length = min(len(users), rng.randint(shortest, max(shortest, scale.max_chain_length)))
+                plans.append({
+                    'id': next_id,
+                    'department': department,
+                    'creator': rng.choice(users),
+                    'approvers': rng.sample(users, k=chain_length),
+                    'status': status,
+                    'created_at': started + timedelta(seconds=offset),
+                    'attachment': rng.random() < scale.attachment_ratio,
+                    'step_seconds': rng.randint(600, 3 * 86400),
+                })
+                next_id += 1
+
+            with transaction.atomic():
+                batch_counts = _write_batch(plans, scale, rng)
+            for key, value in batch_counts.items():
+                counts[key] += value
+            log(f"Generated {min(batch_start + batch_size, scale.minutes)}/{scale.minutes} minutes.")
+
+    ArchiveFacetRollup.rebuild()
+    MinuteParticipation.rebuild()
+    ApproverCounter.rebuild(user_ids=[user.pk for users in members.values() for user in users])
+    log("Rebuilt archive rollups, participation index and approver counters.")
+    return counts
+
+
+def _create_departments_and_users(scale, rng, password):
+    """
+    Create the departments, their users and assign a head and a dean to each.
+    """
+    departments = Department.objects.bulk_create([
+        Department(
+            name=f"Synthetic Department {index:03d}",
+            code=f"{SYNTHETIC_CODE_PREFIX}{index:03d}",
+            description="Generated for load testing.",
+        )
+        for index in range(scale.departments)
+    ])
+
+    password_hash = make_password(password)
+    users = []
+    for department in departments:
+        for index in range(scale.users_per_department):
+            username = f"{department.code.lower()}_user{index:04d}"
+            users.append(User(
+                username=username,
+                email=f"{username}@example.com",
+                first_name="User",
+                last_name=f"{index:04d}",
+                password=password_hash,
+                role='Admin' if index < 2 or rng.random() < 0.1 else 'Faculty',
+                department=department,
+                designation='Head of Department' if index == 0 else 'Dean' if index == 1 else 'Faculty Member',
+            ))
+    users = User.objects.bulk_create(users, batch_size=1000)
+
+    members = {department.pk: [] for department in departments}
+    for user in users:
+        members[user.department_id].append(user)
+
+    for department in departments:
+        department_users = members[department.pk]
+        department.head_of_department = department_users[0]
+        department.dean = department_users[min(1, len(department_users) - 1)]
+    Department.objects.bulk_update(departments, ['head_of_department', 'dean'])
+    return departments, members
+
+
+def _plan_steps(status, chain_length, rng):
+    """
+    Decide the (status, action, target index) of every step in a chain of the given length
+    for a minute in `status`, and the index of its current approver (None once decided).
+    Mirrors what the workflow leaves behind: a mark-to hands the minute to the next step,
+    a return-to sends it back to the previous approver, who is pending again.
+    """
+    pending = ('Pending', None, None)
+    approved = ('Approved', 'approve', None)
+
+    if status == 'Draft':
+        return [], None
+    if status == 'Submitted':
+        return [pending] * chain_length, 0
+    if status == 'Approved':
+        return [approved] * chain_length, None
+
+    if status == 'Marked':
+        position = rng.randrange(chain_length - 1)
+        acting, current = ('Marked', 'mark-to', position + 1), position + 1
+    elif status == 'Returned':
+        position = rng.randrange(1, chain_length)
+        acting, current = ('Returned', 'return-to', position - 1), position - 1
+    elif status == 'Rejected':
+        position = rng.randrange(chain_length)
+        acting, current = ('Rejected', 'reject', None), None
+    else:
+        position = rng.randrange(chain_length)
+        return [approved] * position + [pending] * (chain_length - position), position
+
+    steps = [approved] * position + [acting] + [pending] * (chain_length - position - 1)
+    if status == 'Returned':
+        # The approver the minute was returned to keeps their earlier action but is pending again
+        steps[current] = ('Pending', 'approve', None)
+    return steps, current
+
+
+def _write_batch(plans, scale, rng):
+    """
+    Write one batch of planned minutes with their chains, approvals, logs and notifications.
+    """
+    chains = ApprovalChain.objects.bulk_create([
+        ApprovalChain(
+            name=f"Synthetic chain {plan['id']}",
+            created_by=plan['creator'],
+            created_at=plan['created_at'],
+            status='Completed' if plan['status'] in ('Approved', 'Rejected') else 'Active',
+        )
+        for plan in plans if plan['status'] != 'Draft'
+    ])
+    chains = iter(chains)
+
+    minutes, approvers, approvals, logs, notifications = [], [], [], [], []
+    for plan in plans:
+        status = plan['status']
+        created_at = plan['created_at']
+        step = timedelta(seconds=plan['step_seconds'])
+        chain = next(chains) if status != 'Draft' else None
+        chain_length = len(plan['approvers'])
+
+        steps, current_index = _plan_steps(status, len(plan['approvers']), rng)
+        acted = [order for order, (_, action, _) in enumerate(steps, start=1) if action]
+        finished = status in ('Approved', 'Rejected')
+        updated_at = created_at + step * max(acted, default=0)
+        current = plan['approvers'][current_index] if current_index is not None else None
+
+        description = f"Generated minute {plan['id']} for load testing. " * rng.randint(1, 20)
+        minute = Minute(
+            id=plan['id'],
+            unique_id=f"DHA/DSU/{plan['department'].code}/{created_at:%m-%Y}/{plan['id']:04d}",
+            title=f"Synthetic minute {plan['id']}",
+            subject=f"Subject of synthetic minute {plan['id']}",
+            description=description,
+            description_page_offsets=text_page_offsets(description, Minute.WORDS_PER_PAGE),
+            excerpt=Minute.make_excerpt(description),
+            attachment=f"minutes/synthetic/minute_{plan['id']}.pdf" if plan['attachment'] else None,
+            department=plan['department'],
+            created_by=plan['creator'],
+            created_at=created_at,
+            updated_at=updated_at,
+            status=status,
+            approval_chain=chain,
+            archived=finished,
+            archived_at=updated_at if finished else None,
+            current_approver=current,
+            current_since=updated_at if current else None,
+        )
+        minutes.append(minute)
+        if not chain:
+            continue
+
+        for order, (user, (approval_status, action, target)) in enumerate(zip(plan['approvers'], steps), start=1):
+            acted_at = created_at + step * order if action else None
+            target_user = plan['approvers'][target] if target is not None else None
+            is_current = order - 1 == current_index
+            remarks = f"{action} by {user.username}" if action else None
+
+            approvers.append(Approver(
+                approval_chain=chain,
+                user=user,
+                order=order,
+                status=approval_status,
+                action_time=acted_at,
+                is_current=is_current,
+            ))
+            approvals.append(MinuteApproval(
+                minute=minute,
+                approval_chain=chain,
+                approver=user,
+                order=order,
+                status=approval_status,
+                action=action,
+                target_user=target_user,
+                action_time=acted_at,
+                remarks=remarks,
+                current_approver=is_current,
+                created_at=created_at,
+                updated_at=acted_at or created_at,
+            ))
+            if action:
+                logs.append(MinuteActionLog(
+                    minute=minute,
+                    action=action,
+                    performed_by=user,
+                    target_user=target_user,
+                    remarks=remarks,
+                    timestamp=acted_at,
+                ))
+
+        recipients = [plan['creator']] + ([current] if current else [])
+        for index in range(scale.notifications_per_minute):
+            notified_at = created_at + step * index
+            notifications.append(Notification(
+                user=recipients[index % len(recipients)],
+                title=f"Minute {plan['id']} {status.lower()}",
+                message=f"Synthetic minute {plan['id']} is {status.lower()}.",
+                type='success' if status == 'Approved' else 'warning' if status == 'Rejected' else 'info',
+                is_read=finished or rng.random() < 0.5,
+                created_at=notified_at,
+                expires_at=notified_at + timedelta(days=7),
+            ))
+
+    Minute.objects.bulk_create(minutes)
+    Approver.objects.bulk_create(approvers, batch_size=1000)
+    MinuteApproval.objects.bulk_create(approvals, batch_size=1000)
+    MinuteActionLog.objects.bulk_create(logs, batch_size=1000)
+    Notification.objects.bulk_create(notifications, batch_size=1000)
+
+    return {
+        'chains': sum(1 for minute in minutes if minute.approval_chain_id),
+        'approvers': len(approvers),
+        'minutes': len(minutes),
+        'approvals': len(approvals),
+        'action_logs': len(logs),
+        'notifications': len(notifications),
+    }
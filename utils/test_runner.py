@@ -0,0 +1,22 @@
+# utils/test_runner.py
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+from utils.nplusone import detector_settings
+
+
+def enable_n_plus_one_detection():
+    """
+    Make every request of the test suite fail on an N+1 query pattern, whatever the settings
+    module says; other runners (e.g. a pytest conftest) call this in their session setup.
+    """
+    settings.NPLUSONE = {**detector_settings(), 'ENABLED': True, 'ACTION': 'raise'}
+
+
+class TestRunner(DiscoverRunner):
+    """
+    The project's test runner: the default one, with the N+1 query detector raising.
+    """
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        enable_n_plus_one_detection()
@@ -0,0 +1,41 @@
+# utils/tiering.py
+from datetime import timedelta
+
+from django.conf import settings
+from django.http import Http404
+from django.utils.timezone import now
+
+from apps.minute.models import ColdMinute, Minute
+
+DEFAULTS = {
+    'AFTER_DAYS': 365,  # minutes archived longer ago than this move to the cold tables
+    'BATCH_SIZE': 200,
+}
+
+
+def archive_tiering_settings():
+    return {**DEFAULTS, **getattr(settings, 'ARCHIVE_TIERING', {})}
+
+
+def move_archived_minutes(after_days=None, batch_size=None):
+    """
+    Move every minute archived more than `after_days` ago to the cold tier, one transaction
+    per batch so the move can be interrupted and resumed. Yields the size of every batch.
+    """
+    options = archive_tiering_settings()
+    after_days = options['AFTER_DAYS'] if after_days is None else after_days
+    batch_size = options['BATCH_SIZE'] if batch_size is None else batch_size
+
+    archived_before = now() - timedelta(days=after_days)
+    while moved := ColdMinute.move_archived(archived_before, batch_size):
+        yield moved
+
+
+def minute_or_404(pk, fields=None):
+    """
+    get_object_or_404 for read-only views of a minute that may have moved to the cold tier.
+    """
+    try:
+        return Minute.in_any_tier(pk, fields)
+    except Minute.DoesNotExist:
+        raise Http404("No minute matches the given query.")
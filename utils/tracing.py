@@ -0,0 +1,57 @@
+# utils/tracing.py
+import logging
+import os
+from contextlib import contextmanager
+from time import time
+
+from utils.performance import increment
+from utils.structured_logging import TRACEPARENT, bound_log_context, log_context
+
+logger = logging.getLogger(__name__)
+
+# Key under which channel-layer messages and job payloads carry the trace
+TRACE_KEY = 'trace'
+
+
+def current_trace_id():
+    """
+    The trace id of the request, WebSocket message or job being handled, or None.
+    """
+    return log_context().get('trace_id')
+
+
+def trace_headers():
+    """
+    The current trace as headers to embed in a message or job payload:
+    a W3C traceparent and the time it was sent, for hop latency.
+    """
+    trace_id = current_trace_id()
+    if not trace_id:
+        return {}
+    return {'traceparent': f"00-{trace_id}-{os.urandom(8).hex()}-01", 'sent_at': time()}
+
+
+def with_trace(message):
+    """
+    A copy of a channel-layer message or job payload carrying the current trace.
+    """
+    return {**message, TRACE_KEY: trace_headers()}
+
+
+@contextmanager
+def continued_trace(headers, hop):
+    """
+    Handle a message or job inside the trace it was sent from (or a new trace when it carries
+    none), recording the time it spent in transit as the latency of `hop`.
+    """
+    headers = headers or {}
+    match = TRACEPARENT.match(headers.get('traceparent', ''))
+    trace_id = match.group(1) if match else os.urandom(16).hex()
+
+    with bound_log_context(trace_id=trace_id, hop=hop):
+        if 'sent_at' in headers:
+            latency = max(0.0, time() - headers['sent_at'])
+            increment('trace_hop_seconds', latency, hop=hop)
+            increment('trace_hops', hop=hop)
+            logger.info("Trace hop %s took %.1f ms", hop, latency * 1000, extra={'latency_ms': latency * 1000})
+        yield trace_id
@@ -0,0 +1,93 @@
+# utils/webhook_receiver.py
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.webhooks import SIGNATURE_HEADER, verify_signature
+
+
+class WebhookReceiver:
+    """
+    A local stand-in for a downstream system, for tests and throughput benchmarks: an HTTP
+    server on a free port of 127.0.0.1, run in a background thread, that takes webhook batches,
+    checks their signature when given the secret and keeps them for inspection. Failures are
+    scripted with fail_next(). Use it as a context manager:
+
+        with WebhookReceiver(secret=endpoint.secret) as receiver:
+            endpoint.url = receiver.url
+            ...
+    """
+
+    def __init__(self, secret=None, keep_batches=True, host='127.0.0.1', port=0):
+        self.secret = secret
+        self.keep_batches = keep_batches
+        self.batches = []
+        self.requests = 0
+        self.events = 0
+        self.rejected = 0
+        self._failures = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, so pooled client connections are reused
+
+            def do_POST(self):
+                status = receiver.receive(self.rfile.read(int(self.headers.get('Content-Length', 0))), self.headers)
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name='webhook-receiver', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def fail_next(self, count=1, status=503):
+        """
+        Answer the next `count` requests with the given error status.
+        """
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def receive(self, body, headers):
+        """
+        Take one request and return the status to answer with.
+        """
+        with self._lock:
+            self.requests += 1
+            if self._failures:
+                return self._failures.pop(0)
+            if self.secret is not None and not verify_signature(self.secret, body, headers.get(SIGNATURE_HEADER)):
+                self.rejected += 1
+                return 401
+            events = json.loads(body)['events']
+            self.events += len(events)
+            if self.keep_batches:
+                self.batches.append(events)
+        return 200
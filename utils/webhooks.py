@@ -0,0 +1,216 @@
+# utils/webhooks.py
+import hashlib
+import hmac
+import json
+import logging
+import random
+import time
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils.timezone import now
+from requests.adapters import HTTPAdapter
+
+from apps.webhooks.models import WebhookDeadLetter, WebhookDelivery, WebhookEndpoint
+from utils.tracing import TRACE_KEY, continued_trace
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'BATCH_SIZE': 100,  # events per request to one endpoint
+    'MAX_ATTEMPTS': 8,  # failed attempts before an event goes to the dead-letter table
+    'BACKOFF_SECONDS': 30,  # wait after the first failure, doubled after every further one
+    'MAX_BACKOFF_SECONDS': 6 * 3600,
+    'TIMEOUT': 10,  # seconds per request
+    'POOL_SIZE': 10,  # connections kept open per host
+    'POLL_INTERVAL': 2,  # seconds the worker sleeps when nothing is due
+}
+
+SIGNATURE_HEADER = 'X-Webhook-Signature'
+SIGNATURE_TOLERANCE = 300  # seconds a signed batch stays acceptable to receivers
+
+
+def webhook_settings():
+    return {**DEFAULTS, **getattr(settings, 'WEBHOOKS', {})}
+
+
+def sign(secret, body, timestamp):
+    """
+    The signature header of a request body: `t=<unix time>,v1=<hex HMAC-SHA256 of "<t>.<body>">`.
+    The timestamp is signed too, so a captured request cannot be replayed later.
+    """
+    digest = hmac.new(secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={digest}"
+
+
+def verify_signature(secret, body, header, tolerance=SIGNATURE_TOLERANCE, at=None):
+    """
+    Whether a signature header was made by `sign` with the secret for this body, recently enough.
+    """
+    try:
+        parts = dict(part.split('=', 1) for part in (header or '').split(','))
+        timestamp = int(parts['t'])
+    except (KeyError, ValueError):
+        return False
+    if abs((at if at is not None else time.time()) - timestamp) > tolerance:
+        return False
+    return hmac.compare_digest(sign(secret, body, timestamp), header)
+
+
+def backoff_delay(attempts, options=None):
+    """
+    The wait before retrying after the given number of failed attempts: exponential, capped,
+    with ±10% jitter so the retries of one outage do not all arrive at once.
+    """
+    options = options or webhook_settings()
+    delay = min(options['BACKOFF_SECONDS'] * 2 ** (attempts - 1), options['MAX_BACKOFF_SECONDS'])
+    return timedelta(seconds=delay * random.uniform(0.9, 1.1))
+
+
+def make_session(pool_size):
+    """
+    A requests session keeping connections to the endpoints alive between batches.
+    Retrying is left to the outbox, so the adapter never retries by itself.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'Content-Type': 'application/json', 'User-Agent': 'minute-sheet-webhooks/1'})
+    return session
+
+
+class WebhookWorker:
+    """
+    Sends the queued webhook deliveries: due events are claimed in batches per endpoint, POSTed
+    as one signed JSON document, and deleted once the endpoint answers 2xx. A failed batch is
+    retried with exponential backoff, and events out of attempts move to the dead-letter table.
+    Several workers can run side by side: a claimed batch is leased by pushing its due time
+    past the request timeout, and a lease left by a crashed worker simply runs out.
+    Delivery is at least once; receivers deduplicate on the event ids.
+    """
+
+    def __init__(self, session=None, **options):
+        self.options = {**webhook_settings(), **options}
+        self.session = session or make_session(self.options['POOL_SIZE'])
+
+    def claim(self, endpoint, at):
+        """
+        Lease the next batch of the endpoint's due events, oldest first.
+        """
+        ids = list(
+            WebhookDelivery.objects.filter(endpoint=endpoint, next_attempt_at__lte=at)
+            .order_by('next_attempt_at', 'id').values_list('id', flat=True)[:self.options['BATCH_SIZE']]
+        )
+        if not ids:
+            return []
+        # The lease end is unique to this claim, so it tells the rows this worker won apart
+        lease_until = now() + timedelta(seconds=2 * self.options['TIMEOUT'], microseconds=random.randrange(1000))
+        WebhookDelivery.objects.filter(pk__in=ids, next_attempt_at__lte=at).update(next_attempt_at=lease_until)
+        return list(WebhookDelivery.objects.filter(pk__in=ids, next_attempt_at=lease_until).order_by('id'))
+
+    def batch_body(self, deliveries):
+        """
+        The JSON document of a batch. The trace stamped on each payload stays with us.
+        """
+        return json.dumps({
+            'events': [
+                {'id': delivery.pk, 'type': delivery.event, 'created_at': delivery.created_at.isoformat(),
+                 'data': {key: value for key, value in delivery.payload.items() if key != TRACE_KEY}}
+                for delivery in deliveries
+            ],
+        }, separators=(',', ':')).encode()
+
+    def send(self, endpoint, deliveries):
+        """
+        POST one batch. Returns None on success, or why it failed.
+        """
+        body = self.batch_body(deliveries)
+        headers = {SIGNATURE_HEADER: sign(endpoint.secret, body, int(time.time()))}
+        try:
+            response = self.session.post(endpoint.url, data=body, headers=headers, timeout=self.options['TIMEOUT'])
+        except requests.RequestException as error:
+            return f"{type(error).__name__}: {error}"
+        if 200 <= response.status_code < 300:
+            return None
+        return f"HTTP {response.status_code}: {response.text[:200]}"
+
+    @transaction.atomic
+    def fail(self, deliveries, error):
+        """
+        Schedule the retry of a failed batch, or move the events out of attempts to the dead letters.
+        Returns the number of dead letters.
+        """
+        at = now()
+        retry, dead = [], []
+        for delivery in deliveries:
+            delivery.attempts += 1
+            delivery.last_error = error
+            if delivery.attempts >= self.options['MAX_ATTEMPTS']:
+                dead.append(delivery)
+            else:
+                delivery.next_attempt_at = at + backoff_delay(delivery.attempts, self.options)
+                retry.append(delivery)
+        WebhookDelivery.objects.bulk_update(retry, ['attempts', 'last_error', 'next_attempt_at'])
+        WebhookDeadLetter.objects.bulk_create([
+            WebhookDeadLetter(
+                endpoint_id=delivery.endpoint_id, event=delivery.event, payload=delivery.payload,
+                created_at=delivery.created_at, attempts=delivery.attempts, last_error=error,
+            )
+            for delivery in dead
+        ])
+        WebhookDelivery.objects.filter(pk__in=[delivery.pk for delivery in dead]).delete()
+        return len(dead)
+
+    def run_once(self):
+        """
+        Send everything due now, taking the endpoints in turns so a busy one does not hold up
+        the others. An endpoint that failed is left alone until its retries are due.
+        Returns counts of requests, delivered, failed and dead-lettered events.
+        """
+        at = now()
+        stats = {'requests': 0, 'delivered': 0, 'failed': 0, 'dead_lettered': 0}
+        endpoints = list(WebhookEndpoint.objects.filter(is_active=True, deliveries__next_attempt_at__lte=at).distinct())
+        while endpoints:
+            for endpoint in list(endpoints):
+                deliveries = self.claim(endpoint, at)
+                if not deliveries:
+                    endpoints.remove(endpoint)
+                    continue
+                stats['requests'] += 1
+                error = self.send(endpoint, deliveries)
+                if error is None:
+                    WebhookDelivery.objects.filter(pk__in=[delivery.pk for delivery in deliveries]).delete()
+                    self.trace_delivered(endpoint, deliveries)
+                    stats['delivered'] += len(deliveries)
+                    continue
+                logger.warning("Webhook batch to %s failed: %s", endpoint.url, error)
+                stats['failed'] += len(deliveries)
+                stats['dead_lettered'] += self.fail(deliveries, error)
+                endpoints.remove(endpoint)
+        return stats
+
+    def trace_delivered(self, endpoint, deliveries):
+        """
+        Continue the trace of each delivered event, which records the time from the transaction
+        that queued it to its delivery as the latency of the `webhook` hop.
+        """
+        for delivery in deliveries:
+            with continued_trace(delivery.payload.get(TRACE_KEY), 'webhook'):
+                logger.debug("Webhook event %s delivered to %s", delivery.pk, endpoint.url)
+
+    def run(self, stop=None):
+        """
+        Deliver until `stop` (a threading.Event) is set, sleeping POLL_INTERVAL whenever nothing was due.
+        """
+        while stop is None or not stop.is_set():
+            close_old_connections()
+            stats = self.run_once()
+            if stats['requests']:
+                logger.info("Webhook round: %s", stats)
+            elif stop is not None:
+                stop.wait(self.options['POLL_INTERVAL'])
+            else:
+                time.sleep(self.options['POLL_INTERVAL'])